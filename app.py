@@ -2,44 +2,199 @@
 # Flask App — Sign Language Detection via YOLOv11
 # ─────────────────────────────────────────────────────────────
 
-import os
-import sys
-import cv2
+import json
+import time
+import base64
+import psutil
+import multiprocessing as mp
+from concurrent.futures                   import as_completed
 from flask                                import Flask, request, jsonify, render_template, Response
 from flask_cors                           import CORS, cross_origin
-from ultralytics                          import YOLO
 
-from sign_lang.pipeline.training_pipeline import TrainPipeline
-from sign_lang.utils.main_utils           import decodeImage, encodeImageIntoBase64
-from sign_lang.constant.application       import APP_HOST, APP_PORT
+from sign_lang.logger                     import logger
+from sign_lang.utils.main_utils           import (
+                                                    decodeBytesToArray,
+                                                    splitLengthPrefixedImages
+                                                 )
+from sign_lang.constant.application       import (
+                                                    APP_HOST,
+                                                    APP_PORT,
+                                                    APP_INFERENCE_WORKERS,
+                                                    APP_WS_ENABLED,
+                                                    APP_WS_PORT,
+                                                    APP_ROI_INFERENCE,
+                                                    APP_LIVE_SOURCE,
+                                                    APP_JPEG_QUALITY,
+                                                    APP_DETECTIONS_JSON_MIMETYPE,
+                                                    APP_DETECTIONS_BINARY_MIMETYPE
+                                                 )
+from sign_lang.serving.model_holder       import model_holder
+from sign_lang.serving.batcher            import MicroBatcher
+from sign_lang.serving.roi                import RoiDetector
+from sign_lang.serving.worker_pool        import InferenceWorkerPool
+from sign_lang.serving.training_jobs      import TrainingJobManager
+from sign_lang.serving.ws_server          import FrameSocketServer
+from sign_lang.serving.broadcaster        import BroadcasterRegistry
+from sign_lang.serving.result_cache       import ResultCache, image_digest
+from sign_lang.serving.live_pipeline      import LIVE_OUTPUT_MJPEG, LIVE_OUTPUT_DETECTIONS
+from sign_lang.serving.instrumentation    import STAGE_SECONDS, REQUESTS_TOTAL, live_collector
+from sign_lang.utils.metrics              import registry as metrics_registry
+from sign_lang.serving.detections         import (
+                                                    DETECTION_BINARY_LAYOUT,
+                                                    detections_payload,
+                                                    pack_detections,
+                                                    render_jpeg
+                                                 )
 
 app = Flask(__name__)
 CORS(app)
 
+# Spawned children — inference workers, training jobs — re-import this
+# module as __mp_main__; only the serving process builds serving state
+SERVING_PROCESS = mp.parent_process() is None
+
+if SERVING_PROCESS:
+    # Coalesces concurrent /predict calls into batched inference — in this
+    # process, or across APP_INFERENCE_WORKERS model processes when set
+    batcher           = InferenceWorkerPool() if APP_INFERENCE_WORKERS > 0 else MicroBatcher(model_holder)
+
+    # Two-stage hand-region inference for /predict?roi=1 and /live — both
+    # passes go through the batcher, so in pool mode they run in the workers
+    roi_detector      = RoiDetector(batcher)
+
+    # Reuses finished responses for re-sent identical images
+    result_cache      = ResultCache(batcher)
+
+    # Runs /train in a separate process, one job at a time
+    training_jobs     = TrainingJobManager()
+
+    # Camera frames from browsers over WebSocket, on APP_WS_PORT
+    ws_server         = FrameSocketServer(batcher)
+
+    # One shared capture + inference producer per live source — keyframes
+    # go through the batcher, so pool mode keeps the model out of this process
+    live_broadcasters = BroadcasterRegistry(batcher, roi_detector if APP_ROI_INFERENCE else None)
+    metrics_registry.register_collector(live_collector(live_broadcasters))
+
 # ─────────────────────────────────────────────────────────
-# ClientApp — Holds input image filename
+# Request Accounting — one counter sample per finished request
 # ─────────────────────────────────────────────────────────
-class ClientApp:
-    def __init__(self):
-        self.filename = "inputImage.jpg"
+# Routes that negotiate a response mode (?mode= / Accept) — "none" elsewhere
+MODE_ROUTES = ("predictRoute", "predictLive")
 
-clApp = ClientApp()
+@app.after_request
+def countRequest(response):
+    mode = responseMode() if request.endpoint in MODE_ROUTES else "none"
+    REQUESTS_TOTAL.inc(route=request.endpoint or "unknown", mode=mode, status=response.status_code)
+    return response
 
 # ─────────────────────────────────────────────────────────
-# Route: Trigger Training Pipeline
+# Route: Trigger Training Pipeline — starts a background job and
+# returns its id; a running job is returned with 409 instead.
+# ?force=model_trainer (comma list, or "all") re-runs stages that
+# would otherwise be reused.
 # ─────────────────────────────────────────────────────────
-@app.route("/train")
+@app.route("/train", methods=['GET', 'POST'])
 def trainRoute():
-    pipeline = TrainPipeline()
-    pipeline.run_pipeline()
-    return "Training Successful!!"
+    force        = [stage.strip() for value in request.args.getlist("force") for stage in value.split(",") if stage.strip()]
+    job, created = training_jobs.submit(force)
+
+    response     = jsonify({**job, "status_url": f"/train/{job['job_id']}"})
+    response.status_code = 202 if created else 409
+    return response
+
+@app.route("/train/jobs", methods=['GET'])
+def trainJobsRoute():
+    return jsonify(training_jobs.list())
+
+@app.route("/train/<job_id>", methods=['GET'])
+def trainStatusRoute(job_id):
+    job = training_jobs.get(job_id)
+    if job is None:
+        return Response("Unknown training job", status=404)
+    job.pop("history")
+    return jsonify(job)
+
+# Per-epoch metrics so far
+@app.route("/train/<job_id>/progress", methods=['GET'])
+def trainProgressRoute(job_id):
+    job = training_jobs.get(job_id)
+    if job is None:
+        return Response("Unknown training job", status=404)
+    return jsonify({key: job[key] for key in ("job_id", "status", "stage", "epoch", "epochs", "progress", "history")})
+
+# Latest epoch's validation metrics and losses
+@app.route("/train/<job_id>/metrics", methods=['GET'])
+def trainMetricsRoute(job_id):
+    job = training_jobs.get(job_id)
+    if job is None:
+        return Response("Unknown training job", status=404)
+    return jsonify({"job_id": job_id, "status": job["status"], "epoch": job["epoch"], "metrics": job["metrics"]})
+
+@app.route("/train/<job_id>/cancel", methods=['POST'])
+def trainCancelRoute(job_id):
+    job = training_jobs.cancel(job_id)
+    if job is None:
+        return Response("Unknown training job", status=404)
+    job.pop("history")
+    return jsonify(job)
+
+# ─────────────────────────────────────────────────────────
+# Route: Liveness + Readiness — /healthz answers as soon as the
+# process serves HTTP; /readyz only once a model is loaded and
+# warmed up (503 while loading or before any weights exist)
+# ─────────────────────────────────────────────────────────
+@app.route("/healthz", methods=['GET'])
+def healthzRoute():
+    return jsonify({
+                        "status"         : "ok",
+                        "uptime_seconds" : round(time.time() - psutil.Process().create_time(), 1),
+                        "ready"          : batcher.ready,
+                   })
+
+@app.route("/readyz", methods=['GET'])
+def readyzRoute():
+    # Weights may have appeared since startup — (re)start loading, a no-op while in progress
+    if not batcher.ready:
+        batcher.start()
+
+    readiness = batcher.readiness()
+    response  = jsonify(readiness)
+    response.status_code = 200 if readiness["ready"] else 503
+    return response
 
 # ─────────────────────────────────────────────────────────
 # Route: Home Page — Serves Frontend UI
 # ─────────────────────────────────────────────────────────
 @app.route("/")
 def home():
-    return render_template("index.html")
+    return render_template("index.html", ws_port=APP_WS_PORT if APP_WS_ENABLED else None)
+
+# ─────────────────────────────────────────────────────────
+# Response Mode — ?mode=image|detections|binary, else Accept header
+# ─────────────────────────────────────────────────────────
+RESPONSE_MODES = ("image", "detections", "binary")
+
+def responseMode() -> str:
+    mode = request.args.get("mode")
+    if mode in RESPONSE_MODES:
+        return mode
+
+    # Only explicit Accept entries count — */* keeps the image default
+    accepted = {value for value, _ in request.accept_mimetypes}
+    if APP_DETECTIONS_JSON_MIMETYPE in accepted:
+        return "detections"
+    if APP_DETECTIONS_BINARY_MIMETYPE in accepted:
+        return "binary"
+    return "image"
+
+# ─────────────────────────────────────────────────────────
+# Image Options — ?quality=1..100 and ?max_size=<longest side px>
+# ─────────────────────────────────────────────────────────
+def imageOptions() -> tuple:
+    quality  = min(100, max(1, int(request.args.get("quality", APP_JPEG_QUALITY))))
+    max_size = int(request.args.get("max_size", 0)) or None
+    return quality, max_size
 
 # ─────────────────────────────────────────────────────────
 # Route: Predict from Uploaded Image
@@ -47,28 +202,44 @@ def home():
 @app.route("/predict", methods=['POST', 'GET'])
 @cross_origin()
 def predictRoute():
+    with STAGE_SECONDS.time(path="predict", stage="total"):
+        return _predict()
+
+def _predict():
     try:
-        image           = request.json['image']
-        decodeImage(image, clApp.filename)
+        # Undo base64 only — the raw image bytes double as the cache key
+        with STAGE_SECONDS.time(path="predict", stage="b64decode"):
+            image_bytes = base64.b64decode(request.json['image'])
+
+        # Shared YOLOv11 model — loaded once, reloaded when best.pt changes
+        if not model_holder.exists():
+            return Response(f"Model file not found at {model_holder.model_path}", status=404)
+
+        mode            = responseMode()
+        quality, size   = imageOptions()
+        roi             = request.args.get("roi", "1" if APP_ROI_INFERENCE else "0") == "1"
 
-        # Load trained YOLOv11 model
-        model_path      = os.path.join("artifacts", "model_trainer", "best.pt")
+        # Identical image + same response variant + same model → reuse
+        with STAGE_SECONDS.time(path="predict", stage="hash"):
+            digest      = image_digest(image_bytes)
+        variant         = mode if mode != "image" else f"image:q{quality}:s{size or 0}"
+        variant         = f"{variant}:roi" if roi else variant
+        cached          = result_cache.get(digest, variant)
 
-        if not os.path.exists(model_path):
-            return Response(f"Model file not found at {model_path}", status=404)
-        
-        model           = YOLO(model_path)
-        
-        # Run inference on uploaded image
-        results = model.predict(source=os.path.join("data", clApp.filename), save=True)
+        if cached is None:
+            # Decode upload in memory — each request owns its own frame
+            with STAGE_SECONDS.time(path="predict", stage="decode"):
+                image   = decodeBytesToArray(image_bytes)
 
-        # Encode prediction result
-        output_path     = os.path.join("runs", "detect", "predict", clApp.filename)
-        opencodedbase64 = encodeImageIntoBase64(output_path)
-        result = {"image": opencodedbase64.decode('utf-8')}
+            # Run inference via the micro-batcher — nothing is saved to runs/
+            version     = batcher.version
+            with STAGE_SECONDS.time(path="predict", stage="inference"):
+                prediction = roi_detector.predict(image) if roi else batcher.predict(image)
 
-        # Cleanup
-        os.system("rm -rf runs")
+            cached      = predictResponseBody(prediction, mode, quality, size)
+            result_cache.put(digest, variant, cached, len(cached[0]), model_version=version)
+
+        body, mimetype, headers = cached
 
     except ValueError as val:
         print(val)
@@ -79,48 +250,159 @@ def predictRoute():
         print(e)
         return Response("Invalid input")
 
-    return jsonify(result)
+    return Response(body, mimetype=mimetype, headers=headers)
 
 # ─────────────────────────────────────────────────────────
-# Route: Live Camera Detection
+# Build the /predict body for a response mode → (body, mimetype, headers)
 # ─────────────────────────────────────────────────────────
+def predictResponseBody(prediction, mode: str, quality: int, size: int) -> tuple:
+    # Detections-only modes never plot or encode an image
+    if mode == "detections":
+        with STAGE_SECONDS.time(path="predict", stage="serialize"):
+            return json.dumps(detections_payload(prediction)).encode(), "application/json", {}
+
+    if mode == "binary":
+        height, width = prediction.orig_shape[:2]
+        with STAGE_SECONDS.time(path="predict", stage="serialize"):
+            packed    = pack_detections(prediction)
+        return (
+                    packed,
+                    APP_DETECTIONS_BINARY_MIMETYPE,
+                    {
+                        "X-Detection-Layout" : DETECTION_BINARY_LAYOUT,
+                        "X-Image-Size"       : f"{width}x{height}",
+                    }
+               )
+
+    # Annotate and JPEG-encode straight into the response
+    jpeg_bytes = render_jpeg(prediction, quality, size)
+    with STAGE_SECONDS.time(path="predict", stage="base64"):
+        opencodedbase64 = base64.b64encode(jpeg_bytes)
+    return json.dumps({"image": opencodedbase64.decode('utf-8')}).encode(), "application/json", {}
+
+# ─────────────────────────────────────────────────────────
+# Route: Predict a Batch of Raw Images
+#
+# Input  — multipart/form-data with one file part per image, or a
+#          binary body of <uint32 big-endian length><image> records
+# Output — streamed per image as each finishes:
+#          ?format=json   → NDJSON lines {"index", "name", "image"}
+#          ?format=binary → multipart/mixed, one image/jpeg part each,
+#                           or a text/plain part with X-Error on failure
+# ─────────────────────────────────────────────────────────
+@app.route("/predict/batch", methods=['POST'])
+@cross_origin()
+def predictBatchRoute():
+    try:
+        if not model_holder.exists():
+            return Response(f"Model file not found at {model_holder.model_path}", status=404)
+
+        # Collect raw payloads up-front — the request body is gone once streaming starts
+        if request.files:
+            uploads = [(f.filename, f.read()) for key in request.files for f in request.files.getlist(key)]
+        else:
+            uploads = [(str(i), data) for i, data in enumerate(splitLengthPrefixedImages(request.get_data()))]
+
+        if not uploads:
+            return Response("No images found in request", status=400)
+
+        binary  = request.args.get("format", "json") == "binary" or \
+                  request.accept_mimetypes.best == "multipart/mixed"
+        quality, size = imageOptions()
+
+        # Submit everything at once so the batcher can group them
+        futures = {}
+        errors  = []
+        for index, (name, data) in enumerate(uploads):
+            try:
+                futures[batcher.submit(decodeBytesToArray(data))] = (index, name)
+            except Exception as e:
+                errors.append((index, name, str(e)))
+
+    except ValueError as val:
+        logger.warning(f"Rejected batch request: {val}")
+        return Response(str(val), status=400)
+    except Exception as e:
+        logger.error(f"Batch request failed: {e}")
+        return Response("Invalid input", status=400)
+
+    def as_json():
+        for index, name, error in errors:
+            yield json.dumps({"index": index, "name": name, "error": error}) + "\n"
 
-# Load trained YOLOv11 model from artifact path
-model_path = os.path.join("artifacts", "model_trainer", "best.pt")
-model      = YOLO(model_path)  
+        for future in as_completed(futures):
+            index, name = futures[future]
+            try:
+                image   = base64.b64encode(render_jpeg(future.result(), quality, size, path="batch")).decode('utf-8')
+                payload = {"index": index, "name": name, "image": image}
+            except Exception as e:
+                payload = {"index": index, "name": name, "error": str(e)}
+            yield json.dumps(payload) + "\n"
 
+    # Failed images get an empty text/plain part carrying X-Error
+    def part(index, name, body=b'', error=None):
+        headers = f'X-Image-Index: {index}\r\nX-Image-Name: {name}\r\n'
+        if error is not None:
+            headers = f'Content-Type: text/plain\r\n{headers}X-Error: {" ".join(error.split())}\r\n'
+        else:
+            headers = f'Content-Type: image/jpeg\r\n{headers}'
+        return b'--result\r\n' + headers.encode() + b'\r\n' + body + b'\r\n'
 
-# Frame Generator — Captures webcam, runs inference, streams MJPEG
-def gen_frames():
-    cap = cv2.VideoCapture(0)  # 0 = default webcam device
-    if not cap.isOpened():
-        raise RuntimeError("Webcam not accessible — check device or permissions")
+    def as_multipart():
+        for index, name, error in errors:
+            yield part(index, name, error=error)
 
-    while True:
-        success, frame = cap.read()
-        if not success:
-            break  # Exit loop if frame capture fails
+        for future in as_completed(futures):
+            index, name = futures[future]
+            try:
+                frame_bytes = render_jpeg(future.result(), quality, size, path="batch")
+            except Exception as e:
+                logger.warning(f"Batch item {index} failed: {e}")
+                yield part(index, name, error=str(e))
+                continue
+            yield part(index, name, frame_bytes)
+        yield b'--result--\r\n'
 
-        # ─────────────────────────────────────────────────────
-        # Run YOLOv11 inference on current frame
-        # stream=True yields generator of Results objects
-        # show=False disables OpenCV window popups
-        # verbose=False suppresses console spam
-        # ─────────────────────────────────────────────────────
-        results = model.predict(frame, stream=True, show=False, verbose=False)
+    if binary:
+        return Response(as_multipart(), mimetype='multipart/mixed; boundary=result')
+    return Response(as_json(), mimetype='application/x-ndjson')
+
+# ─────────────────────────────────────────────────────────
+# Route: Serving Statistics — Batch Sizes + Queue Wait
+# ─────────────────────────────────────────────────────────
+@app.route("/stats", methods=['GET'])
+def statsRoute():
+    return jsonify({
+                        "batcher"   : batcher.stats(),
+                        "cache"     : result_cache.stats(),
+                        "live"      : live_broadcasters.stats(),
+                        "websocket" : ws_server.stats(),
+                   })
+
+# ─────────────────────────────────────────────────────────
+# Route: Prometheus Metrics — Stage Histograms, Counters, Live FPS
+# ─────────────────────────────────────────────────────────
+@app.route("/metrics", methods=['GET'])
+def metricsRoute():
+    return Response(metrics_registry.render(), mimetype='text/plain; version=0.0.4')
 
-        for r in results:
-            annotated   = r.plot()  # Overlay bounding boxes and labels
-            ret, buffer = cv2.imencode('.jpg', annotated)
-            frame_bytes = buffer.tobytes()
+# ─────────────────────────────────────────────────────────
+# Route: Live Camera Detection — producers in live_broadcasters
+# ─────────────────────────────────────────────────────────
 
-            # ─────────────────────────────────────────────────
-            # Yield frame in MJPEG format for browser rendering
-            # ─────────────────────────────────────────────────
-            yield (b'--frame\r\n'
-                   b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
+# Frame Generator — Wraps broadcast frames as MJPEG parts
+def gen_frames(broadcaster, pipeline):
+    for frame_bytes in broadcaster.stream(pipeline, LIVE_OUTPUT_MJPEG):
+        # ─────────────────────────────────────────────────
+        # Yield frame in MJPEG format for browser rendering
+        # ─────────────────────────────────────────────────
+        yield (b'--frame\r\n'
+               b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
 
-    cap.release()  # Ensure camera is released on exit
+# Detections Generator — One NDJSON line per inferred frame
+def gen_detections(broadcaster, pipeline):
+    for payload in broadcaster.stream(pipeline, LIVE_OUTPUT_DETECTIONS):
+        yield payload + b'\n'
 
 # ─────────────────────────────────────────────────────────────
 # Flask Route — Streams annotated webcam feed to browser
@@ -129,13 +411,29 @@ def gen_frames():
 @cross_origin()
 def predictLive():
     try:
-        if not os.path.exists(model_path):
-            return Response(f"Model file not found at {model_path}", status=404)
+        if not model_holder.exists():
+            return Response(f"Model file not found at {model_holder.model_path}", status=404)
+
+        # ?mode=detections streams JSON detections and skips rendering
+        detections  = responseMode() == "detections"
+        output      = LIVE_OUTPUT_DETECTIONS if detections else LIVE_OUTPUT_MJPEG
 
-        # ─────────────────────────────────────────────────────
-        # Return MJPEG stream to browser — compatible with Chrome/Firefox
-        # ─────────────────────────────────────────────────────
-        return Response(gen_frames(), mimetype='multipart/x-mixed-replace; boundary=frame')
+        # Join the shared producer — the first viewer of either output
+        # kind opens the source, so camera errors still surface here as a 500
+        broadcaster = live_broadcasters.get(APP_LIVE_SOURCE)
+        pipeline    = broadcaster.attach(output)
+
+        if detections:
+            response = Response(gen_detections(broadcaster, pipeline), mimetype='application/x-ndjson')
+        else:
+            # ─────────────────────────────────────────────────────
+            # Return MJPEG stream to browser — compatible with Chrome/Firefox
+            # ─────────────────────────────────────────────────────
+            response = Response(gen_frames(broadcaster, pipeline), mimetype='multipart/x-mixed-replace; boundary=frame')
+
+        # Runs when the viewer disconnects, even before the first frame
+        response.call_on_close(lambda: broadcaster.detach(pipeline, output))
+        return response
 
     except Exception as e:
         print(f"Live stream error: {e}")
@@ -146,4 +444,10 @@ def predictLive():
 # App Entry Point
 # ─────────────────────────────────────────────────────────
 if __name__ == "__main__":
+    # Model loads and warms up in the background while the server starts
+    batcher.start()
+    if APP_WS_ENABLED:
+        ws_server.start()
+
+    logger.info(f"Serving on port {APP_PORT}, {time.time() - psutil.Process().create_time():.2f}s after process start")
     app.run(host=APP_HOST, port=APP_PORT)
\ No newline at end of file
@@ -4,64 +4,209 @@
 
 import os
 import sys
+import time
+import hashlib
 import zipfile
-import gdown
+import multiprocessing as mp
+from concurrent.futures                   import ProcessPoolExecutor
 
-from sign_lang.logger                  import logger
-from sign_lang.exception               import AppException
-from sign_lang.entity.config_entity    import DataIngestionConfig
-from sign_lang.entity.artifacts_entity import DataIngestionArtifact
+from sign_lang.logger                     import logger
+from sign_lang.exception                  import AppException
+from sign_lang.entity.config_entity       import DataIngestionConfig
+from sign_lang.entity.artifacts_entity    import DataIngestionArtifact
+from sign_lang.utils.main_utils           import read_json_file, write_json_file
+from sign_lang.utils.data_source          import DataSource, make_data_source, file_sha256
+from sign_lang.constant.training_pipeline import DATA_DOWNLOAD_FILE_NAME, DATA_INGESTION_MARKER_FILE
+
+# ─────────────────────────────────────────────────────────────
+# Zip timestamps have 2 s resolution and no timezone — extracted
+# files get this mtime so unchanged members can be recognised
+# ─────────────────────────────────────────────────────────────
+def _member_mtime(info: zipfile.ZipInfo) -> float:
+    return time.mktime(info.date_time + (0, 0, -1))
+
+def _is_extracted(info: zipfile.ZipInfo, target_path: str) -> bool:
+    try:
+        stat = os.stat(target_path)
+    except OSError:
+        return False
+    return stat.st_size == info.file_size and abs(stat.st_mtime - _member_mtime(info)) < 2.0
+
+# ─────────────────────────────────────────────────────────────
+# Worker — each process opens its own handle on the archive and
+# extracts its share of members. Returns bytes written.
+# ─────────────────────────────────────────────────────────────
+def _extract_members(zip_file_path: str, dest_dir: str, names: list) -> int:
+    written = 0
+    with zipfile.ZipFile(zip_file_path, "r") as zip_ref:
+        for name in names:
+            info        = zip_ref.getinfo(name)
+            target_path = zip_ref.extract(info, dest_dir)
+            mtime       = _member_mtime(info)
+            os.utime(target_path, (mtime, mtime))
+            written    += info.file_size
+    return written
+
+# Spread members over n bins of roughly equal uncompressed size
+def _balance_members(members: list, n: int) -> list:
+    bins  = [[] for _ in range(n)]
+    loads = [0] * n
+    for info in sorted(members, key=lambda m: m.file_size, reverse=True):
+        i        = loads.index(min(loads))
+        bins[i].append(info.filename)
+        loads[i] += info.file_size
+    return [names for names in bins if names]
 
 # ─────────────────────────────────────────────────────────────
 # Handles dataset download and extraction from Roboflow/Drive
 # ─────────────────────────────────────────────────────────────
 class DataIngestion:
-    def __init__(self, data_ingestion_config: DataIngestionConfig = DataIngestionConfig()):
+    def __init__(
+                    self,
+                    data_ingestion_config : DataIngestionConfig = DataIngestionConfig(),
+                    data_source           : DataSource          = None,
+                ):
         try:
             self.data_ingestion_config = data_ingestion_config
+            self.data_source           = data_source or make_data_source(data_ingestion_config.data_download_url)
         except Exception as e:
             raise AppException(e, sys)
 
     # ─────────────────────────────────────────────────────────
-    # Download dataset zip from Google Drive
+    # Cache entry for this source — keyed by URL and the expected
+    # checksum, so pinning a new digest never reuses an old archive
     # ─────────────────────────────────────────────────────────
-    def download_data(self) -> str:
+    def cache_entry_dir(self) -> str:
+        key = hashlib.sha256(
+                                f"{self.data_source.url}\n{self.data_ingestion_config.data_download_sha256}".encode()
+                            ).hexdigest()[:16]
+        return os.path.join(self.data_ingestion_config.download_cache_dir, key)
+
+    # Digest of a cached archive — reuses the recorded one while size and mtime match
+    def _cached_checksum(self, zip_file_path: str, meta_file_path: str) -> str:
+        stat = os.stat(zip_file_path)
+        if os.path.exists(meta_file_path):
+            meta = read_json_file(meta_file_path)
+            if meta.get("size") == stat.st_size and meta.get("mtime_ns") == stat.st_mtime_ns:
+                return meta["sha256"]
+
+        checksum = file_sha256(zip_file_path)
+        write_json_file(meta_file_path, {
+                                            "url"      : self.data_source.url,
+                                            "sha256"   : checksum,
+                                            "size"     : stat.st_size,
+                                            "mtime_ns" : stat.st_mtime_ns,
+                                        })
+        return checksum
+
+    # ─────────────────────────────────────────────────────────
+    # Download dataset zip into the content-addressed cache, or
+    # reuse the verified copy already there. Returns (path, sha256).
+    # ─────────────────────────────────────────────────────────
+    def download_data(self) -> tuple:
         try:
-            dataset_url      = self.data_ingestion_config.data_download_url
-            zip_download_dir = self.data_ingestion_config.data_ingestion_dir
-            
-            os.makedirs(zip_download_dir, exist_ok=True)
+            expected         = self.data_ingestion_config.data_download_sha256.lower()
+            entry_dir        = self.cache_entry_dir()
+            zip_file_path    = os.path.join(entry_dir, DATA_DOWNLOAD_FILE_NAME)
+            meta_file_path   = f"{zip_file_path}.json"
+
+            os.makedirs(entry_dir, exist_ok=True)
 
-            zip_file_path    = os.path.join(zip_download_dir, "data.zip")
-            logger.info(f"Downloading data from {dataset_url} into {zip_file_path}")
+            if os.path.exists(zip_file_path):
+                checksum = self._cached_checksum(zip_file_path, meta_file_path)
+                if not expected or checksum == expected:
+                    logger.info(f"Using cached archive {zip_file_path} (sha256 {checksum[:12]})")
+                    return zip_file_path, checksum
 
-            file_id          = dataset_url.split("/")[-2]
-            gdown.download(f"https://drive.google.com/uc?/export=download&id={file_id}", zip_file_path)
+                logger.warning(f"Cached archive {zip_file_path} has sha256 {checksum}, expected {expected} — downloading again")
+                os.remove(zip_file_path)
 
-            logger.info(f"Download complete: {zip_file_path}")
-            return zip_file_path
+            logger.info(f"Downloading data from {self.data_source} into {zip_file_path}")
+            self.data_source.fetch(zip_file_path)
+
+            checksum = self._cached_checksum(zip_file_path, meta_file_path)
+            if expected and checksum != expected:
+                os.remove(zip_file_path)
+                raise ValueError(f"Checksum mismatch for {self.data_source.url}: got {checksum}, expected {expected}")
+
+            logger.info(f"Download complete: {zip_file_path} (sha256 {checksum[:12]})")
+            return zip_file_path, checksum
 
         except Exception as e:
             raise AppException(e, sys)
 
     # ─────────────────────────────────────────────────────────
-    # Extract zip file into feature store directory
+    # Extract zip file into feature store directory. Every member
+    # is checked by size and mtime, so files deleted or modified in
+    # the feature store are restored even when the marker says this
+    # archive was already extracted; nothing is written when all match.
     # ─────────────────────────────────────────────────────────
-    def extract_zip_file(self, zip_file_path: str) -> str:
+    def extract_zip_file(self, zip_file_path: str, checksum: str = None) -> str:
         try:
             feature_store_path = self.data_ingestion_config.feature_store_file_path
-            
-            os.makedirs(feature_store_path, exist_ok=True)
+            marker_file_path   = os.path.join(feature_store_path, DATA_INGESTION_MARKER_FILE)
 
+            marker_matches     = bool(checksum) and os.path.exists(marker_file_path) and \
+                                 read_json_file(marker_file_path).get("sha256") == checksum
+
+            started = time.perf_counter()
             with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-                zip_ref.extractall(feature_store_path)
+                infos     = zip_ref.infolist()
+                top_level = sorted({info.filename.split("/", 1)[0] for info in infos if info.filename.strip("/")})
+
+            # Only members missing or changed on disk are extracted again
+            files   = [info for info in infos if not info.is_dir()]
+            pending = [
+                        info for info in files
+                        if not _is_extracted(info, os.path.join(feature_store_path, *info.filename.split("/")))
+                      ]
+
+            if marker_matches and not pending:
+                logger.info(f"Feature store {feature_store_path} already matches {zip_file_path}, skipping extraction")
+                return feature_store_path
+
+            os.makedirs(feature_store_path, exist_ok=True)
+            if os.path.exists(marker_file_path):
+                os.remove(marker_file_path)                     # never trust a half-finished extraction
+
+            for info in infos:
+                if info.is_dir():
+                    os.makedirs(os.path.join(feature_store_path, *info.filename.strip("/").split("/")), exist_ok=True)
+
+            written = self._extract_parallel(zip_file_path, feature_store_path, pending)
 
-            logger.info(f"Extracted {zip_file_path} into {feature_store_path}")
+            if checksum:
+                write_json_file(marker_file_path, {"sha256": checksum, "top_level": top_level})
+
+            elapsed = time.perf_counter() - started
+            logger.info(
+                            f"Extracted {zip_file_path} into {feature_store_path}: "
+                            f"{len(pending)} of {len(files)} members, {len(files) - len(pending)} unchanged, "
+                            f"{written / 1e6:.1f} MB in {elapsed:.2f}s ({written / 1e6 / max(elapsed, 1e-9):.1f} MB/s)"
+                       )
             return feature_store_path
 
         except Exception as e:
             raise AppException(e, sys)
 
+    # ─────────────────────────────────────────────────────────
+    # Fan members out across a process pool — small jobs stay inline
+    # ─────────────────────────────────────────────────────────
+    def _extract_parallel(self, zip_file_path: str, dest_dir: str, members: list) -> int:
+        workers = self.data_ingestion_config.extract_workers or os.cpu_count() or 1
+        workers = min(workers, len(members))
+
+        if workers <= 1:
+            return _extract_members(zip_file_path, dest_dir, [info.filename for info in members])
+
+        # spawn, not fork — the serving process also runs model and batcher threads
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn")) as pool:
+            futures = [
+                        pool.submit(_extract_members, zip_file_path, dest_dir, names)
+                        for names in _balance_members(members, workers)
+                      ]
+            return sum(future.result() for future in futures)
+
     # ─────────────────────────────────────────────────────────
     # Orchestrates download + extraction and returns artifact
     # ─────────────────────────────────────────────────────────
@@ -69,13 +214,14 @@ class DataIngestion:
         logger.info("Starting data ingestion pipeline")
 
         try:
-            zip_file_path      = self.download_data()
-            feature_store_path = self.extract_zip_file(zip_file_path)
-
-            artifact           = DataIngestionArtifact(
-                                                        data_zip_file_path = zip_file_path,
-                                                        feature_store_path = feature_store_path
-                                                      )
+            zip_file_path, checksum = self.download_data()
+            feature_store_path      = self.extract_zip_file(zip_file_path, checksum)
+
+            artifact                = DataIngestionArtifact(
+                                                                data_zip_file_path = zip_file_path,
+                                                                feature_store_path = feature_store_path,
+                                                                data_zip_checksum  = checksum
+                                                           )
 
             logger.info(f"Data ingestion completed: {artifact}")
             return artifact
@@ -1,19 +1,90 @@
 # ─────────────────────────────────────────────────────────────
-# Data Validation Component — Structure Check + Status Logging
+# Data Validation Component — Structure + Content Checks, Status Logging
 # ─────────────────────────────────────────────────────────────
 
 import os
 import sys
-import shutil
+import hashlib
+import zipfile
+import multiprocessing as mp
+from collections                       import Counter
+from concurrent.futures                import ProcessPoolExecutor
+
+import cv2
+import numpy as np
 
 from sign_lang.logger                  import logger
 from sign_lang.exception               import AppException
+from sign_lang.utils.main_utils        import read_yaml_file, read_json_file, write_json_file
+from sign_lang.utils.data_source       import file_sha256
 from sign_lang.entity.config_entity    import DataValidationConfig
 from sign_lang.entity.artifacts_entity import (
                                                 DataIngestionArtifact,
                                                 DataValidationArtifact
                                               )
 
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+# ─────────────────────────────────────────────────────────────
+# Worker — decode one image and parse its YOLO label file.
+# Returns the manifest entry for the pair; problems go in "errors".
+# ─────────────────────────────────────────────────────────────
+def _check_pair(image_path: str, label_path: str, num_classes: int) -> dict:
+    errors = []
+
+    with open(image_path, "rb") as f:
+        data = f.read()
+
+    image  = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_UNCHANGED)
+    height, width = image.shape[:2] if image is not None else (0, 0)
+    if image is None:
+        errors.append("corrupt image: cannot be decoded")
+    elif image_path.lower().endswith((".jpg", ".jpeg")) and not data.rstrip(b"\0").endswith(b"\xff\xd9"):
+        errors.append("corrupt image: truncated JPEG")
+
+    classes = Counter()
+    if os.path.exists(label_path):
+        with open(label_path, "r") as f:
+            for line_no, line in enumerate(f, start=1):
+                fields = line.split()
+                if not fields:
+                    continue
+                if len(fields) != 5:
+                    errors.append(f"label line {line_no}: expected 5 values, got {len(fields)}")
+                    continue
+                try:
+                    cls    = int(float(fields[0]))
+                    coords = [float(v) for v in fields[1:]]
+                except ValueError:
+                    errors.append(f"label line {line_no}: non-numeric value")
+                    continue
+
+                if float(fields[0]) != cls or not 0 <= cls < num_classes:
+                    errors.append(f"label line {line_no}: class id {fields[0]} outside 0..{num_classes - 1}")
+                if any(not 0.0 <= v <= 1.0 for v in coords) or coords[2] <= 0 or coords[3] <= 0:
+                    errors.append(f"label line {line_no}: box {coords} outside normalized range")
+                classes[cls] += 1
+
+    return {
+                "hash"    : hashlib.blake2b(data, digest_size=16).hexdigest(),
+                "width"   : int(width),
+                "height"  : int(height),
+                "boxes"   : sum(classes.values()),
+                "classes" : {str(cls): count for cls, count in classes.items()},
+                "errors"  : errors,
+           }
+
+def _check_pairs(jobs: list, num_classes: int) -> list:
+    return [_check_pair(image_path, label_path, num_classes) for image_path, label_path in jobs]
+
+# Size and mtime of a file, or None when it does not exist
+def _signature(path: str):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
 # ─────────────────────────────────────────────────────────────
 # Validates expected files in feature store directory
 # ─────────────────────────────────────────────────────────────
@@ -26,52 +97,199 @@ class DataValidation:
         try:
             self.data_ingestion_artifact    = data_ingestion_artifact
             self.data_validation_config     = data_validation_config
+            self.base_path                  = os.path.join(
+                                                            data_ingestion_artifact.feature_store_path,
+                                                            "Sign_Language_Images"
+                                                          )
         except Exception as e:
             raise AppException(e, sys)
 
-    
+
     # ─────────────────────────────────────────────────────────
     # Check if all required files exist in extracted dataset
     # ─────────────────────────────────────────────────────────
+    def missing_required_paths(self) -> list:
+        # Expected structure for YOLOv11 training
+        required_paths = [
+                            os.path.join(self.base_path, "train", "images"),   # training images
+                            os.path.join(self.base_path, "train", "labels"),   # training labels
+                            os.path.join(self.base_path, "valid", "images"),   # validation images
+                            os.path.join(self.base_path, "valid", "labels"),   # validation labels
+                            os.path.join(self.base_path, "data.yaml")          # YOLO config file
+                         ]
+
+        return [path for path in required_paths if not os.path.exists(path)]
+
     def validate_all_files_exist(self) -> bool:
         try:
-            # Ensure validation directory exists for status logging
-            os.makedirs(self.data_validation_config.data_validation_dir, exist_ok=True)
+            return len(self.missing_required_paths()) == 0
+        except Exception as e:
+            raise AppException(e, sys)
+
+    # ─────────────────────────────────────────────────────────
+    # Pair every image with its label file, per split
+    # ─────────────────────────────────────────────────────────
+    def _collect_pairs(self) -> tuple:
+        pairs, orphan_labels = {}, []
+
+        for split in self.data_validation_config.splits:
+            image_dir = os.path.join(self.base_path, split, "images")
+            label_dir = os.path.join(self.base_path, split, "labels")
+
+            stems     = set()
+            for name in sorted(os.listdir(image_dir)) if os.path.isdir(image_dir) else []:
+                stem, ext = os.path.splitext(name)
+                if ext.lower() in IMAGE_EXTENSIONS:
+                    stems.add(stem)
+                    pairs[f"{split}/{name}"] = (os.path.join(image_dir, name), os.path.join(label_dir, f"{stem}.txt"))
+
+            for name in sorted(os.listdir(label_dir)) if os.path.isdir(label_dir) else []:
+                stem, ext = os.path.splitext(name)
+                if ext == ".txt" and stem not in stems:
+                    orphan_labels.append(f"{split}/{name}")
+
+        return pairs, orphan_labels
+
+    # ─────────────────────────────────────────────────────────
+    # Deep content check — decodes every image and parses every
+    # label across a process pool. Pairs whose image and label
+    # signatures match the previous manifest are not re-read.
+    # ─────────────────────────────────────────────────────────
+    def validate_dataset_contents(self) -> dict:
+        try:
+            config        = self.data_validation_config
+            data_yaml     = read_yaml_file(os.path.join(self.base_path, "data.yaml"))
+            names         = data_yaml.get("names", [])
+            names         = names if isinstance(names, dict) else dict(enumerate(names))
+            num_classes   = int(data_yaml.get("nc", len(names)))
+
+            previous      = read_json_file(config.manifest_file_path) if os.path.exists(config.manifest_file_path) else {}
+            old_files     = previous.get("files", {}) if previous.get("num_classes") == num_classes else {}
 
-            # Root path where Roboflow dataset was extracted
-            base_path      = os.path.join(
-                                            self.data_ingestion_artifact.feature_store_path,
-                                            "Sign_Language_Images"
-                                         )
-
-            # Expected structure for YOLOv11 training
-            required_paths = [
-                                os.path.join(base_path, "train", "images"),   # training images
-                                os.path.join(base_path, "train", "labels"),   # training labels
-                                os.path.join(base_path, "valid", "images"),   # validation images
-                                os.path.join(base_path, "valid", "labels"),   # validation labels
-                                os.path.join(base_path, "data.yaml")          # YOLO config file
-                             ]
-
-            # Identify missing paths
-            missing        = [path for path in required_paths if not os.path.exists(path)]
-
-            # Validation passes only if all required paths exist
-            validation_status = len(missing) == 0
-
-            # Write status and missing paths to status.txt for auditability
-            with open(self.data_validation_config.valid_status_file_dir, 'w') as f:
-                f.write(f"Validation status : {validation_status}\n")
-                if not validation_status:
-                    f.write("Missing paths :\n")
-                    for path in missing:
-                        f.write(f"- {path}\n")
-
-            return validation_status
+            pairs, orphan_labels = self._collect_pairs()
+            files, pending       = {}, []
+            for key, (image_path, label_path) in pairs.items():
+                image_sig, label_sig = _signature(image_path), _signature(label_path)
+                old                  = old_files.get(key)
+                if old and old["image"] == image_sig and old["label"] == label_sig:
+                    files[key] = old
+                else:
+                    files[key] = {"image": image_sig, "label": label_sig}
+                    pending.append(key)
+
+            logger.info(f"Validating {len(pending)} changed of {len(pairs)} image/label pairs")
+            for key, entry in zip(pending, self._check_parallel([pairs[key] for key in pending], num_classes)):
+                files[key].update(entry)
+
+            write_json_file(config.manifest_file_path, {"num_classes": num_classes, "files": files}, indent=None)
+
+            # Summarize from the full manifest, reused entries included
+            class_counts  = Counter()
+            errors        = []
+            for key, entry in files.items():
+                for cls, count in entry["classes"].items():
+                    class_counts[names.get(int(cls), cls)] += count
+                errors.extend(f"{key}: {error}" for error in entry["errors"])
+
+            orphan_images = [key for key, entry in files.items() if entry["label"] is None]
+
+            return {
+                        "images"        : len(files),
+                        "error_pairs"   : sum(1 for entry in files.values() if entry["errors"]),
+                        "boxes"         : sum(class_counts.values()),
+                        "rechecked"     : len(pending),
+                        "class_counts"  : dict(class_counts),
+                        "errors"        : errors,
+                        "orphan_images" : orphan_images,
+                        "orphan_labels" : orphan_labels,
+                   }
 
         except Exception as e:
             raise AppException(e, sys)
 
+    def _check_parallel(self, jobs: list, num_classes: int) -> list:
+        workers = min(self.data_validation_config.workers or os.cpu_count() or 1, len(jobs))
+        if workers <= 1:
+            return _check_pairs(jobs, num_classes)
+
+        # Chunks amortize process hand-off; spawn keeps serving threads out of the workers
+        size    = max(1, min(256, len(jobs) // (workers * 4)))
+        chunks  = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn")) as pool:
+            results = pool.map(_check_pairs, chunks, [num_classes] * len(chunks))
+            return [entry for chunk in results for entry in chunk]
+
+    # ─────────────────────────────────────────────────────────
+    # Write status, missing paths and content problems to
+    # status.txt for auditability
+    # ─────────────────────────────────────────────────────────
+    def write_status(self, validation_status: bool, missing: list, report: dict) -> None:
+        with open(self.data_validation_config.valid_status_file_dir, 'w') as f:
+            f.write(f"Validation status : {validation_status}\n")
+            if missing:
+                f.write("Missing paths :\n")
+                for path in missing:
+                    f.write(f"- {path}\n")
+            if report:
+                f.write(f"Images : {report['images']} ({report['rechecked']} re-checked)\n")
+                f.write(f"Boxes : {report['boxes']}\n")
+                f.write(f"Orphan images (no label) : {len(report['orphan_images'])}\n")
+                f.write(f"Orphan labels (no image) : {len(report['orphan_labels'])}\n")
+                f.write(f"Errors : {len(report['errors'])} in {report['error_pairs']} pair(s)"
+                        f" (tolerated share {self.data_validation_config.max_error_fraction:.2%})\n")
+                for error in report["errors"][:self.data_validation_config.max_reported_errors]:
+                    f.write(f"- {error}\n")
+
+    # ─────────────────────────────────────────────────────────
+    # Strict by default — one corrupt image or bad label line fails
+    # validation. With max_error_fraction > 0, up to that share of
+    # pairs may have errors; they are listed in status.txt, and
+    # Ultralytics drops corrupt pairs when it scans the dataset.
+    # ─────────────────────────────────────────────────────────
+    def errors_tolerated(self, report: dict) -> bool:
+        if not report["error_pairs"]:
+            return True
+
+        limit    = self.data_validation_config.max_error_fraction
+        fraction = report["error_pairs"] / max(report["images"], 1)
+        if limit > 0 and fraction <= limit:
+            logger.warning(
+                            f"{report['error_pairs']} of {report['images']} pairs have errors ({fraction:.2%}, "
+                            f"tolerated up to {limit:.2%}) — see {self.data_validation_config.valid_status_file_dir}"
+                          )
+            return True
+        return False
+
+    # ─────────────────────────────────────────────────────────
+    # Traceability record — archive hash plus member list read from
+    # the zip's central directory, a few KB instead of a full copy
+    # ─────────────────────────────────────────────────────────
+    def write_source_record(self) -> str:
+        try:
+            zip_file_path = self.data_ingestion_artifact.data_zip_file_path
+            checksum      = self.data_ingestion_artifact.data_zip_checksum or file_sha256(zip_file_path)
+
+            with zipfile.ZipFile(zip_file_path, "r") as zip_ref:
+                members = [
+                            {"name": info.filename, "size": info.file_size, "crc32": f"{info.CRC:08x}"}
+                            for info in zip_ref.infolist() if not info.is_dir()
+                          ]
+
+            record        = {
+                                "zip_file_path"      : zip_file_path,
+                                "sha256"             : checksum,
+                                "size"               : os.path.getsize(zip_file_path),
+                                "feature_store_path" : self.data_ingestion_artifact.feature_store_path,
+                                "member_count"       : len(members),
+                                "members"            : members,
+                            }
+            write_json_file(self.data_validation_config.source_file_path, record)
+
+            logger.info(f"Wrote dataset source record {self.data_validation_config.source_file_path} (sha256 {checksum[:12]})")
+            return self.data_validation_config.source_file_path
+
+        except Exception as e:
+            raise AppException(e, sys)
 
     # ─────────────────────────────────────────────────────────
     # Orchestrates validation and returns artifact
@@ -80,16 +298,37 @@ class DataValidation:
         logger.info("Starting data validation")
 
         try:
-            status   = self.validate_all_files_exist()
-            artifact = DataValidationArtifact(validation_status = status)
+            # Ensure validation directory exists for status logging
+            os.makedirs(self.data_validation_config.data_validation_dir, exist_ok=True)
+
+            missing  = self.missing_required_paths()
+            report   = self.validate_dataset_contents() if not missing else {}
+
+            # Corrupt images and bad labels fail validation beyond the tolerated
+            # share; orphans are reported only
+            status   = not missing and self.errors_tolerated(report)
+            if report and self.data_validation_config.fail_on_orphans:
+                status = status and not report["orphan_images"] and not report["orphan_labels"]
+
+            self.write_status(status, missing, report)
+
+            artifact = DataValidationArtifact(
+                                                validation_status  = status,
+                                                manifest_file_path = self.data_validation_config.manifest_file_path if report else "",
+                                                class_counts       = report.get("class_counts", {}),
+                                                image_count        = report.get("images", 0),
+                                                box_count          = report.get("boxes", 0),
+                                                error_count        = len(report.get("errors", [])),
+                                                orphan_count       = len(report.get("orphan_images", [])) + len(report.get("orphan_labels", [])),
+                                             )
 
             logger.info(f"Validation completed: {artifact}")
 
-            # Optionally copy zip file to working directory for traceability
+            # Record which archive was validated instead of copying it
             if status:
-                shutil.copy(self.data_ingestion_artifact.data_zip_file_path, os.getcwd())
+                self.write_source_record()
 
             return artifact
 
         except Exception as e:
-            raise AppException(e, sys)
\ No newline at end of file
+            raise AppException(e, sys)
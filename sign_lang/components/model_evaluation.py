@@ -0,0 +1,231 @@
+# ─────────────────────────────────────────────────────────────
+# Model Evaluation — Candidate vs Served Model, Promotion Gate
+# ─────────────────────────────────────────────────────────────
+
+import os
+import sys
+import glob
+import time
+import shutil
+from datetime                          import datetime
+
+import cv2
+import numpy as np
+from ultralytics                       import YOLO
+
+from sign_lang.logger                  import logger
+from sign_lang.exception               import AppException
+from sign_lang.utils.main_utils        import write_json_file
+from sign_lang.utils.image_cache       import open_image_cache
+from sign_lang.utils.cached_dataset    import MmapDetectionValidator, with_image_cache
+from sign_lang.entity.config_entity    import ModelEvaluationConfig
+from sign_lang.entity.artifacts_entity import (
+                                                DataIngestionArtifact,
+                                                ModelTrainerArtifact,
+                                                ModelEvaluationArtifact
+                                              )
+
+# ─────────────────────────────────────────────────────────────
+# Scores the newly trained candidate and the model app.py serves
+# on the same valid split, and replaces the served weights only
+# when the candidate clears every accuracy and latency threshold
+# ─────────────────────────────────────────────────────────────
+class ModelEvaluation:
+    def __init__(self, model_evaluation_config: ModelEvaluationConfig = ModelEvaluationConfig()):
+        try:
+            self.model_evaluation_config = model_evaluation_config
+        except Exception as e:
+            raise AppException(e, sys)
+
+    # ─────────────────────────────────────────────────────────
+    # mAP, precision/recall and per-class AP on the valid split —
+    # batched, with images read from the training mmap cache
+    # ─────────────────────────────────────────────────────────
+    def evaluate_accuracy(self, model_path: str, data_yaml_path: str, image_cache=None) -> dict:
+        try:
+            metrics   = YOLO(model_path, task="detect").val(
+                                                                data      = data_yaml_path,
+                                                                split     = "val",
+                                                                imgsz     = self.model_evaluation_config.image_size,
+                                                                batch     = self.model_evaluation_config.batch_size,
+                                                                device    = "cpu",
+                                                                plots     = False,
+                                                                verbose   = False,
+                                                                validator = with_image_cache(MmapDetectionValidator, image_cache)
+                                                           )
+            box       = metrics.box
+            per_class = {}
+            for i, c in enumerate(box.ap_class_index):
+                precision, recall, map50, map50_95 = box.class_result(i)
+                per_class[metrics.names[int(c)]]   = {
+                                                        "precision" : float(precision),
+                                                        "recall"    : float(recall),
+                                                        "map50"     : float(map50),
+                                                        "map50_95"  : float(map50_95),
+                                                     }
+
+            return {
+                        "map50"     : float(box.map50),
+                        "map50_95"  : float(box.map),
+                        "precision" : float(box.mp),
+                        "recall"    : float(box.mr),
+                        "per_class" : per_class,
+                   }
+
+        except Exception as e:
+            raise AppException(e, sys)
+
+    # ─────────────────────────────────────────────────────────
+    # Single-image CPU latency in milliseconds — frames are decoded
+    # up front so only the model (pre/post-processing included) is timed
+    # ─────────────────────────────────────────────────────────
+    def benchmark_latency(self, model_path: str, images: list) -> dict:
+        try:
+            model = YOLO(model_path, task="detect")
+            args  = dict(imgsz=self.model_evaluation_config.image_size, device="cpu", verbose=False)
+
+            # Warm up so one-off setup isn't counted
+            for image in images[:2]:
+                model.predict(image, **args)
+
+            timings = []
+            for image in images:
+                started = time.perf_counter()
+                model.predict(image, **args)
+                timings.append((time.perf_counter() - started) * 1000.0)
+
+            if not timings:
+                return {"mean": 0.0, "p50": 0.0, "p95": 0.0}
+            return {
+                        "mean" : float(np.mean(timings)),
+                        "p50"  : float(np.percentile(timings, 50)),
+                        "p95"  : float(np.percentile(timings, 95)),
+                   }
+
+        except Exception as e:
+            raise AppException(e, sys)
+
+    def evaluate_model(self, model_path: str, data_yaml_path: str, images: list, image_cache=None) -> dict:
+        metrics = self.evaluate_accuracy(model_path, data_yaml_path, image_cache)
+        metrics["latency_ms"] = self.benchmark_latency(model_path, images)
+        logger.info(
+                        f"{model_path}: mAP50-95 {metrics['map50_95']:.4f}, mAP50 {metrics['map50']:.4f}, "
+                        f"CPU latency {metrics['latency_ms']['mean']:.1f} ms"
+                   )
+        return metrics
+
+    # ─────────────────────────────────────────────────────────
+    # Promotion gate — returns (accepted, reasons); every check is
+    # listed so the report shows why a candidate passed or failed
+    # ─────────────────────────────────────────────────────────
+    def decide(self, candidate: dict, served: dict) -> tuple:
+        config  = self.model_evaluation_config
+        checks  = []
+
+        checks.append((
+                        candidate["map50_95"] >= config.min_map50_95,
+                        f"mAP50-95 {candidate['map50_95']:.4f} vs floor {config.min_map50_95:.4f}"
+                     ))
+        if config.max_latency_ms > 0:
+            checks.append((
+                            candidate["latency_ms"]["mean"] <= config.max_latency_ms,
+                            f"latency {candidate['latency_ms']['mean']:.1f} ms vs ceiling {config.max_latency_ms:.1f} ms"
+                         ))
+
+        if served:
+            gain     = candidate["map50_95"] - served["map50_95"]
+            slowdown = candidate["latency_ms"]["mean"] / served["latency_ms"]["mean"] - 1.0 if served["latency_ms"]["mean"] else 0.0
+            checks.append((
+                            gain >= config.min_improvement,
+                            f"mAP50-95 gain {gain:+.4f} over served vs required {config.min_improvement:+.4f}"
+                         ))
+            checks.append((
+                            slowdown <= config.max_slowdown,
+                            f"latency change {slowdown:+.1%} vs served, allowed {config.max_slowdown:+.1%}"
+                         ))
+        else:
+            checks.append((True, "no served model to compare against"))
+
+        accepted = all(passed for passed, _ in checks)
+        reasons  = [f"{'pass' if passed else 'fail'}: {reason}" for passed, reason in checks]
+        return accepted, reasons
+
+    # Copy next to the served weights, then rename — the serving
+    # ModelHolder never observes a partially written best.pt
+    def promote(self, candidate_path: str) -> None:
+        served_path = self.model_evaluation_config.served_model_path
+        os.makedirs(os.path.dirname(served_path), exist_ok=True)
+
+        tmp_path    = f"{served_path}.tmp"
+        shutil.copy(candidate_path, tmp_path)
+        os.replace(tmp_path, served_path)
+        logger.info(f"Promoted {candidate_path} to {served_path}")
+
+    # ─────────────────────────────────────────────────────────
+    # Orchestrates scoring, the promotion decision and the report
+    # ─────────────────────────────────────────────────────────
+    def initiate_model_evaluation(
+                                    self,
+                                    model_trainer_artifact  : ModelTrainerArtifact,
+                                    data_ingestion_artifact : DataIngestionArtifact,
+                                 ) -> ModelEvaluationArtifact:
+        logger.info("Starting model evaluation")
+
+        try:
+            config         = self.model_evaluation_config
+            candidate_path = model_trainer_artifact.trained_model_file_path
+            dataset_dir    = os.path.join(data_ingestion_artifact.feature_store_path, "Sign_Language_Images")
+            data_yaml_path = os.path.join(dataset_dir, "data.yaml")
+            image_paths    = sorted(glob.glob(os.path.join(dataset_dir, "valid", "images", "*")))[:config.benchmark_images]
+            images         = [image for image in (cv2.imread(path) for path in image_paths) if image is not None]
+            image_cache    = open_image_cache(model_trainer_artifact.image_cache_dir)     # decoded val images from training
+
+            os.makedirs(config.model_evaluation_dir, exist_ok=True)
+
+            candidate_metrics = self.evaluate_model(candidate_path, data_yaml_path, images, image_cache)
+            served_metrics    = {}
+            if os.path.exists(config.served_model_path):
+                served_metrics = self.evaluate_model(config.served_model_path, data_yaml_path, images, image_cache)
+
+            accepted, reasons = self.decide(candidate_metrics, served_metrics)
+            if accepted:
+                self.promote(candidate_path)
+            else:
+                logger.warning(f"Candidate {candidate_path} not promoted: {'; '.join(r for r in reasons if r.startswith('fail'))}")
+
+            write_json_file(
+                                config.report_file_path,
+                                {
+                                    "evaluated_at"      : datetime.now().isoformat(timespec="seconds"),
+                                    "candidate_path"    : candidate_path,
+                                    "served_model_path" : config.served_model_path,
+                                    "is_model_accepted" : accepted,
+                                    "reasons"           : reasons,
+                                    "thresholds"        : {
+                                                                "min_map50_95"    : config.min_map50_95,
+                                                                "min_improvement" : config.min_improvement,
+                                                                "max_latency_ms"  : config.max_latency_ms,
+                                                                "max_slowdown"    : config.max_slowdown,
+                                                          },
+                                    "image_size"        : config.image_size,
+                                    "benchmark_images"  : len(images),
+                                    "candidate"         : candidate_metrics,
+                                    "served"            : served_metrics,
+                                }
+                           )
+
+            artifact = ModelEvaluationArtifact(
+                                                    is_model_accepted = accepted,
+                                                    served_model_path = config.served_model_path,
+                                                    candidate_path    = candidate_path,
+                                                    report_file_path  = config.report_file_path,
+                                                    candidate_metrics = candidate_metrics,
+                                                    served_metrics    = served_metrics,
+                                                    reasons           = reasons
+                                              )
+
+            logger.info(f"Model evaluation completed: accepted={accepted}, {reasons}")
+            return artifact
+
+        except Exception as e:
+            raise AppException(e, sys)
@@ -0,0 +1,199 @@
+# ─────────────────────────────────────────────────────────────
+# Model Exporter — ONNX / OpenVINO / INT8 CPU Serving Artifacts
+# ─────────────────────────────────────────────────────────────
+
+import os
+import sys
+import glob
+import time
+import shutil
+from ultralytics                       import YOLO
+
+from sign_lang.logger                  import logger
+from sign_lang.exception               import AppException
+from sign_lang.utils.main_utils        import write_json_file
+from sign_lang.utils.image_cache       import open_image_cache
+from sign_lang.utils.cached_dataset    import MmapDetectionValidator, with_image_cache
+from sign_lang.entity.config_entity    import ModelExporterConfig
+from sign_lang.entity.artifacts_entity import (
+                                                DataIngestionArtifact,
+                                                ModelTrainerArtifact,
+                                                ModelEvaluationArtifact,
+                                                ModelExporterArtifact
+                                              )
+
+# Reference backend every export is compared against
+BASELINE_BACKEND = "pytorch"
+
+# Ultralytics export arguments per backend — dynamic axes so the
+# serving micro-batcher can send more than one image per call
+BACKEND_EXPORT_ARGS = {
+                        "onnx"          : {"format": "onnx",     "dynamic": True},
+                        "openvino"      : {"format": "openvino", "dynamic": True},
+                        "openvino_int8" : {"format": "openvino", "dynamic": True, "int8": True},   # PTQ calibrated on data.yaml val split
+                      }
+
+# ─────────────────────────────────────────────────────────────
+# Exports trained weights to CPU backends and records how much
+# accuracy each one gives up and how much faster it runs
+# ─────────────────────────────────────────────────────────────
+class ModelExporter:
+    def __init__(self, model_exporter_config: ModelExporterConfig = ModelExporterConfig()):
+        try:
+            self.model_exporter_config = model_exporter_config
+        except Exception as e:
+            raise AppException(e, sys)
+
+    # ─────────────────────────────────────────────────────────
+    # Export one backend and move it into the exporter directory
+    # ─────────────────────────────────────────────────────────
+    def export_backend(self, model_path: str, backend: str, data_yaml_path: str) -> str:
+        try:
+            export_args   = dict(BACKEND_EXPORT_ARGS[backend])
+            if export_args.get("int8"):
+                export_args["data"] = data_yaml_path
+
+            exported_path = YOLO(model_path).export(
+                                                        imgsz   = self.model_exporter_config.image_size,
+                                                        device  = "cpu",
+                                                        **export_args
+                                                   )
+
+            # Ultralytics writes next to best.pt — relocate so backends never collide
+            backend_dir   = os.path.join(self.model_exporter_config.model_exporter_dir, backend)
+            shutil.rmtree(backend_dir, ignore_errors=True)
+            os.makedirs(backend_dir, exist_ok=True)
+
+            final_path    = os.path.join(backend_dir, os.path.basename(str(exported_path).rstrip(os.sep)))
+            shutil.move(str(exported_path), final_path)
+
+            logger.info(f"Exported {backend} model to {final_path}")
+            return final_path
+
+        except Exception as e:
+            raise AppException(e, sys)
+
+    # ─────────────────────────────────────────────────────────
+    # mAP50-95 on the valid split
+    # ─────────────────────────────────────────────────────────
+    def evaluate_accuracy(self, model_path: str, data_yaml_path: str, image_cache=None) -> float:
+        try:
+            metrics = YOLO(model_path, task="detect").val(
+                                                            data      = data_yaml_path,
+                                                            split     = "val",
+                                                            imgsz     = self.model_exporter_config.image_size,
+                                                            batch     = 1,
+                                                            device    = "cpu",
+                                                            plots     = False,
+                                                            verbose   = False,
+                                                            validator = with_image_cache(MmapDetectionValidator, image_cache)
+                                                         )
+            return float(metrics.box.map)
+
+        except Exception as e:
+            raise AppException(e, sys)
+
+    # ─────────────────────────────────────────────────────────
+    # Mean single-image CPU latency in milliseconds
+    # ─────────────────────────────────────────────────────────
+    def benchmark_latency(self, model_path: str, image_paths: list) -> float:
+        try:
+            model = YOLO(model_path, task="detect")
+            args  = dict(imgsz=self.model_exporter_config.image_size, device="cpu", verbose=False)
+
+            # Warm up so one-off graph compilation isn't counted
+            for image_path in image_paths[:2]:
+                model.predict(image_path, **args)
+
+            started = time.perf_counter()
+            for image_path in image_paths:
+                model.predict(image_path, **args)
+
+            return (time.perf_counter() - started) / max(1, len(image_paths)) * 1000.0
+
+        except Exception as e:
+            raise AppException(e, sys)
+
+    # ─────────────────────────────────────────────────────────
+    # Orchestrates export + accuracy/speed comparison
+    # ─────────────────────────────────────────────────────────
+    def initiate_model_exporter(
+                                    self,
+                                    model_trainer_artifact    : ModelTrainerArtifact,
+                                    data_ingestion_artifact   : DataIngestionArtifact,
+                                    model_evaluation_artifact : ModelEvaluationArtifact = None,
+                               ) -> ModelExporterArtifact:
+        logger.info("Starting model export")
+
+        try:
+            config         = self.model_exporter_config
+            # Export what serving loads — the promoted weights, not the candidate file
+            model_path     = (
+                                model_evaluation_artifact.served_model_path if model_evaluation_artifact
+                                else model_trainer_artifact.trained_model_file_path
+                             )
+            dataset_dir    = os.path.join(data_ingestion_artifact.feature_store_path, "Sign_Language_Images")
+            data_yaml_path = os.path.join(dataset_dir, "data.yaml")
+            image_paths    = sorted(glob.glob(os.path.join(dataset_dir, "valid", "images", "*")))[:config.benchmark_images]
+            image_cache    = open_image_cache(model_trainer_artifact.image_cache_dir)     # decoded val images from training
+
+            os.makedirs(config.model_exporter_dir, exist_ok=True)
+
+            # Baseline — the PyTorch weights exactly as trained
+            baseline_map     = self.evaluate_accuracy(model_path, data_yaml_path, image_cache)
+            baseline_latency = self.benchmark_latency(model_path, image_paths)
+
+            exported_models  = {BASELINE_BACKEND: model_path}
+            backend_metrics  = {
+                                    BASELINE_BACKEND: {
+                                                        "map50_95"       : baseline_map,
+                                                        "accuracy_delta" : 0.0,
+                                                        "latency_ms"     : baseline_latency,
+                                                        "speedup"        : 1.0,
+                                                      }
+                               }
+
+            for backend in config.backends:
+                # Optional runtimes (onnx, openvino) may be missing — skip, don't fail training
+                try:
+                    exported_path = self.export_backend(model_path, backend, data_yaml_path)
+                    backend_map   = self.evaluate_accuracy(exported_path, data_yaml_path, image_cache)
+                    latency       = self.benchmark_latency(exported_path, image_paths)
+                except Exception as e:
+                    logger.warning(f"Skipping {backend} export: {e}")
+                    continue
+
+                exported_models[backend] = exported_path
+                backend_metrics[backend] = {
+                                                "map50_95"       : backend_map,
+                                                "accuracy_delta" : backend_map - baseline_map,
+                                                "latency_ms"     : latency,
+                                                "speedup"        : baseline_latency / latency if latency else 0.0,
+                                           }
+                logger.info(f"{backend}: {backend_metrics[backend]}")
+
+            # Report consumed by serving to pick the fastest acceptable backend
+            model_stat = os.stat(model_path)
+            write_json_file(
+                                config.report_file_path,
+                                {
+                                    "source_model_path" : model_path,
+                                    "source_signature"  : [model_stat.st_mtime_ns, model_stat.st_size],
+                                    "image_size"        : config.image_size,
+                                    "max_accuracy_drop" : config.max_accuracy_drop,
+                                    "models"            : exported_models,
+                                    "metrics"           : backend_metrics,
+                                }
+                           )
+
+            artifact = ModelExporterArtifact(
+                                                report_file_path = config.report_file_path,
+                                                exported_models  = exported_models,
+                                                backend_metrics  = backend_metrics
+                                            )
+
+            logger.info(f"Model export completed: {artifact}")
+            return artifact
+
+        except Exception as e:
+            raise AppException(e, sys)
@@ -5,50 +5,148 @@
 import os
 import sys
 import shutil
-from ultralytics                       import YOLO
+from ultralytics                        import YOLO
 
-from sign_lang.logger                  import logger
-from sign_lang.exception               import AppException
-from sign_lang.entity.config_entity    import ModelTrainerConfig
-from sign_lang.entity.artifacts_entity import ModelTrainerArtifact
-from sign_lang.entity.artifacts_entity import DataIngestionArtifact
+from sign_lang.logger                   import logger
+from sign_lang.exception                import AppException
+from sign_lang.entity.config_entity     import ModelTrainerConfig
+from sign_lang.entity.artifacts_entity  import ModelTrainerArtifact
+from sign_lang.entity.artifacts_entity  import DataIngestionArtifact, DataValidationArtifact
+from sign_lang.utils.image_cache        import image_cache_key, list_dataset_images, build_image_cache
+from sign_lang.utils.cached_dataset     import MmapDetectionTrainer, with_image_cache
+from sign_lang.utils.training_resources import (
+                                                    host_profile,
+                                                    dataset_profile,
+                                                    choose_training_resources,
+                                                    peak_memory_mb,
+                                                    ultralytics_cache_arg,
+                                                    log_choice,
+                                                    CACHE_MMAP,
+                                                    CACHE_NONE
+                                               )
 # ─────────────────────────────────────────────────────────────
 # Trains YOLOv11 model using Ultralytics interface
 # ─────────────────────────────────────────────────────────────
 class ModelTrainer:
-    def __init__(self, model_trainer_config: ModelTrainerConfig):
+    # callbacks — optional {ultralytics event: fn(trainer)}, e.g. per-epoch progress reporting
+    def __init__(self, model_trainer_config: ModelTrainerConfig, callbacks: dict = None):
         self.model_trainer_config = model_trainer_config
+        self.callbacks            = callbacks or {}
+
+    # ─────────────────────────────────────────────────────────
+    # Batch, workers and cache — from config, or auto-tuned to
+    # the host's RAM/cores and the dataset size
+    # ─────────────────────────────────────────────────────────
+    def tune_resources(self, dataset_dir: str, data_yaml_path: str) -> dict:
+        config = self.model_trainer_config
+        if not config.auto_tune:
+            return {"batch": config.batch_size, "workers": config.workers, "cache": config.cache, "reasons": ["auto-tune disabled"]}
+
+        host    = host_profile(dataset_dir)
+        dataset = dataset_profile(dataset_dir)
+        choice  = choose_training_resources(
+                                                host            = host,
+                                                dataset         = dataset,
+                                                image_size      = config.image_size,
+                                                ram_fraction    = config.ram_fraction,
+                                                bytes_per_pixel = config.bytes_per_pixel,
+                                                max_batch       = config.max_batch_size,
+                                                max_workers     = config.workers,
+                                                mmap            = config.image_cache,
+                                            )
+        if config.probe and choice["batch"] > 0:
+            self.probe(data_yaml_path, choice)
+
+        log_choice(choice)
+        return {**choice, "host": host, "dataset": dataset}
+
+    # ─────────────────────────────────────────────────────────
+    # Short training run on a slice of the data — halves the batch
+    # until one epoch completes without running out of memory
+    # ─────────────────────────────────────────────────────────
+    def probe(self, data_yaml_path: str, choice: dict) -> None:
+        config = self.model_trainer_config
+        while True:
+            try:
+                YOLO(config.weight_name).train(
+                                                data     = data_yaml_path,
+                                                epochs   = 1,
+                                                batch    = choice["batch"],
+                                                workers  = choice["workers"],
+                                                imgsz    = config.image_size,
+                                                cache    = False,
+                                                fraction = config.probe_fraction,
+                                                val      = False,
+                                                plots    = False,
+                                                project  = os.path.join(config.model_trainer_dir, "probe"),
+                                                name     = "probe",
+                                                exist_ok = True,
+                                              )
+                choice["reasons"].append(f"probe: batch={choice['batch']} completed, peak {peak_memory_mb():.0f} MB")
+                return
+            except (MemoryError, RuntimeError) as e:
+                if choice["batch"] <= 1 or not (isinstance(e, MemoryError) or "memory" in str(e).lower()):
+                    raise
+                choice["reasons"].append(f"probe: batch={choice['batch']} ran out of memory, halving")
+                choice["batch"] //= 2
+
+    # ─────────────────────────────────────────────────────────
+    # Open (or build once) the mmap image cache for this dataset
+    # version and imgsz; None falls back to per-epoch decoding
+    # ─────────────────────────────────────────────────────────
+    def prepare_image_cache(self, dataset_dir: str, data_validation_artifact: DataValidationArtifact = None):
+        image_paths   = list_dataset_images(dataset_dir)
+        manifest_path = data_validation_artifact.manifest_file_path if data_validation_artifact else None
+        key           = image_cache_key(image_paths, self.model_trainer_config.image_size, manifest_path)
+
+        return build_image_cache(self.model_trainer_config.image_cache_dir, key, image_paths, self.model_trainer_config.image_size)
 
     # ─────────────────────────────────────────────────────────
     # Entry point for training — returns model artifact
     # ─────────────────────────────────────────────────────────
-    def initiate_model_trainer(self, data_ingestion_artifact: DataIngestionArtifact) -> ModelTrainerArtifact:
+    def initiate_model_trainer(
+                                self,
+                                data_ingestion_artifact  : DataIngestionArtifact,
+                                data_validation_artifact : DataValidationArtifact = None
+                              ) -> ModelTrainerArtifact:
         logger.info("Starting YOLOv11 training")
 
         try:
             # Load pretrained model
             model          = YOLO(self.model_trainer_config.weight_name)
+            for event, callback in self.callbacks.items():
+                model.add_callback(event, callback)
 
             # Path to data.yaml file
-            data_yaml_path = os.path.join(
-                                            data_ingestion_artifact.feature_store_path,
-                                            "Sign_Language_Images",
-                                            "data.yaml"
-                                         )
+            dataset_dir    = os.path.join(data_ingestion_artifact.feature_store_path, "Sign_Language_Images")
+            data_yaml_path = os.path.join(dataset_dir, "data.yaml")
+
+            # Size batch/workers/cache before the (long) real run
+            resources      = self.tune_resources(dataset_dir, data_yaml_path)
 
+            image_cache    = None
+            if resources["cache"] == CACHE_MMAP:
+                image_cache = self.prepare_image_cache(dataset_dir, data_validation_artifact)
+                if image_cache is None:
+                    resources["cache"] = CACHE_NONE
 
             # Train using data.yaml and config params
             model.train(
-                            data   = data_yaml_path,
-                            epochs = self.model_trainer_config.no_epochs,
-                            batch  = self.model_trainer_config.batch_size,
-                            imgsz  = 416,
-                            name   = "yolov11_sign_language",
-                            cache  = True
+                            data    = data_yaml_path,
+                            epochs  = self.model_trainer_config.no_epochs,
+                            batch   = resources["batch"],
+                            workers = resources["workers"],
+                            imgsz   = self.model_trainer_config.image_size,
+                            name    = "yolov11_sign_language",
+                            cache   = ultralytics_cache_arg(resources["cache"]),
+                            trainer = with_image_cache(MmapDetectionTrainer, image_cache)
                         )
 
             # Log training configuration for traceability
-            logger.info(f"Training config — epochs: {self.model_trainer_config.no_epochs}, batch size: {self.model_trainer_config.batch_size}")
+            logger.info(
+                            f"Training config — epochs: {self.model_trainer_config.no_epochs}, batch size: {resources['batch']}, "
+                            f"workers: {resources['workers']}, cache: {resources['cache']}, peak memory: {peak_memory_mb():.0f} MB"
+                       )
             
             # Dynamically locate best.pt from YOLO's save_dir
             output_dir       = model.trainer.save_dir                        # Automatically set by Ultralytics
@@ -57,16 +155,29 @@ class ModelTrainer:
             # Save to model_trainer_dir
             os.makedirs(self.model_trainer_config.model_trainer_dir, exist_ok=True)
             
-            final_model_path = os.path.join(self.model_trainer_config.model_trainer_dir, "best.pt")
+            # Candidate only — ModelEvaluation decides whether it replaces the served best.pt
+            final_model_path = os.path.join(self.model_trainer_config.model_trainer_dir, self.model_trainer_config.candidate_file)
             
             # Ensure best.pt exists before attempting to copy
             if not os.path.exists(best_model_path):
                 raise AppException(f"Training failed: best.pt not found at {best_model_path}", sys)
             
-            shutil.copy(best_model_path, final_model_path)
+            # Copy next to the target, then rename — a reused stage never
+            # points at a partially written candidate
+            tmp_model_path   = f"{final_model_path}.tmp"
+            shutil.copy(best_model_path, tmp_model_path)
+            os.replace(tmp_model_path, final_model_path)
 
             # Return artifact
-            artifact         = ModelTrainerArtifact(trained_model_file_path=final_model_path)
+            artifact         = ModelTrainerArtifact(
+                                                        trained_model_file_path = final_model_path,
+                                                        batch_size              = resources["batch"],
+                                                        workers                 = resources["workers"],
+                                                        cache_mode              = resources["cache"],
+                                                        image_cache_dir         = image_cache.cache_dir if image_cache else "",
+                                                        peak_memory_mb          = round(peak_memory_mb(), 1),
+                                                        tuning                  = {key: value for key, value in resources.items() if key not in ("batch", "workers", "cache")}
+                                                   )
             logger.info(f"Model training completed: {artifact}")
             return artifact
 
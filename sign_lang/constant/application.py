@@ -1,2 +1,83 @@
+import os
+
 APP_HOST = "0.0.0.0"
-APP_PORT = 8080
\ No newline at end of file
+APP_PORT = 8080
+
+# ─────────────────────────────────────────────────────────────
+# Serving — Model Location + Hot Reload
+# ─────────────────────────────────────────────────────────────
+APP_MODEL_PATH                  : str   = os.path.join("artifacts", "model_trainer", "best.pt")   # weights served by /predict and /live
+APP_MODEL_RELOAD_CHECK_INTERVAL : float = 2.0                                                     # seconds between best.pt mtime checks
+APP_EXPORT_REPORT_PATH          : str   = os.path.join("artifacts", "model_exporter", "export_report.json")
+APP_MODEL_BACKEND               : str   = os.getenv("APP_MODEL_BACKEND", "auto")                  # auto | pytorch | onnx | openvino | openvino_int8
+APP_MODEL_WARMUP                : bool  = os.getenv("APP_MODEL_WARMUP", "1") == "1"                # one blank inference before a model is served
+APP_MODEL_DEFAULT_IMAGE_SIZE    : int   = 640                                                     # Ultralytics predict size when the model sets none
+
+# ─────────────────────────────────────────────────────────────
+# Serving — Dynamic Micro-Batching for /predict
+# ─────────────────────────────────────────────────────────────
+APP_BATCH_MAX_SIZE              : int   = int(os.getenv("APP_BATCH_MAX_SIZE", 8))          # images per batched predict call
+APP_BATCH_MAX_DELAY_MS          : float = float(os.getenv("APP_BATCH_MAX_DELAY_MS", 10))  # max time a request waits for batch-mates
+
+# ─────────────────────────────────────────────────────────────
+# Serving — Inference Worker Processes for /predict
+# ─────────────────────────────────────────────────────────────
+APP_INFERENCE_WORKERS           : int   = int(os.getenv("APP_INFERENCE_WORKERS", 0))       # worker processes, 0 = in-process micro-batcher
+APP_INFERENCE_WORKER_THREADS    : int   = int(os.getenv("APP_INFERENCE_WORKER_THREADS", 0))  # torch threads per worker, 0 = usable cores / workers
+APP_INFERENCE_WORKER_PIN        : bool  = os.getenv("APP_INFERENCE_WORKER_PIN", "1") == "1"  # give each worker its own cores
+
+# ─────────────────────────────────────────────────────────────
+# Serving — Live Stream Pipeline (/live)
+# ─────────────────────────────────────────────────────────────
+APP_LIVE_SOURCE                 : str   = os.getenv("APP_LIVE_SOURCE", "0")                # webcam index or video file path
+APP_LIVE_PACE_FILE_SOURCES      : bool  = os.getenv("APP_LIVE_PACE_FILE_SOURCES", "1") == "1"  # replay video files at native FPS
+APP_LIVE_JPEG_QUALITY           : int   = int(os.getenv("APP_LIVE_JPEG_QUALITY", 80))      # MJPEG frame quality
+APP_LIVE_MAX_SIZE               : int   = int(os.getenv("APP_LIVE_MAX_SIZE", 0))           # longest MJPEG side in px, 0 = native
+
+# Motion gating — skip inference on unchanged frames, track boxes in between
+APP_LIVE_MOTION_GATE            : bool  = os.getenv("APP_LIVE_MOTION_GATE", "1") == "1"
+APP_LIVE_MOTION_THRESHOLD       : float = float(os.getenv("APP_LIVE_MOTION_THRESHOLD", 0.02))      # fraction of changed pixels
+APP_LIVE_MOTION_PIXEL_DELTA     : int   = int(os.getenv("APP_LIVE_MOTION_PIXEL_DELTA", 25))        # intensity change counted as motion
+APP_LIVE_MAX_KEYFRAME_INTERVAL  : int   = int(os.getenv("APP_LIVE_MAX_KEYFRAME_INTERVAL", 15))     # forced refresh every N frames
+
+# ─────────────────────────────────────────────────────────────
+# Serving — WebSocket Frames from Client Cameras
+# ─────────────────────────────────────────────────────────────
+APP_WS_ENABLED                  : bool  = os.getenv("APP_WS_ENABLED", "1") == "1"          # start the WebSocket server next to Flask
+APP_WS_PORT                     : int   = int(os.getenv("APP_WS_PORT", 8765))
+APP_WS_MAX_CONNECTIONS          : int   = int(os.getenv("APP_WS_MAX_CONNECTIONS", 32))     # further connections are closed with 1013
+APP_WS_MAX_IN_FLIGHT            : int   = int(os.getenv("APP_WS_MAX_IN_FLIGHT", 1))        # frames per connection being inferred at once
+APP_WS_MAX_MESSAGE_BYTES        : int   = int(os.getenv("APP_WS_MAX_MESSAGE_BYTES", 2 * 1024 * 1024))  # largest accepted frame
+
+# ─────────────────────────────────────────────────────────────
+# Serving — Two-Stage ROI Inference (/predict?roi=1 and /live)
+# ─────────────────────────────────────────────────────────────
+APP_ROI_INFERENCE               : bool  = os.getenv("APP_ROI_INFERENCE", "0") == "1"       # /predict default (?roi= overrides) and /live mode
+APP_ROI_COARSE_IMAGE_SIZE       : int   = int(os.getenv("APP_ROI_COARSE_IMAGE_SIZE", 256))   # hand-finding pass
+APP_ROI_FINE_IMAGE_SIZE         : int   = int(os.getenv("APP_ROI_FINE_IMAGE_SIZE", 416))     # crop pass, the training resolution
+APP_ROI_COARSE_CONF             : float = 0.05                                             # low, so faint hands still become regions
+APP_ROI_CONF                    : float = 0.25                                             # final detection threshold
+APP_ROI_PAD                     : float = 0.3                                              # context added around each region, per side
+APP_ROI_MAX_REGIONS             : int   = 2                                                # crops per frame (two hands)
+APP_ROI_NMS_IOU                 : float = 0.5                                              # merging detections from overlapping crops
+
+# ─────────────────────────────────────────────────────────────
+# Serving — Response Modes
+# ─────────────────────────────────────────────────────────────
+APP_JPEG_QUALITY                : int   = 95                                               # default /predict image quality
+APP_DETECTIONS_JSON_MIMETYPE    : str   = "application/vnd.signlang.detections+json"       # Accept value for JSON detections
+APP_DETECTIONS_BINARY_MIMETYPE  : str   = "application/octet-stream"                       # Accept value for packed detections
+
+# ─────────────────────────────────────────────────────────────
+# Serving — Content-Addressed Result Cache (/predict)
+# ─────────────────────────────────────────────────────────────
+APP_RESULT_CACHE_MAX_BYTES      : int   = int(os.getenv("APP_RESULT_CACHE_MAX_BYTES", 64 * 1024 * 1024))   # 0 disables the cache
+APP_RESULT_CACHE_TTL_SECONDS    : float = float(os.getenv("APP_RESULT_CACHE_TTL_SECONDS", 300))           # entry lifetime
+
+# ─────────────────────────────────────────────────────────────
+# Training Jobs — Background /train Runs
+# ─────────────────────────────────────────────────────────────
+APP_TRAIN_THREADS               : int   = int(os.getenv("APP_TRAIN_THREADS", max(1, (os.cpu_count() or 2) // 2)))  # CPU cores/threads for training
+APP_TRAIN_NICE                  : int   = int(os.getenv("APP_TRAIN_NICE", 10))             # scheduling niceness of the training process
+APP_TRAIN_CANCEL_GRACE_SECONDS  : float = float(os.getenv("APP_TRAIN_CANCEL_GRACE_SECONDS", 30))  # wait for an epoch boundary before terminating
+APP_TRAIN_JOB_HISTORY           : int   = 20                                               # finished jobs kept for status queries
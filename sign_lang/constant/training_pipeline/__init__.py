@@ -5,12 +5,20 @@
 # Root directory for all pipeline artifacts
 ARTIFACTS_DIR: str                        = "artifacts"
 
+# Fingerprint records for skipping unchanged stages (under ARTIFACTS_DIR)
+STAGE_CACHE_DIR_NAME: str                 = ".stage_cache"
+
 # ─────────────────────────────────────────────────────────────
 # Data Ingestion
 # ─────────────────────────────────────────────────────────────
 DATA_INGESTION_DIR_NAME             : str = "data_ingestion"                 # ingestion stage folder
 DATA_INGESTION_FEATURE_STORE_DIR    : str = "feature_store"                  # raw data storage
 DATA_DOWNLOAD_URL                   : str = "https://drive.google.com/file/d/1VJ8fl31MvTpDvA8w9TScMCmuhiwr_ozq/view?usp=sharing"
+DATA_DOWNLOAD_SHA256                : str = ""                               # expected archive digest, empty = pin first download
+DATA_DOWNLOAD_CACHE_DIR             : str = "download_cache"                 # content-addressed archive cache
+DATA_DOWNLOAD_FILE_NAME             : str = "data.zip"                       # archive name inside a cache entry
+DATA_INGESTION_MARKER_FILE          : str = ".ingestion.json"                # extraction marker in the feature store
+DATA_INGESTION_EXTRACT_WORKERS      : int = 0                                # extraction processes, 0 = one per CPU
 
 # ─────────────────────────────────────────────────────────────
 # Data Validation
@@ -18,6 +26,13 @@ DATA_DOWNLOAD_URL                   : str = "https://drive.google.com/file/d/1VJ
 DATA_VALIDATION_DIR_NAME            : str = "data_validation"                # validation stage folder
 DATA_VALIDATION_STATUS_FILE         : str = "status.txt"                     # file to log validation status
 DATA_VALIDATION_ALL_REQUIRED_FILES        = ["train", "val", "data.yaml"]    # expected structure
+DATA_VALIDATION_SOURCE_FILE         : str = "dataset_source.json"            # archive hash + member list for traceability
+DATA_VALIDATION_MANIFEST_FILE       : str = "file_manifest.json"             # per-file checks, reused on later runs
+DATA_VALIDATION_SPLITS                    = ["train", "valid"]               # splits scanned for content checks
+DATA_VALIDATION_WORKERS             : int = 0                                # check processes, 0 = one per CPU
+DATA_VALIDATION_FAIL_ON_ORPHANS     : bool = False                           # orphan image/label pairs fail validation
+DATA_VALIDATION_MAX_REPORTED_ERRORS : int = 200                              # errors listed in status.txt
+DATA_VALIDATION_MAX_ERROR_FRACTION  : float = 0.0                            # share of pairs with errors tolerated, 0 = strict
 
 # ─────────────────────────────────────────────────────────────
 # Model Trainer
@@ -25,4 +40,40 @@ DATA_VALIDATION_ALL_REQUIRED_FILES        = ["train", "val", "data.yaml"]    # e
 MODEL_TRAINER_DIR_NAME              : str = "model_trainer"                  # training stage folder
 MODEL_TRAINER_PRETRAINED_WEIGHT_NAME: str = "yolo11s.pt"                     # base weights
 MODEL_TRAINER_NO_EPOCHS             : int = 50                               # training epochs
-MODEL_TRAINER_BATCH_SIZE            : int = 5                                # batch size
\ No newline at end of file
+MODEL_TRAINER_BATCH_SIZE            : int = 5                                # batch size when not auto-tuned
+MODEL_TRAINER_IMAGE_SIZE            : int = 416                              # training resolution
+MODEL_TRAINER_WORKERS               : int = 8                                # dataloader workers when not auto-tuned
+MODEL_TRAINER_CACHE                 : str = "ram"                            # ram | disk | mmap | none when not auto-tuned
+MODEL_TRAINER_IMAGE_CACHE           : bool = True                            # prefer the persistent mmap image cache
+MODEL_TRAINER_IMAGE_CACHE_DIR       : str = "image_cache"                    # pre-decoded images, under ARTIFACTS_DIR
+MODEL_TRAINER_AUTO_TUNE             : bool = True                            # size batch/workers/cache to the host
+MODEL_TRAINER_AUTO_TUNE_RAM_FRACTION: float = 0.6                            # share of available RAM training may use
+MODEL_TRAINER_BYTES_PER_PIXEL       : float = 600.0                          # CPU training memory per input pixel per sample
+MODEL_TRAINER_MAX_BATCH_SIZE        : int = 64                               # auto-tune upper bound
+MODEL_TRAINER_AUTO_TUNE_PROBE       : bool = False                           # confirm batch with a short probe run
+MODEL_TRAINER_PROBE_FRACTION        : float = 0.05                           # share of train images used by the probe
+MODEL_TRAINER_SERVED_MODEL_FILE     : str = "best.pt"                        # weights app.py serves, replaced only on promotion
+MODEL_TRAINER_CANDIDATE_MODEL_FILE  : str = "candidate.pt"                   # newly trained weights awaiting evaluation
+
+# ─────────────────────────────────────────────────────────────
+# Model Evaluation
+# ─────────────────────────────────────────────────────────────
+MODEL_EVALUATION_DIR_NAME           : str = "model_evaluation"               # evaluation stage folder
+MODEL_EVALUATION_REPORT_FILE        : str = "evaluation_report.json"         # metrics + promotion decision
+MODEL_EVALUATION_IMAGE_SIZE         : int = MODEL_TRAINER_IMAGE_SIZE         # validation/benchmark resolution
+MODEL_EVALUATION_BATCH_SIZE         : int = 16                               # validation batch, reads the mmap image cache
+MODEL_EVALUATION_BENCHMARK_IMAGES   : int = 20                               # valid images timed one at a time on CPU
+MODEL_EVALUATION_MIN_MAP50_95       : float = 0.0                            # absolute mAP50-95 floor for promotion
+MODEL_EVALUATION_MIN_IMPROVEMENT    : float = 0.0                            # mAP50-95 gain required over the served model
+MODEL_EVALUATION_MAX_LATENCY_MS     : float = 0.0                            # mean CPU latency ceiling, 0 = no ceiling
+MODEL_EVALUATION_MAX_SLOWDOWN       : float = 0.2                            # allowed slowdown vs the served model (0.2 = 20%)
+
+# ─────────────────────────────────────────────────────────────
+# Model Exporter
+# ─────────────────────────────────────────────────────────────
+MODEL_EXPORTER_DIR_NAME             : str = "model_exporter"                 # export stage folder
+MODEL_EXPORTER_REPORT_FILE          : str = "export_report.json"             # accuracy + speed per backend
+MODEL_EXPORTER_BACKENDS                   = ["onnx", "openvino", "openvino_int8"]   # CPU backends to produce
+MODEL_EXPORTER_IMAGE_SIZE           : int = MODEL_TRAINER_IMAGE_SIZE         # export/inference resolution
+MODEL_EXPORTER_BENCHMARK_IMAGES     : int = 20                               # valid images timed per backend
+MODEL_EXPORTER_MAX_ACCURACY_DROP    : float = 0.01                           # max mAP50-95 loss a backend may serve with
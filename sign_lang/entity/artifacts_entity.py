@@ -2,26 +2,61 @@
 # Artifact Entities — Outputs from Each Pipeline Stage
 # ─────────────────────────────────────────────────────────────
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 # ─────────────────────────────────────────────────────────────
 # Data Ingestion Artifact — Stores raw + extracted paths
 # ─────────────────────────────────────────────────────────────
 @dataclass
 class DataIngestionArtifact:
-    data_zip_file_path: str         # downloaded zip from Gdrive
+    data_zip_file_path: str         # verified zip in the download cache
     feature_store_path: str         # extracted dataset directory
+    data_zip_checksum : str = ""    # SHA-256 of the verified archive
 
 # ─────────────────────────────────────────────────────────────
 # Data Validation Artifact — Status flag for downstream gating
 # ─────────────────────────────────────────────────────────────
 @dataclass
 class DataValidationArtifact:
-    validation_status: bool         # True if structure is valid
+    validation_status  : bool                                   # True if structure and contents are valid
+    manifest_file_path : str  = ""                              # per-file check manifest
+    class_counts       : dict = field(default_factory=dict)     # boxes per class name
+    image_count        : int  = 0
+    box_count          : int  = 0
+    error_count        : int  = 0                               # corrupt images + invalid label lines
+    orphan_count       : int  = 0                               # images without labels + labels without images
 
 # ─────────────────────────────────────────────────────────────
 # Model Trainer Artifact — Path to trained YOLOv11 weights
 # ─────────────────────────────────────────────────────────────
 @dataclass
 class ModelTrainerArtifact:
-    trained_model_file_path: str    # final .pt file after training
+    trained_model_file_path: str                                # candidate .pt awaiting evaluation
+    batch_size             : int   = 0                          # batch used (-1 = AutoBatch)
+    workers                : int   = 0                          # dataloader workers used
+    cache_mode             : str   = ""                         # ram | disk | mmap | none
+    image_cache_dir        : str   = ""                         # mmap image cache used, reusable by evaluation
+    peak_memory_mb         : float = 0.0                        # peak RSS of trainer + dataloader workers
+    tuning                 : dict  = field(default_factory=dict) # host/dataset profile and auto-tune reasons
+
+# ─────────────────────────────────────────────────────────────
+# Model Evaluation Artifact — Candidate vs served model + decision
+# ─────────────────────────────────────────────────────────────
+@dataclass
+class ModelEvaluationArtifact:
+    is_model_accepted  : bool                                   # candidate passed every promotion threshold
+    served_model_path  : str                                    # weights serving after this stage
+    candidate_path     : str  = ""                              # weights that were evaluated
+    report_file_path   : str  = ""                              # evaluation_report.json
+    candidate_metrics  : dict = field(default_factory=dict)     # map50, map50_95, precision, recall, per_class, latency_ms
+    served_metrics     : dict = field(default_factory=dict)     # same for the previously served model, empty if none
+    reasons            : list = field(default_factory=list)     # why the candidate was or was not promoted
+
+# ─────────────────────────────────────────────────────────────
+# Model Exporter Artifact — CPU backends + accuracy/speed report
+# ─────────────────────────────────────────────────────────────
+@dataclass
+class ModelExporterArtifact:
+    report_file_path : str                                  # export_report.json consumed by serving
+    exported_models  : dict = field(default_factory=dict)   # backend -> exported model path
+    backend_metrics  : dict = field(default_factory=dict)   # backend -> map50_95, accuracy_delta, latency_ms, speedup
@@ -12,7 +12,8 @@ from   sign_lang.constant.training_pipeline import *
 # ─────────────────────────────────────────────────────────────
 @dataclass
 class TrainingPipelineConfig:
-    artifacts_dir: str = ARTIFACTS_DIR
+    artifacts_dir   : str = ARTIFACTS_DIR
+    stage_cache_dir : str = os.path.join(ARTIFACTS_DIR, STAGE_CACHE_DIR_NAME)
 
 training_pipeline_config: TrainingPipelineConfig = TrainingPipelineConfig()
 
@@ -24,22 +25,72 @@ class DataIngestionConfig:
     data_ingestion_dir      : str = os.path.join(training_pipeline_config.artifacts_dir, DATA_INGESTION_DIR_NAME)    
     feature_store_file_path : str = os.path.join(data_ingestion_dir, DATA_INGESTION_FEATURE_STORE_DIR)
     data_download_url       : str = DATA_DOWNLOAD_URL
+    data_download_sha256    : str = DATA_DOWNLOAD_SHA256
+    download_cache_dir      : str = os.path.join(training_pipeline_config.artifacts_dir, DATA_DOWNLOAD_CACHE_DIR)
+    extract_workers         : int = DATA_INGESTION_EXTRACT_WORKERS
 
 # ─────────────────────────────────────────────────────────────
 # Data Validation Config
 # ─────────────────────────────────────────────────────────────
 @dataclass
 class DataValidationConfig:
-    data_validation_dir   : str = os.path.join(training_pipeline_config.artifacts_dir, DATA_VALIDATION_DIR_NAME)
-    valid_status_file_dir : str = os.path.join(data_validation_dir, DATA_VALIDATION_STATUS_FILE)
-    required_file_list          = DATA_VALIDATION_ALL_REQUIRED_FILES
+    data_validation_dir   : str   = os.path.join(training_pipeline_config.artifacts_dir, DATA_VALIDATION_DIR_NAME)
+    valid_status_file_dir : str   = os.path.join(data_validation_dir, DATA_VALIDATION_STATUS_FILE)
+    source_file_path      : str   = os.path.join(data_validation_dir, DATA_VALIDATION_SOURCE_FILE)
+    manifest_file_path    : str   = os.path.join(data_validation_dir, DATA_VALIDATION_MANIFEST_FILE)
+    splits                : tuple = tuple(DATA_VALIDATION_SPLITS)
+    workers               : int   = DATA_VALIDATION_WORKERS
+    fail_on_orphans       : bool  = DATA_VALIDATION_FAIL_ON_ORPHANS
+    max_reported_errors   : int   = DATA_VALIDATION_MAX_REPORTED_ERRORS
+    max_error_fraction    : float = DATA_VALIDATION_MAX_ERROR_FRACTION
+    required_file_list            = DATA_VALIDATION_ALL_REQUIRED_FILES
 
 # ─────────────────────────────────────────────────────────────
 # Model Trainer Config
 # ─────────────────────────────────────────────────────────────
 @dataclass
 class ModelTrainerConfig:
-    model_trainer_dir : str = os.path.join(training_pipeline_config.artifacts_dir, MODEL_TRAINER_DIR_NAME)
-    weight_name       : str = MODEL_TRAINER_PRETRAINED_WEIGHT_NAME
-    no_epochs         : int = MODEL_TRAINER_NO_EPOCHS
-    batch_size        : int = MODEL_TRAINER_BATCH_SIZE
+    model_trainer_dir  : str   = os.path.join(training_pipeline_config.artifacts_dir, MODEL_TRAINER_DIR_NAME)
+    weight_name        : str   = MODEL_TRAINER_PRETRAINED_WEIGHT_NAME
+    no_epochs          : int   = MODEL_TRAINER_NO_EPOCHS
+    batch_size         : int   = MODEL_TRAINER_BATCH_SIZE
+    image_size         : int   = MODEL_TRAINER_IMAGE_SIZE
+    workers            : int   = MODEL_TRAINER_WORKERS
+    cache              : str   = MODEL_TRAINER_CACHE
+    image_cache        : bool  = MODEL_TRAINER_IMAGE_CACHE
+    image_cache_dir    : str   = os.path.join(training_pipeline_config.artifacts_dir, MODEL_TRAINER_IMAGE_CACHE_DIR)
+    auto_tune          : bool  = MODEL_TRAINER_AUTO_TUNE
+    ram_fraction       : float = MODEL_TRAINER_AUTO_TUNE_RAM_FRACTION
+    bytes_per_pixel    : float = MODEL_TRAINER_BYTES_PER_PIXEL
+    max_batch_size     : int   = MODEL_TRAINER_MAX_BATCH_SIZE
+    probe              : bool  = MODEL_TRAINER_AUTO_TUNE_PROBE
+    probe_fraction     : float = MODEL_TRAINER_PROBE_FRACTION
+    candidate_file     : str   = MODEL_TRAINER_CANDIDATE_MODEL_FILE
+
+# ─────────────────────────────────────────────────────────────
+# Model Evaluation Config
+# ─────────────────────────────────────────────────────────────
+@dataclass
+class ModelEvaluationConfig:
+    model_evaluation_dir : str   = os.path.join(training_pipeline_config.artifacts_dir, MODEL_EVALUATION_DIR_NAME)
+    report_file_path     : str   = os.path.join(model_evaluation_dir, MODEL_EVALUATION_REPORT_FILE)
+    served_model_path    : str   = os.path.join(training_pipeline_config.artifacts_dir, MODEL_TRAINER_DIR_NAME, MODEL_TRAINER_SERVED_MODEL_FILE)
+    image_size           : int   = MODEL_EVALUATION_IMAGE_SIZE
+    batch_size           : int   = MODEL_EVALUATION_BATCH_SIZE
+    benchmark_images     : int   = MODEL_EVALUATION_BENCHMARK_IMAGES
+    min_map50_95         : float = MODEL_EVALUATION_MIN_MAP50_95
+    min_improvement      : float = MODEL_EVALUATION_MIN_IMPROVEMENT
+    max_latency_ms       : float = MODEL_EVALUATION_MAX_LATENCY_MS
+    max_slowdown         : float = MODEL_EVALUATION_MAX_SLOWDOWN
+
+# ─────────────────────────────────────────────────────────────
+# Model Exporter Config
+# ─────────────────────────────────────────────────────────────
+@dataclass
+class ModelExporterConfig:
+    model_exporter_dir : str   = os.path.join(training_pipeline_config.artifacts_dir, MODEL_EXPORTER_DIR_NAME)
+    report_file_path   : str   = os.path.join(model_exporter_dir, MODEL_EXPORTER_REPORT_FILE)
+    backends           : tuple = tuple(MODEL_EXPORTER_BACKENDS)
+    image_size         : int   = MODEL_EXPORTER_IMAGE_SIZE
+    benchmark_images   : int   = MODEL_EXPORTER_BENCHMARK_IMAGES
+    max_accuracy_drop  : float = MODEL_EXPORTER_MAX_ACCURACY_DROP
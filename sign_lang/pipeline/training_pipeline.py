@@ -1,35 +1,55 @@
 # ─────────────────────────────────────────────────────────────
-# Training Pipeline — Orchestrates Ingestion, Validation, Training
+# Training Pipeline — Orchestrates Ingestion, Validation, Training, Evaluation, Export
 # ─────────────────────────────────────────────────────────────
 
 import sys
-from sign_lang.logger                     import logging
-from sign_lang.exception                  import AppException
+import time
+from sign_lang.logger                      import logging
+from sign_lang.exception                   import AppException
+from sign_lang.utils.stage_cache           import StageCache
+from sign_lang.utils                       import data_source
+from sign_lang.serving.instrumentation     import TRAIN_STAGE_SECONDS, TRAIN_STAGE_LAST_SECONDS
 
-from sign_lang.components.data_ingestion  import DataIngestion
-from sign_lang.components.data_validation import DataValidation
-from sign_lang.components.model_trainer   import ModelTrainer
+from sign_lang.components.data_ingestion   import DataIngestion
+from sign_lang.components.data_validation  import DataValidation
+from sign_lang.components.model_trainer    import ModelTrainer
+from sign_lang.components.model_evaluation import ModelEvaluation
+from sign_lang.components.model_exporter   import ModelExporter
 
-from sign_lang.entity.config_entity       import (
-                                                    DataIngestionConfig,
-                                                    DataValidationConfig,
-                                                    ModelTrainerConfig
-                                                 )
+from sign_lang.entity.config_entity        import (
+                                                     training_pipeline_config,
+                                                     DataIngestionConfig,
+                                                     DataValidationConfig,
+                                                     ModelTrainerConfig,
+                                                     ModelEvaluationConfig,
+                                                     ModelExporterConfig
+                                                  )
 
-from sign_lang.entity.artifacts_entity    import (
-                                                    DataIngestionArtifact,
-                                                    DataValidationArtifact,
-                                                    ModelTrainerArtifact
-                                                 )
+from sign_lang.entity.artifacts_entity     import (
+                                                     DataIngestionArtifact,
+                                                     DataValidationArtifact,
+                                                     ModelTrainerArtifact,
+                                                     ModelEvaluationArtifact,
+                                                     ModelExporterArtifact
+                                                  )
 
 # ─────────────────────────────────────────────────────────────
 # Pipeline Class — Entry Point for All Stages
 # ─────────────────────────────────────────────────────────────
 class TrainPipeline:
-    def __init__(self):
-        self.data_ingestion_config  = DataIngestionConfig()
-        self.data_validation_config = DataValidationConfig()
-        self.model_trainer_config   = ModelTrainerConfig()
+    # force     — stage names to re-run even when their fingerprint matches, or "all"
+    # callbacks — ultralytics trainer callbacks, {event: fn(trainer)}
+    # on_stage  — fn(stage, state, reason, seconds) called as stages run or are reused;
+    #             seconds is the stage duration on "finished"
+    def __init__(self, force: tuple = (), callbacks: dict = None, on_stage = None):
+        self.data_ingestion_config   = DataIngestionConfig()
+        self.data_validation_config  = DataValidationConfig()
+        self.model_trainer_config    = ModelTrainerConfig()
+        self.model_evaluation_config = ModelEvaluationConfig()
+        self.model_exporter_config   = ModelExporterConfig()
+        self.stage_cache             = StageCache(training_pipeline_config.stage_cache_dir, force)
+        self.callbacks               = callbacks or {}
+        self.on_stage                = on_stage or (lambda stage, state, reason="", seconds=None: None)
 
     # ─────────────────────────────────────────────────────────
     # Stage 1 — Data Ingestion
@@ -63,29 +83,162 @@ class TrainPipeline:
     # ─────────────────────────────────────────────────────────
     # Stage 3 — Model Training
     # ─────────────────────────────────────────────────────────    
-    def start_model_trainer(self, data_ingestion_artifact: DataIngestionArtifact) -> ModelTrainerArtifact:
+    def start_model_trainer(
+                                self,
+                                data_ingestion_artifact  : DataIngestionArtifact,
+                                data_validation_artifact : DataValidationArtifact = None
+                           ) -> ModelTrainerArtifact:
         try:
             logging.info("Starting model training")
-            trainer       = ModelTrainer(self.model_trainer_config)
-            artifact      = trainer.initiate_model_trainer(data_ingestion_artifact=data_ingestion_artifact)
+            trainer       = ModelTrainer(self.model_trainer_config, callbacks=self.callbacks)
+            artifact      = trainer.initiate_model_trainer(
+                                                            data_ingestion_artifact  = data_ingestion_artifact,
+                                                            data_validation_artifact = data_validation_artifact
+                                                          )
 
             logging.info(f"Model training completed: {artifact}")
             return artifact
         except Exception as e:
             raise AppException(e, sys)
 
+    # ─────────────────────────────────────────────────────────
+    # Stage 4 — Evaluate the Candidate and Gate Promotion
+    # ─────────────────────────────────────────────────────────
+    def start_model_evaluation(
+                                self,
+                                model_trainer_artifact  : ModelTrainerArtifact,
+                                data_ingestion_artifact : DataIngestionArtifact
+                              ) -> ModelEvaluationArtifact:
+        try:
+            logging.info("Starting model evaluation")
+            evaluation    = ModelEvaluation(self.model_evaluation_config)
+            artifact      = evaluation.initiate_model_evaluation(
+                                                                    model_trainer_artifact  = model_trainer_artifact,
+                                                                    data_ingestion_artifact = data_ingestion_artifact
+                                                                )
+
+            logging.info(f"Model evaluation completed: {artifact}")
+            return artifact
+        except Exception as e:
+            raise AppException(e, sys)
+
+    # ─────────────────────────────────────────────────────────
+    # Stage 5 — Export CPU Serving Backends
+    # ─────────────────────────────────────────────────────────
+    def start_model_exporter(
+                                self,
+                                model_trainer_artifact    : ModelTrainerArtifact,
+                                data_ingestion_artifact   : DataIngestionArtifact,
+                                model_evaluation_artifact : ModelEvaluationArtifact = None
+                            ) -> ModelExporterArtifact:
+        try:
+            logging.info("Starting model export")
+            exporter      = ModelExporter(self.model_exporter_config)
+            artifact      = exporter.initiate_model_exporter(
+                                                                model_trainer_artifact    = model_trainer_artifact,
+                                                                data_ingestion_artifact   = data_ingestion_artifact,
+                                                                model_evaluation_artifact = model_evaluation_artifact
+                                                            )
+
+            logging.info(f"Model export completed: {artifact}")
+            return artifact
+        except Exception as e:
+            raise AppException(e, sys)
+
+    # ─────────────────────────────────────────────────────────
+    # Run one stage and record how long it took → (artifact, seconds)
+    # ─────────────────────────────────────────────────────────
+    def _timed_stage(self, stage: str, fn, *args, **kwargs) -> tuple:
+        started  = time.perf_counter()
+        artifact = fn(*args, **kwargs)
+        elapsed  = time.perf_counter() - started
+
+        TRAIN_STAGE_SECONDS.observe(elapsed, stage=stage)
+        TRAIN_STAGE_LAST_SECONDS.set(elapsed, stage=stage)
+        logging.info(f"Stage {stage} finished in {elapsed:.1f}s")
+        return artifact, elapsed
+
+    # ─────────────────────────────────────────────────────────
+    # Reuse the stored artifact when the stage's fingerprint
+    # (config, upstream artifacts, component code) is unchanged,
+    # otherwise run it and record the new fingerprint
+    # ─────────────────────────────────────────────────────────
+    def _cached_stage(
+                        self,
+                        stage        : str,
+                        artifact_cls,
+                        config,
+                        upstream     : tuple,
+                        code         : tuple,
+                        fn,
+                        *args,
+                        store_if     = None,
+                        **kwargs
+                     ):
+        parts            = self.stage_cache.fingerprint(config, upstream, code)
+        artifact, reason = self.stage_cache.lookup(stage, parts, artifact_cls)
+
+        if artifact is not None:
+            logging.info(f"Stage {stage} reused: {reason}")
+            self.on_stage(stage, "reused", reason)
+            return artifact
+
+        logging.info(f"Stage {stage} running: {reason}")
+        self.on_stage(stage, "running", reason)
+        artifact, elapsed = self._timed_stage(stage, fn, *args, **kwargs)
+        self.on_stage(stage, "finished", seconds=elapsed)
+
+        if store_if is None or store_if(artifact):
+            self.stage_cache.store(stage, parts, artifact)
+        else:
+            self.stage_cache.invalidate(stage)
+        return artifact
+
     # ─────────────────────────────────────────────────────────
     # Pipeline Runner — Executes All Stages Sequentially
     # ─────────────────────────────────────────────────────────
     def run_pipeline(self) -> None:
         try:
-            ingestion_artifact  = self.start_data_ingestion()
-            validation_artifact = self.start_data_validation(ingestion_artifact)
+            ingestion_artifact  = self._cached_stage(
+                                                        "data_ingestion", DataIngestionArtifact, self.data_ingestion_config,
+                                                        (), (DataIngestion, data_source),
+                                                        self.start_data_ingestion
+                                                    )
+            validation_artifact = self._cached_stage(
+                                                        "data_validation", DataValidationArtifact, self.data_validation_config,
+                                                        (ingestion_artifact,), (DataValidation,),
+                                                        self.start_data_validation, ingestion_artifact,
+                                                        store_if = lambda artifact: artifact.validation_status
+                                                    )
 
             if validation_artifact.validation_status:
-                self.start_model_trainer(data_ingestion_artifact=ingestion_artifact)
+                trainer_artifact    = self._cached_stage(
+                                                        "model_trainer", ModelTrainerArtifact, self.model_trainer_config,
+                                                        (ingestion_artifact, validation_artifact), (ModelTrainer,),
+                                                        self.start_model_trainer, ingestion_artifact, validation_artifact
+                                                    )
+                evaluation_artifact = self._cached_stage(
+                                                        "model_evaluation", ModelEvaluationArtifact, self.model_evaluation_config,
+                                                        (trainer_artifact, ingestion_artifact), (ModelEvaluation,),
+                                                        self.start_model_evaluation, trainer_artifact, ingestion_artifact
+                                                    )
+
+                # A rejected candidate leaves the served model — and its exports — as they were
+                if evaluation_artifact.is_model_accepted:
+                    self._cached_stage(
+                                        "model_exporter", ModelExporterArtifact, self.model_exporter_config,
+                                        (trainer_artifact, ingestion_artifact, evaluation_artifact), (ModelExporter,),
+                                        self.start_model_exporter, trainer_artifact, ingestion_artifact, evaluation_artifact
+                                      )
+                else:
+                    logging.info(f"Skipping model export, candidate not promoted: {evaluation_artifact.reasons}")
             else:
-                raise Exception("Data validation failed: incorrect format")
+                raise Exception(
+                                    f"Data validation failed: {validation_artifact.error_count} content error(s), "
+                                    f"{validation_artifact.orphan_count} orphan file(s) — see "
+                                    f"{self.data_validation_config.valid_status_file_dir} and "
+                                    f"{validation_artifact.manifest_file_path or 'the missing paths listed there'}"
+                               )
 
         except Exception as e:
             raise AppException(e, sys)
\ No newline at end of file
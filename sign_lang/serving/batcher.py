@@ -0,0 +1,227 @@
+# ─────────────────────────────────────────────────────────────
+# Micro-Batcher — Coalesces Concurrent Requests into One predict()
+# ─────────────────────────────────────────────────────────────
+
+import time
+import queue
+import threading
+from collections                    import Counter, deque
+from concurrent.futures             import Future, InvalidStateError
+
+from sign_lang.logger                  import logger
+from sign_lang.serving.instrumentation import STAGE_SECONDS, BATCH_SIZE
+from sign_lang.constant.application    import APP_BATCH_MAX_SIZE, APP_BATCH_MAX_DELAY_MS
+
+# ─────────────────────────────────────────────────────────────
+# One queued image plus the future its caller is waiting on.
+# args are per-call predict arguments (imgsz, conf) as a hashable
+# key — only requests with equal args share a predict() call.
+# ─────────────────────────────────────────────────────────────
+class _PendingRequest:
+    __slots__ = ("image", "args", "future", "enqueued_at")
+
+    def __init__(self, image, args: tuple = ()):
+        self.image       = image
+        self.args        = args
+        self.future      = Future()
+        self.enqueued_at = time.perf_counter()
+
+# Group a collected batch by predict arguments, keeping arrival order
+def group_by_args(batch: list) -> dict:
+    groups = {}
+    for item in batch:
+        groups.setdefault(item.args, []).append(item)
+    return groups
+
+# Resolve a caller's future unless it is already settled or was
+# cancelled — one caller giving up must not fail its batch-mates
+def settle(future: Future, result=None, error: BaseException = None) -> None:
+    if future.done():
+        return
+    try:
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+    except InvalidStateError:
+        pass                                            # cancelled between the check and the set
+
+# ─────────────────────────────────────────────────────────────
+# Collects requests until the batch is full or the oldest request
+# has waited max_delay_ms, then runs a single batched predict
+# ─────────────────────────────────────────────────────────────
+class MicroBatcher:
+    def __init__(
+                    self,
+                    model_holder,
+                    max_batch_size : int   = APP_BATCH_MAX_SIZE,
+                    max_delay_ms   : float = APP_BATCH_MAX_DELAY_MS,
+                ):
+        self.model_holder    = model_holder
+        self.max_batch_size  = max(1, max_batch_size)
+        self.max_delay       = max(0.0, max_delay_ms) / 1000.0
+
+        self._queue          = queue.Queue()
+        self._worker         = None
+        self._start_lock     = threading.Lock()
+
+        # Counters — read by stats()
+        self._stats_lock     = threading.Lock()
+        self._batch_sizes    = Counter()                 # batch size -> number of batches
+        self._requests       = 0
+        self._wait_total     = 0.0
+        self._wait_max       = 0.0
+        self._recent_waits   = deque(maxlen=1024)        # window for percentiles
+
+    # Version of the model serving these batches, for cache invalidation
+    @property
+    def version(self) -> int:
+        return self.model_holder.version
+
+    # Loaded weights vs the weights on disk now — the result cache
+    # only serves hits while the two agree
+    @property
+    def signature(self):
+        return self.model_holder.signature
+
+    def current_signature(self):
+        return self.model_holder.current_signature()
+
+    # Backend of the loaded model — exported graphs have a fixed input size
+    @property
+    def backend(self):
+        return self.model_holder.backend
+
+    # Loaded and warmed up — /readyz
+    @property
+    def ready(self) -> bool:
+        return self.model_holder.ready
+
+    def readiness(self) -> dict:
+        return {"mode": "in_process", "ready": self.ready, "model": self.model_holder.status()}
+
+    # Start the batching thread and load the model in the background
+    def start(self) -> None:
+        self._ensure_started()
+        self.model_holder.load_in_background()
+
+    # ─────────────────────────────────────────────────────────
+    # Start the batching thread on first use
+    # ─────────────────────────────────────────────────────────
+    def _ensure_started(self) -> None:
+        if self._worker is not None:
+            return
+        with self._start_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+                self._worker.start()
+
+    # ─────────────────────────────────────────────────────────
+    # Enqueue one image — the future resolves to its own Results.
+    # predict_args (imgsz, conf) override the model defaults for it.
+    # ─────────────────────────────────────────────────────────
+    def submit(self, image, **predict_args) -> Future:
+        self._ensure_started()
+        pending = _PendingRequest(image, tuple(sorted(predict_args.items())))
+        self._queue.put(pending)
+        return pending.future
+
+    def predict(self, image, timeout: float = None, **predict_args):
+        return self.submit(image, **predict_args).result(timeout=timeout)
+
+    # Several images submitted together, so they can share a batch
+    def predict_many(self, images: list, timeout: float = None, **predict_args) -> list:
+        futures = [self.submit(image, **predict_args) for image in images]
+        return [future.result(timeout=timeout) for future in futures]
+
+    # ─────────────────────────────────────────────────────────
+    # Block for the first request, then gather batch-mates until
+    # the batch is full or the first request's deadline passes
+    # ─────────────────────────────────────────────────────────
+    def _collect_batch(self) -> list:
+        batch    = [self._queue.get()]
+        deadline = batch[0].enqueued_at + self.max_delay
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining <= 0:
+                    batch.append(self._queue.get_nowait())     # drain whatever is already waiting
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    # ─────────────────────────────────────────────────────────
+    # Worker loop — one predict() call per collected batch and
+    # distinct set of predict arguments
+    # ─────────────────────────────────────────────────────────
+    def _run(self) -> None:
+        while True:
+            # Requests cancelled while queued are dropped; the rest can no longer be cancelled
+            batch      = [item for item in self._collect_batch() if item.future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            started_at = time.perf_counter()
+            self._record(batch, started_at)
+
+            for args, items in group_by_args(batch).items():
+                try:
+                    with STAGE_SECONDS.time(path="batcher", stage="model_get"):
+                        self.model_holder.get()
+                    with STAGE_SECONDS.time(path="batcher", stage="inference"):
+                        results = self.model_holder.predict([item.image for item in items], **dict(args))
+
+                    for item, result in zip(items, results):
+                        settle(item.future, result)
+
+                except Exception as e:
+                    logger.error(f"Batched inference failed for {len(items)} request(s): {e}")
+                    for item in items:
+                        settle(item.future, error=e)
+
+    # ─────────────────────────────────────────────────────────
+    # Counters — batch-size distribution and queue wait time
+    # ─────────────────────────────────────────────────────────
+    def _record(self, batch: list, started_at: float) -> None:
+        waits = [started_at - item.enqueued_at for item in batch]
+
+        BATCH_SIZE.observe(len(batch))
+        for wait in waits:
+            STAGE_SECONDS.observe(wait, path="batcher", stage="queue_wait")
+
+        with self._stats_lock:
+            self._batch_sizes[len(batch)] += 1
+            self._requests                += len(batch)
+            self._wait_total              += sum(waits)
+            self._wait_max                 = max(self._wait_max, max(waits))
+            self._recent_waits.extend(waits)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            recent  = sorted(self._recent_waits)
+            batches = sum(self._batch_sizes.values())
+
+            def percentile(p: float) -> float:
+                if not recent:
+                    return 0.0
+                return recent[min(len(recent) - 1, int(p * len(recent)))] * 1000.0
+
+            return {
+                        "max_batch_size"     : self.max_batch_size,
+                        "max_delay_ms"       : self.max_delay * 1000.0,
+                        "requests"           : self._requests,
+                        "batches"            : batches,
+                        "mean_batch_size"    : self._requests / batches if batches else 0.0,
+                        "batch_size_counts"  : dict(sorted(self._batch_sizes.items())),
+                        "queue_depth"        : self._queue.qsize(),
+                        "queue_wait_ms"      : {
+                                                    "mean" : self._wait_total / self._requests * 1000.0 if self._requests else 0.0,
+                                                    "max"  : self._wait_max * 1000.0,
+                                                    "p50"  : percentile(0.50),
+                                                    "p95"  : percentile(0.95),
+                                                    "p99"  : percentile(0.99),
+                                               },
+                   }
@@ -0,0 +1,123 @@
+# ─────────────────────────────────────────────────────────────
+# Live Broadcaster — One Producer per Source, Many Viewers
+# ─────────────────────────────────────────────────────────────
+
+import threading
+from collections                      import Counter
+
+from sign_lang.logger                 import logger
+from sign_lang.serving.live_pipeline  import LivePipeline, LIVE_OUTPUT_MJPEG, parse_source
+
+# ─────────────────────────────────────────────────────────────
+# Shares a single LivePipeline between all viewers of a source,
+# whatever output kind they asked for — MJPEG and detections
+# viewers read different encodings of the same inferred frames.
+# The pipeline starts with the first subscriber and stops when
+# the last one leaves; each viewer reads the newest encoded frame
+# at its own pace, so a slow client skips frames instead of
+# holding back the producer or the other viewers.
+# ─────────────────────────────────────────────────────────────
+class LiveBroadcaster:
+    def __init__(self, batcher, source, roi_detector=None):
+        self.batcher       = batcher
+        self.roi_detector  = roi_detector
+        self.source        = parse_source(source)
+
+        self._lock         = threading.Lock()
+        self._pipeline     = None
+        self._subscribers  = Counter()     # viewers per output kind
+        self._skipped      = Counter()     # frames viewers skipped because they fell behind, per output kind
+
+    # Output kinds with at least one viewer (caller holds _lock)
+    def _watched(self) -> tuple:
+        return tuple(kind for kind, count in self._subscribers.items() if count > 0)
+
+    # ─────────────────────────────────────────────────────────
+    # Register a viewer — starts (or restarts) the producer, or
+    # adds the viewer's output kind to the running one.
+    # Called eagerly by the route so source errors surface early.
+    # ─────────────────────────────────────────────────────────
+    def attach(self, output: str = LIVE_OUTPUT_MJPEG) -> LivePipeline:
+        with self._lock:
+            if self._pipeline is not None and not self._pipeline.running:
+                self._pipeline.stop()                           # source ended — replace it
+                self._pipeline = None
+
+            if self._pipeline is None:
+                self._pipeline = LivePipeline(
+                                                self.batcher,
+                                                self.source,
+                                                outputs      = (*self._watched(), output),
+                                                roi_detector = self.roi_detector
+                                             ).start()
+
+            self._subscribers[output] += 1
+            self._pipeline.set_outputs(self._watched())
+            logger.info(f"Live {output} viewer joined {self.source!r} ({sum(self._subscribers.values())} watching)")
+            return self._pipeline
+
+    def detach(self, pipeline: LivePipeline, output: str = LIVE_OUTPUT_MJPEG) -> None:
+        with self._lock:
+            self._subscribers[output] = max(0, self._subscribers[output] - 1)
+            watching                  = sum(self._subscribers.values())
+            logger.info(f"Live {output} viewer left {self.source!r} ({watching} watching)")
+
+            if self._pipeline is not None:
+                if watching == 0:
+                    self._pipeline.stop()
+                    self._pipeline = None
+                else:
+                    self._pipeline.set_outputs(self._watched())
+
+            if pipeline is not self._pipeline and pipeline.running:
+                pipeline.stop()                                 # orphaned producer from a replaced source
+
+    # ─────────────────────────────────────────────────────────
+    # Per-viewer frame iterator — always jumps to the newest frame.
+    # The caller pairs every attach() with exactly one detach().
+    # ─────────────────────────────────────────────────────────
+    def stream(self, pipeline: LivePipeline, output: str = LIVE_OUTPUT_MJPEG):
+        seq = 0
+        while True:
+            got = pipeline.next_frame(seq, output)
+            if got is None:
+                if not pipeline.running:
+                    return
+                continue
+
+            new_seq, frame_bytes = got
+            if seq and new_seq > seq + 1:
+                self._skipped[output] += new_seq - seq - 1
+            seq = new_seq
+            yield frame_bytes
+
+    def stats(self) -> dict:
+        pipeline = self._pipeline
+        return {
+                    "source"        : str(self.source),
+                    "subscribers"   : dict(self._subscribers),
+                    "viewer_skipped": dict(self._skipped),
+                    "pipeline"      : pipeline.stats() if pipeline is not None else None,
+               }
+
+# ─────────────────────────────────────────────────────────────
+# One broadcaster per source, created on demand
+# ─────────────────────────────────────────────────────────────
+class BroadcasterRegistry:
+    def __init__(self, batcher, roi_detector=None):
+        self.batcher       = batcher
+        self.roi_detector  = roi_detector
+        self._lock         = threading.Lock()
+        self._broadcasters = {}
+
+    def get(self, source) -> LiveBroadcaster:
+        key = parse_source(source)
+        with self._lock:
+            if key not in self._broadcasters:
+                self._broadcasters[key] = LiveBroadcaster(self.batcher, key, roi_detector=self.roi_detector)
+            return self._broadcasters[key]
+
+    def stats(self) -> list:
+        with self._lock:
+            broadcasters = list(self._broadcasters.values())
+        return [broadcaster.stats() for broadcaster in broadcasters]
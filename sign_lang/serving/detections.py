@@ -0,0 +1,81 @@
+# ─────────────────────────────────────────────────────────────
+# Detections — Compact Result Payloads + Tunable Image Rendering
+# ─────────────────────────────────────────────────────────────
+
+import cv2
+import numpy as np
+
+from sign_lang.utils.main_utils         import encodeArrayIntoJpeg
+from sign_lang.serving.instrumentation  import STAGE_SECONDS
+
+# Packed layout: one little-endian float32 row per box
+DETECTION_BINARY_LAYOUT = "x1,y1,x2,y2,conf,cls;float32le"
+
+# ─────────────────────────────────────────────────────────────
+# Nx6 array [x1, y1, x2, y2, conf, cls] in original-image pixels
+# ─────────────────────────────────────────────────────────────
+def detections_array(result) -> np.ndarray:
+    boxes = result.boxes
+    if boxes is None or len(boxes) == 0:
+        return np.zeros((0, 6), dtype=np.float32)
+    return boxes.data[:, :6].cpu().numpy().astype(np.float32, copy=False)
+
+# ─────────────────────────────────────────────────────────────
+# Wrap an Nx6 detections array back into a Results object so it
+# renders and serializes like a fresh prediction
+# ─────────────────────────────────────────────────────────────
+def results_from_detections(orig_img: np.ndarray, names: dict, boxes: np.ndarray, path: str = ""):
+    import torch
+    from ultralytics.engine.results import Results
+
+    return Results(orig_img=orig_img, path=path, names=names, boxes=torch.from_numpy(boxes))
+
+# ─────────────────────────────────────────────────────────────
+# JSON-friendly detections — class, confidence and box only
+# ─────────────────────────────────────────────────────────────
+def detections_payload(result) -> dict:
+    height, width = result.orig_shape[:2]
+    names         = result.names
+
+    return {
+                "width"      : int(width),
+                "height"     : int(height),
+                "detections" : [
+                                    {
+                                        "cls"  : int(cls),
+                                        "name" : names.get(int(cls), str(int(cls))) if isinstance(names, dict) else str(int(cls)),
+                                        "conf" : round(float(conf), 4),
+                                        "box"  : [round(float(v), 1) for v in (x1, y1, x2, y2)],
+                                    }
+                                    for x1, y1, x2, y2, conf, cls in detections_array(result)
+                               ],
+           }
+
+# ─────────────────────────────────────────────────────────────
+# Packed binary detections — see DETECTION_BINARY_LAYOUT
+# ─────────────────────────────────────────────────────────────
+def pack_detections(result) -> bytes:
+    return np.ascontiguousarray(detections_array(result), dtype="<f4").tobytes()
+
+# ─────────────────────────────────────────────────────────────
+# Downscale so the longest side is at most max_size pixels
+# ─────────────────────────────────────────────────────────────
+def limit_resolution(image: np.ndarray, max_size: int = None) -> np.ndarray:
+    if not max_size:
+        return image
+
+    height, width = image.shape[:2]
+    scale         = max_size / max(height, width)
+    if scale >= 1.0:
+        return image
+
+    return cv2.resize(image, (max(1, round(width * scale)), max(1, round(height * scale))), interpolation=cv2.INTER_AREA)
+
+# ─────────────────────────────────────────────────────────────
+# Annotated JPEG at the requested quality and resolution
+# ─────────────────────────────────────────────────────────────
+def render_jpeg(result, quality: int = 95, max_size: int = None, path: str = "predict") -> bytes:
+    with STAGE_SECONDS.time(path=path, stage="plot"):
+        annotated = limit_resolution(result.plot(), max_size)
+    with STAGE_SECONDS.time(path=path, stage="encode"):
+        return encodeArrayIntoJpeg(annotated, quality)
@@ -0,0 +1,62 @@
+# ─────────────────────────────────────────────────────────────
+# Serving Instrumentation — Shared Hot-Path Metrics
+# ─────────────────────────────────────────────────────────────
+
+from sign_lang.utils.metrics import registry
+
+# Per-stage latency, labelled by hot path (predict, batch, batcher, live) and stage
+STAGE_SECONDS        = registry.histogram("sign_lang_stage_seconds",        "Latency of each serving stage in seconds")
+
+# Finished HTTP requests by route, response mode and status
+REQUESTS_TOTAL       = registry.counter(  "sign_lang_requests_total",       "Serving requests handled")
+
+# Model (re)loads performed by the ModelHolder
+MODEL_LOAD_SECONDS   = registry.histogram("sign_lang_model_load_seconds",   "Time to build a model from weights in seconds")
+MODEL_VERSION        = registry.gauge(    "sign_lang_model_version",        "Version counter of the currently served model")
+MODEL_WARMUP_SECONDS = registry.histogram("sign_lang_model_warmup_seconds", "Warmup inference before a model is published in seconds")
+COLD_START_SECONDS   = registry.gauge(    "sign_lang_cold_start_seconds",   "Process start to first model ready in seconds")
+
+# Images per batched predict call
+BATCH_SIZE           = registry.histogram("sign_lang_batch_size",           "Images per micro-batched predict call", buckets=(1, 2, 4, 8, 16, 32, 64))
+
+# Training stage durations — observed by TrainPipeline, and in the serving
+# process by TrainingJobManager from the job's "finished" stage events
+TRAIN_STAGE_SECONDS      = registry.histogram("sign_lang_train_stage_seconds",      "Duration of each training pipeline stage in seconds")
+TRAIN_STAGE_LAST_SECONDS = registry.gauge(    "sign_lang_train_stage_last_seconds", "Duration of the most recent run of each training stage")
+
+# WebSocket camera frames by outcome (inferred, dropped, error) and open connections
+WS_FRAMES_TOTAL      = registry.counter(  "sign_lang_ws_frames_total",      "WebSocket frames received by outcome")
+WS_CONNECTIONS       = registry.gauge(    "sign_lang_ws_connections",       "Open WebSocket connections")
+
+# ─────────────────────────────────────────────────────────────
+# Scrape-time view of live streams — FPS, viewers, dropped frames
+# ─────────────────────────────────────────────────────────────
+def live_collector(broadcaster_registry):
+    def collect() -> list:
+        fps, dropped, viewers, skipped, ratio = [], [], [], [], []
+
+        for broadcaster in broadcaster_registry.stats():
+            labels = {"source": broadcaster["source"]}
+            for output, count in broadcaster["subscribers"].items():
+                viewers.append(({**labels, "output": output}, count))
+            for output, count in broadcaster["viewer_skipped"].items():
+                skipped.append(({**labels, "output": output}, count))
+
+            pipeline = broadcaster["pipeline"] or {}
+            for stage in ("capture", "inference", "tracking", "encode", "end_to_end"):
+                if stage in pipeline:
+                    fps.append(({**labels, "stage": stage}, pipeline[stage]["fps"]))
+                    dropped.append(({**labels, "stage": stage}, pipeline[stage]["dropped"]))
+
+            if "motion" in pipeline:
+                ratio.append((labels, pipeline["motion"]["inference_ratio"]))
+
+        return [
+                    ("sign_lang_live_fps",                  "gauge",   "Current frames per second per live stage",            fps),
+                    ("sign_lang_live_dropped_frames_total", "counter", "Frames overwritten before the next stage took them", dropped),
+                    ("sign_lang_live_viewers",              "gauge",   "Connected viewers per live stream",                   viewers),
+                    ("sign_lang_live_viewer_skipped_total", "counter", "Frames skipped by viewers that fell behind",          skipped),
+                    ("sign_lang_live_inference_ratio",      "gauge",   "Share of live frames that ran the model",             ratio),
+               ]
+
+    return collect
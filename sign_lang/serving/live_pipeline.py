@@ -0,0 +1,349 @@
+# ─────────────────────────────────────────────────────────────
+# Live Pipeline — Capture / Inference / Encode Worker Threads
+# ─────────────────────────────────────────────────────────────
+
+import sys
+import json
+import time
+import threading
+from collections                    import deque
+
+import cv2
+
+from sign_lang.logger                  import logger
+from sign_lang.exception               import AppException
+from sign_lang.serving.motion          import MotionGate, BoxTracker, analysis_frame
+from sign_lang.serving.detections      import detections_array, detections_payload, render_jpeg, results_from_detections
+from sign_lang.serving.instrumentation import STAGE_SECONDS
+from sign_lang.constant.application    import (
+                                                   APP_LIVE_SOURCE,
+                                                   APP_LIVE_PACE_FILE_SOURCES,
+                                                   APP_LIVE_JPEG_QUALITY,
+                                                   APP_LIVE_MAX_SIZE,
+                                                   APP_LIVE_MOTION_GATE
+                                              )
+
+# Output kinds produced by the encode stage
+LIVE_OUTPUT_MJPEG      = "mjpeg"            # annotated JPEG frames
+LIVE_OUTPUT_DETECTIONS = "detections"       # JSON detections, never rendered
+LIVE_OUTPUTS           = (LIVE_OUTPUT_MJPEG, LIVE_OUTPUT_DETECTIONS)
+
+# ─────────────────────────────────────────────────────────────
+# Interpret a source string — digits mean a camera index
+# ─────────────────────────────────────────────────────────────
+def parse_source(source):
+    if isinstance(source, int):
+        return source
+    source = str(source).strip()
+    return int(source) if source.isdigit() else source
+
+# ─────────────────────────────────────────────────────────────
+# Latest-wins buffer — a newer item overwrites one that was
+# never taken, so consumers only ever see the freshest frame
+# ─────────────────────────────────────────────────────────────
+class LatestSlot:
+    def __init__(self):
+        self._cond      = threading.Condition()
+        self._item      = None
+        self._seq       = 0             # sequence number of the stored item
+        self._taken_seq = 0             # last sequence number handed to a consumer
+        self._closed    = False
+        self.dropped    = 0             # items overwritten before anyone took them
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put(self, item) -> None:
+        with self._cond:
+            if self._seq > self._taken_seq:
+                self.dropped += 1
+            self._item  = item
+            self._seq  += 1
+            self._cond.notify_all()
+
+    # Wait for an item newer than last_seq; None on timeout or close
+    def get(self, last_seq: int = 0, timeout: float = None):
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._seq > last_seq or self._closed, timeout):
+                return None
+            if self._seq <= last_seq:
+                return None
+            self._taken_seq = self._seq
+            return self._seq, self._item
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+# ─────────────────────────────────────────────────────────────
+# Per-stage throughput and latency
+# ─────────────────────────────────────────────────────────────
+class StageStats:
+    def __init__(self, name: str, window: int = 120):
+        self.name         = name
+        self._lock        = threading.Lock()
+        self._completions = deque(maxlen=window)    # completion timestamps for FPS
+        self._latencies   = deque(maxlen=window)    # seconds spent per item
+        self.frames       = 0
+
+    def record(self, latency: float) -> None:
+        STAGE_SECONDS.observe(latency, path="live", stage=self.name)
+        with self._lock:
+            self._completions.append(time.perf_counter())
+            self._latencies.append(latency)
+            self.frames += 1
+
+    def snapshot(self, dropped: int = 0) -> dict:
+        with self._lock:
+            span = self._completions[-1] - self._completions[0] if len(self._completions) > 1 else 0.0
+            fps  = (len(self._completions) - 1) / span if span > 0 else 0.0
+            lat  = sorted(self._latencies)
+
+            return {
+                        "fps"            : round(fps, 2),
+                        "frames"         : self.frames,
+                        "dropped"        : dropped,
+                        "latency_ms_mean": round(sum(lat) / len(lat) * 1000.0, 2) if lat else 0.0,
+                        "latency_ms_p95" : round(lat[int(0.95 * (len(lat) - 1))] * 1000.0, 2) if lat else 0.0,
+                   }
+
+# ─────────────────────────────────────────────────────────────
+# Staged live inference — capture never waits on the model, and
+# stale frames are overwritten instead of piling up in a queue.
+# One capture and inference loop feeds every output kind; the
+# encode stage only produces the kinds someone is watching.
+# Keyframes go through the batcher (MicroBatcher or the worker
+# pool), so pool mode never loads a model in the web process.
+# ─────────────────────────────────────────────────────────────
+class LivePipeline:
+    def __init__(
+                    self,
+                    batcher,
+                    source                    = APP_LIVE_SOURCE,
+                    outputs      : tuple      = (LIVE_OUTPUT_MJPEG,),
+                    jpeg_quality : int        = APP_LIVE_JPEG_QUALITY,
+                    max_size     : int        = APP_LIVE_MAX_SIZE,
+                    pace_files   : bool       = APP_LIVE_PACE_FILE_SOURCES,
+                    motion_gate  : bool       = APP_LIVE_MOTION_GATE,
+                    roi_detector              = None,       # RoiDetector for two-stage inference
+                ):
+        self.batcher       = batcher
+        self.source        = parse_source(source)
+        self.outputs       = frozenset(outputs)
+        self.jpeg_quality  = jpeg_quality
+        self.max_size      = max_size
+        self.pace_files    = pace_files
+        self.motion_gate   = motion_gate
+        self.roi_detector  = roi_detector
+
+        self._stop         = threading.Event()
+        self._threads      = []
+        self._cap          = None
+
+        # Stage hand-off buffers
+        self._raw          = LatestSlot()      # capture   → inference
+        self._results      = LatestSlot()      # inference → encode
+        self._encoded      = {kind: LatestSlot() for kind in LIVE_OUTPUTS}     # encode → HTTP consumers, per output kind
+
+        self.capture_stats   = StageStats("capture")
+        self.inference_stats = StageStats("inference")
+        self.tracking_stats  = StageStats("tracking")
+        self.encode_stats    = StageStats("encode")
+        self.e2e_stats       = StageStats("end_to_end")
+        self.keyframe_interval = 1                                  # current adaptive gap between keyframes
+
+    # ─────────────────────────────────────────────────────────
+    # Lifecycle
+    # ─────────────────────────────────────────────────────────
+    def start(self) -> "LivePipeline":
+        try:
+            self._cap = cv2.VideoCapture(self.source)
+            if not self._cap.isOpened():
+                raise RuntimeError(f"Video source {self.source!r} not accessible — check device, path or permissions")
+
+            for name, target in (
+                                    ("capture",   self._capture_loop),
+                                    ("inference", self._inference_loop),
+                                    ("encode",    self._encode_loop),
+                                ):
+                thread = threading.Thread(target=target, name=f"live-{name}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+            logger.info(f"Live pipeline started on source {self.source!r}")
+            return self
+
+        except Exception as e:
+            raise AppException(e, sys)
+
+    def stop(self) -> None:
+        self._stop.set()
+        for slot in (self._raw, self._results, *self._encoded.values()):
+            slot.close()
+        for thread in self._threads:
+            thread.join(timeout=2.0)
+        logger.info(f"Live pipeline stopped on source {self.source!r}")
+
+    @property
+    def running(self) -> bool:
+        return not self._stop.is_set() and not any(slot.closed for slot in self._encoded.values())
+
+    # Output kinds to encode from the next result on — set by the broadcaster
+    # as viewers of each kind come and go
+    def set_outputs(self, outputs) -> None:
+        self.outputs = frozenset(outputs)
+
+    # ─────────────────────────────────────────────────────────
+    # Stage 1 — Capture frames as fast as the source delivers
+    # ─────────────────────────────────────────────────────────
+    def _capture_loop(self) -> None:
+        is_file  = isinstance(self.source, str)
+        fps      = self._cap.get(cv2.CAP_PROP_FPS) if is_file else 0.0
+        interval = 1.0 / fps if is_file and self.pace_files and fps > 0 else 0.0
+
+        try:
+            while not self._stop.is_set():
+                started        = time.perf_counter()
+                success, frame = self._cap.read()
+                if not success:
+                    break                                       # end of file or camera lost
+
+                self._raw.put((frame, started))
+                self.capture_stats.record(time.perf_counter() - started)
+
+                if interval:
+                    time.sleep(max(0.0, interval - (time.perf_counter() - started)))
+        except Exception as e:
+            logger.error(f"Live capture failed: {e}")
+        finally:
+            self._cap.release()                                 # ensure camera is released on exit
+            self._raw.close()
+
+    # ─────────────────────────────────────────────────────────
+    # Stage 2 — Run YOLOv11 on the freshest captured frame
+    # ─────────────────────────────────────────────────────────
+    def _inference_loop(self) -> None:
+        seq     = 0
+        gate    = MotionGate()
+        tracker = BoxTracker()
+        keyed   = None                  # last keyframe Results — names and class map for tracked frames
+        try:
+            while not self._stop.is_set():
+                got = self._raw.get(seq, timeout=0.5)
+                if got is None:
+                    if self._raw.closed:
+                        break
+                    continue
+
+                seq, (frame, captured_at) = got
+                started = time.perf_counter()
+
+                if not self.motion_gate:
+                    result = self._predict(frame)
+                    self._results.put((result, captured_at))
+                    self.inference_stats.record(time.perf_counter() - started)
+                    continue
+
+                gray, scale = analysis_frame(frame)
+                if keyed is None or gate.should_infer(gray):
+                    keyed  = self._predict(frame)
+                    tracker.reset(gray, scale, detections_array(keyed))
+                    self._results.put((keyed, captured_at))
+                    self.inference_stats.record(time.perf_counter() - started)
+                else:
+                    result = self._tracked_result(keyed, frame, tracker.update(gray))
+                    self._results.put((result, captured_at))
+                    self.tracking_stats.record(time.perf_counter() - started)
+
+                self.keyframe_interval = gate.interval
+        except Exception as e:
+            logger.error(f"Live inference failed: {e}")
+        finally:
+            self._results.close()
+
+    # Full model pass on one frame
+    def _predict(self, frame):
+        if self.roi_detector is not None:
+            return self.roi_detector.predict(frame, path="live_roi")
+        return self.batcher.predict(frame)
+
+    # Keyframe boxes moved by the tracker, wrapped as a Results object
+    # so the encode stage renders tracked and inferred frames alike
+    @staticmethod
+    def _tracked_result(keyed, frame, boxes):
+        return results_from_detections(frame, keyed.names, boxes, path=keyed.path)
+
+    # ─────────────────────────────────────────────────────────
+    # Stage 3 — Overlay boxes and JPEG-encode for MJPEG, and/or
+    # serialize detections only (no plotting, no JPEG)
+    # ─────────────────────────────────────────────────────────
+    def _encode_loop(self) -> None:
+        seq = 0
+        try:
+            while not self._stop.is_set():
+                got = self._results.get(seq, timeout=0.5)
+                if got is None:
+                    if self._results.closed:
+                        break
+                    continue
+
+                seq, (result, captured_at) = got
+                started     = time.perf_counter()
+
+                for kind in self.outputs:
+                    if kind == LIVE_OUTPUT_DETECTIONS:
+                        frame_bytes = json.dumps(detections_payload(result)).encode()
+                    else:
+                        frame_bytes = render_jpeg(result, self.jpeg_quality, self.max_size, path="live")
+                    self._encoded[kind].put(frame_bytes)
+
+                now         = time.perf_counter()
+                self.encode_stats.record(now - started)
+                self.e2e_stats.record(now - captured_at)
+        except Exception as e:
+            logger.error(f"Live encode failed: {e}")
+        finally:
+            for slot in self._encoded.values():
+                slot.close()
+
+    # ─────────────────────────────────────────────────────────
+    # Consumer side — each consumer tracks its own sequence number,
+    # so a slow reader skips straight to the newest frame
+    # ─────────────────────────────────────────────────────────
+    def next_frame(self, last_seq: int = 0, output: str = LIVE_OUTPUT_MJPEG, timeout: float = 1.0):
+        return self._encoded[output].get(last_seq, timeout=timeout)
+
+    def frames(self, output: str = LIVE_OUTPUT_MJPEG):
+        seq = 0
+        while True:
+            got = self.next_frame(seq, output)
+            if got is None:
+                if self._encoded[output].closed:
+                    return
+                continue
+            seq, frame_bytes = got
+            yield frame_bytes
+
+    def stats(self) -> dict:
+        keyframes = self.inference_stats.frames
+        tracked   = self.tracking_stats.frames
+        processed = keyframes + tracked
+
+        return {
+                    "source"    : str(self.source),
+                    "outputs"   : sorted(self.outputs),
+                    "capture"   : self.capture_stats.snapshot(),
+                    "inference" : self.inference_stats.snapshot(dropped=self._raw.dropped),
+                    "tracking"  : self.tracking_stats.snapshot(),
+                    "encode"    : self.encode_stats.snapshot(dropped=self._results.dropped),
+                    "end_to_end": self.e2e_stats.snapshot(dropped=sum(slot.dropped for slot in self._encoded.values())),
+                    "motion"    : {
+                                        "enabled"           : self.motion_gate,
+                                        "keyframes"         : keyframes,
+                                        "tracked_frames"    : tracked,
+                                        "inference_ratio"   : round(keyframes / processed, 3) if processed else 0.0,
+                                        "keyframe_interval" : self.keyframe_interval,
+                                  },
+               }
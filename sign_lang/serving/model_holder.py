@@ -0,0 +1,304 @@
+# ─────────────────────────────────────────────────────────────
+# Model Holder — Process-Wide YOLO Instance with Hot Reload
+# ─────────────────────────────────────────────────────────────
+
+import os
+import sys
+import time
+import threading
+
+import numpy as np
+import psutil
+
+from sign_lang.logger                  import logger
+from sign_lang.exception               import AppException
+from sign_lang.utils.main_utils        import read_json_file
+from sign_lang.serving.instrumentation import (
+                                                   MODEL_LOAD_SECONDS,
+                                                   MODEL_WARMUP_SECONDS,
+                                                   MODEL_VERSION,
+                                                   COLD_START_SECONDS
+                                               )
+from sign_lang.constant.application    import (
+                                                   APP_MODEL_PATH,
+                                                   APP_MODEL_RELOAD_CHECK_INTERVAL,
+                                                   APP_EXPORT_REPORT_PATH,
+                                                   APP_MODEL_BACKEND,
+                                                   APP_MODEL_WARMUP,
+                                                   APP_MODEL_DEFAULT_IMAGE_SIZE
+                                               )
+
+# Loading states reported by /healthz and /readyz
+MODEL_IDLE    = "idle"              # nothing asked for the model yet
+MODEL_LOADING = "loading"
+MODEL_READY   = "ready"             # loaded and warmed up
+MODEL_MISSING = "missing"           # no weights at APP_MODEL_PATH
+MODEL_FAILED  = "failed"
+
+# ─────────────────────────────────────────────────────────────
+# Pick the serving backend from the ModelExporter report.
+# "auto" takes the lowest-latency export whose mAP loss is within
+# the report's budget; exports made from an older best.pt are
+# ignored. Returns (backend, path, image_size).
+# ─────────────────────────────────────────────────────────────
+def select_serving_model(
+                            model_path  : str = APP_MODEL_PATH,
+                            report_path : str = APP_EXPORT_REPORT_PATH,
+                            backend     : str = APP_MODEL_BACKEND,
+                        ) -> tuple:
+    fallback = ("pytorch", model_path, None)
+
+    if backend == "pytorch" or not os.path.exists(report_path) or not os.path.exists(model_path):
+        return fallback
+
+    try:
+        report = read_json_file(report_path)
+        stat   = os.stat(model_path)
+        if list(report.get("source_signature", [])) != [stat.st_mtime_ns, stat.st_size]:
+            return fallback                                     # best.pt replaced since the export
+
+        models     = report.get("models", {})
+        metrics    = report.get("metrics", {})
+        max_drop   = report.get("max_accuracy_drop", 0.0)
+        image_size = report.get("image_size")
+
+        candidates = [
+                        (metrics[name]["latency_ms"], name)
+                        for name, path in models.items()
+                        if name in metrics and os.path.exists(path)
+                        and (backend == name or (backend == "auto" and metrics[name]["accuracy_delta"] >= -max_drop))
+                     ]
+        if not candidates:
+            return fallback
+
+        _, chosen = min(candidates)
+        return chosen, models[chosen], image_size
+
+    except Exception as e:
+        logger.warning(f"Ignoring export report {report_path}: {e}")
+        return fallback
+
+# ─────────────────────────────────────────────────────────────
+# Loads weights once and swaps in a new model when the file changes
+#
+# Readers always get a fully constructed model: the replacement is
+# built off to the side and published with a single reference swap.
+#
+# Inference goes through predict(), one call at a time. Ultralytics'
+# Model.predict replaces predictor.args (conf, imgsz, ...) before it
+# takes its own inference lock, so two threads sharing a YOLO object
+# can post-process each other's frames with the wrong arguments.
+# ─────────────────────────────────────────────────────────────
+class ModelHolder:
+    def __init__(
+                    self,
+                    model_path     : str   = APP_MODEL_PATH,
+                    check_interval : float = APP_MODEL_RELOAD_CHECK_INTERVAL,
+                    resolver                = select_serving_model,
+                    warmup         : bool  = APP_MODEL_WARMUP,
+                ):
+        self.model_path      = model_path
+        self.check_interval  = check_interval
+        self.resolver        = resolver         # best.pt -> (backend, path, image_size) to serve
+        self.warmup          = warmup
+
+        self.backend         = None
+        self.served_path     = None
+        self._model          = None
+        self._signature      = None         # (path, mtime_ns, size) of the loaded file
+        self._version        = 0            # bumped on every successful (re)load
+        self._last_check     = 0.0
+        self._disk_signature = None         # what the resolver points at on disk, see current_signature()
+        self._disk_checked   = None
+        self._load_lock      = threading.Lock()
+        self._predict_lock   = threading.Lock()     # one predict() on the shared model at a time
+        self._loader         = None
+
+        # Loading state and timings — read by status()
+        self.state           = MODEL_IDLE
+        self.load_error      = None
+        self.load_seconds    = None
+        self.warmup_seconds  = None
+        self.cold_start      = None         # process start -> first model ready, in seconds
+
+    # ─────────────────────────────────────────────────────────
+    # Public state
+    # ─────────────────────────────────────────────────────────
+    @property
+    def version(self) -> int:
+        return self._version
+
+    # (path, mtime_ns, size) of the loaded file, None before the first load
+    @property
+    def signature(self):
+        return self._signature
+
+    @property
+    def ready(self) -> bool:
+        return self._model is not None
+
+    def exists(self) -> bool:
+        return os.path.exists(self.model_path)
+
+    def status(self) -> dict:
+        return {
+                    "state"              : self.state if self.ready or self.exists() else MODEL_MISSING,
+                    "model_path"         : self.model_path,
+                    "backend"            : self.backend,
+                    "served_path"        : self.served_path,
+                    "version"            : self._version,
+                    "load_seconds"       : self.load_seconds,
+                    "warmup_seconds"     : self.warmup_seconds,
+                    "cold_start_seconds" : self.cold_start,
+                    "error"              : self.load_error,
+               }
+
+    # ─────────────────────────────────────────────────────────
+    # Load on a background thread so the server can accept
+    # connections (and answer /healthz) while weights load
+    # ─────────────────────────────────────────────────────────
+    def load_in_background(self) -> None:
+        if self.ready or (self._loader is not None and self._loader.is_alive()):
+            return
+        if not self.exists():
+            self.state = MODEL_MISSING
+            logger.warning(f"No model at {self.model_path} yet, serving will report not ready")
+            return
+
+        self._loader = threading.Thread(target=self._background_load, name="model-loader", daemon=True)
+        self._loader.start()
+
+    def _background_load(self) -> None:
+        try:
+            self.get()
+        except Exception as e:
+            logger.error(f"Background model load failed: {e}")
+
+    # ─────────────────────────────────────────────────────────
+    # File signature — changes whenever ModelTrainer replaces best.pt
+    # or ModelExporter publishes a faster backend
+    # ─────────────────────────────────────────────────────────
+    def _file_signature(self, path: str):
+        stat = os.stat(path)
+        return (path, stat.st_mtime_ns, stat.st_size)
+
+    # ─────────────────────────────────────────────────────────
+    # Signature of the file that should be serving right now —
+    # resolver + stat, re-checked at most every check_interval.
+    # Never loads anything, so it is cheap enough for every cache
+    # lookup and works in processes that do not hold the model.
+    # ─────────────────────────────────────────────────────────
+    def current_signature(self):
+        now = time.monotonic()
+        if self._disk_checked is None or now - self._disk_checked >= self.check_interval:
+            try:
+                _, path, _           = self.resolver(self.model_path)
+                self._disk_signature = self._file_signature(path)
+            except OSError:
+                self._disk_signature = None
+            self._disk_checked = now
+        return self._disk_signature
+
+    # ─────────────────────────────────────────────────────────
+    # Build a new model and publish it (caller holds _load_lock)
+    # ─────────────────────────────────────────────────────────
+    def _load(self, backend: str, path: str, image_size, signature) -> None:
+        from ultralytics import YOLO                                # heavy import, only paid on load
+
+        started        = time.perf_counter()
+        model          = YOLO(path, task="detect")
+        if image_size:
+            model.overrides["imgsz"] = image_size                   # exported graphs were built at this size
+        load_seconds   = time.perf_counter() - started
+
+        # Warm up before publishing, so neither the first request nor
+        # the first one after a hot reload pays predictor setup
+        if self.warmup:
+            self._warmup(model, backend)
+
+        # Publish — a single attribute assignment is atomic for readers
+        self._model      = model
+        self._signature  = signature
+        self.backend     = backend
+        self.served_path = path
+        self._version   += 1
+        self.state       = MODEL_READY
+        self.load_error  = None
+
+        self.load_seconds = load_seconds
+        MODEL_LOAD_SECONDS.observe(load_seconds, backend=backend)
+        MODEL_VERSION.set(self._version)
+        logger.info(
+                        f"Loaded {backend} model {path} (version {self._version}) "
+                        f"in {load_seconds:.2f}s, ready after {time.perf_counter() - started:.2f}s"
+                   )
+
+        if self.cold_start is None:
+            self.cold_start = time.time() - psutil.Process().create_time()
+            COLD_START_SECONDS.set(self.cold_start)
+            logger.info(f"Cold start: model ready {self.cold_start:.2f}s after process start")
+
+    # ─────────────────────────────────────────────────────────
+    # One inference on a blank frame at the serving image size —
+    # the exported size, else the model's own imgsz
+    # ─────────────────────────────────────────────────────────
+    def _warmup(self, model, backend: str) -> None:
+        size    = int(model.overrides.get("imgsz") or APP_MODEL_DEFAULT_IMAGE_SIZE)
+        started = time.perf_counter()
+        model.predict(np.zeros((size, size, 3), dtype=np.uint8), verbose=False)
+
+        self.warmup_seconds = time.perf_counter() - started
+        MODEL_WARMUP_SECONDS.observe(self.warmup_seconds, backend=backend)
+        logger.info(f"Warmed up {backend} model at imgsz {size} in {self.warmup_seconds:.2f}s")
+
+    # ─────────────────────────────────────────────────────────
+    # Return the current model, reloading if best.pt changed on disk.
+    # Do not call predict() on it from more than one thread — use
+    # ModelHolder.predict() instead.
+    # ─────────────────────────────────────────────────────────
+    def get(self):
+        try:
+            now = time.monotonic()
+
+            # Fast path — model loaded and the check interval has not elapsed
+            if self._model is not None and now - self._last_check < self.check_interval:
+                return self._model
+
+            with self._load_lock:
+                if self._model is not None and now - self._last_check < self.check_interval:
+                    return self._model
+
+                self._last_check         = now
+                backend, path, imgsz     = self.resolver(self.model_path)
+                signature                = self._file_signature(path)
+
+                if signature != self._signature:
+                    if self._model is not None:
+                        logger.info(f"Detected new weights at {path}, reloading")
+                    else:
+                        self.state = MODEL_LOADING
+                    self._load(backend, path, imgsz, signature)
+
+            return self._model
+
+        except Exception as e:
+            # Keep serving the previous model if a reload fails mid-way
+            if self._model is not None:
+                logger.error(f"Model reload failed, keeping version {self._version}: {e}")
+                return self._model
+            self.state      = MODEL_FAILED if self.exists() else MODEL_MISSING
+            self.load_error = str(e)
+            raise AppException(e, sys)
+
+    # ─────────────────────────────────────────────────────────
+    # Inference on the current model, serialized across callers
+    # (batcher, live pipeline, ROI) — returns the list of Results
+    # ─────────────────────────────────────────────────────────
+    def predict(self, source, **kwargs):
+        model = self.get()
+        with self._predict_lock:
+            return model.predict(source, verbose=False, **kwargs)
+
+
+# Shared by /predict and /live
+model_holder = ModelHolder()
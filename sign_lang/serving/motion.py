@@ -0,0 +1,125 @@
+# ─────────────────────────────────────────────────────────────
+# Motion Gating + Box Tracking — Skip Inference on Static Scenes
+# ─────────────────────────────────────────────────────────────
+
+import cv2
+import numpy as np
+
+from sign_lang.constant.application import (
+                                                APP_LIVE_MOTION_THRESHOLD,
+                                                APP_LIVE_MOTION_PIXEL_DELTA,
+                                                APP_LIVE_MAX_KEYFRAME_INTERVAL
+                                           )
+
+# Width of the grayscale thumbnail used for gating and tracking
+ANALYSIS_WIDTH = 160
+
+# ─────────────────────────────────────────────────────────────
+# Small blurred grayscale copy — cheap to diff and to track on
+# ─────────────────────────────────────────────────────────────
+def analysis_frame(frame: np.ndarray) -> tuple:
+    height, width = frame.shape[:2]
+    scale         = ANALYSIS_WIDTH / width
+    small         = cv2.resize(frame, (ANALYSIS_WIDTH, max(1, round(height * scale))), interpolation=cv2.INTER_AREA)
+    gray          = cv2.GaussianBlur(cv2.cvtColor(small, cv2.COLOR_BGR2GRAY), (5, 5), 0)
+    return gray, scale
+
+# ─────────────────────────────────────────────────────────────
+# Decides which frames are inference keyframes.
+#
+# Change is measured as the fraction of thumbnail pixels whose
+# intensity moved by more than pixel_delta. A frame is a keyframe
+# when it differs enough from the last keyframe and the adaptive
+# interval has elapsed, or when max_interval frames have passed.
+# The interval shrinks towards 1 as frame-to-frame motion rises.
+# ─────────────────────────────────────────────────────────────
+class MotionGate:
+    def __init__(
+                    self,
+                    threshold    : float = APP_LIVE_MOTION_THRESHOLD,
+                    pixel_delta  : int   = APP_LIVE_MOTION_PIXEL_DELTA,
+                    max_interval : int   = APP_LIVE_MAX_KEYFRAME_INTERVAL,
+                ):
+        self.threshold      = threshold
+        self.pixel_delta    = pixel_delta
+        self.max_interval   = max(1, max_interval)
+
+        self._keyframe      = None          # thumbnail of the last inferred frame
+        self._previous      = None          # thumbnail of the previous frame
+        self._since_key     = 0
+        self.motion_ema     = 0.0
+        self.interval       = 1
+
+    def _changed_fraction(self, a: np.ndarray, b: np.ndarray) -> float:
+        return float(np.count_nonzero(cv2.absdiff(a, b) > self.pixel_delta)) / a.size
+
+    def should_infer(self, gray: np.ndarray) -> bool:
+        self._since_key += 1
+
+        if self._keyframe is None or self._keyframe.shape != gray.shape:
+            self._mark_keyframe(gray)
+            return True
+
+        # Frame-to-frame motion drives the adaptive keyframe rate
+        motion          = self._changed_fraction(gray, self._previous)
+        self.motion_ema = 0.7 * self.motion_ema + 0.3 * motion
+        busy            = min(1.0, self.motion_ema / (4.0 * self.threshold)) if self.threshold > 0 else 1.0
+        self.interval   = max(1, round(self.max_interval * (1.0 - busy)))
+        self._previous  = gray
+
+        changed         = self._changed_fraction(gray, self._keyframe) > self.threshold
+        if (changed and self._since_key >= self.interval) or self._since_key >= self.max_interval:
+            self._mark_keyframe(gray)
+            return True
+        return False
+
+    def _mark_keyframe(self, gray: np.ndarray) -> None:
+        self._keyframe  = gray
+        self._previous  = gray
+        self._since_key = 0
+
+# ─────────────────────────────────────────────────────────────
+# Carries keyframe boxes forward with sparse optical flow: each
+# box moves by the median displacement of the points inside it
+# ─────────────────────────────────────────────────────────────
+class BoxTracker:
+    def __init__(self, points_per_box: int = 20):
+        self.points_per_box = points_per_box
+        self._gray          = None
+        self._scale         = 1.0
+        self._boxes         = np.zeros((0, 6), dtype=np.float32)   # x1, y1, x2, y2, conf, cls (full-res)
+
+    def reset(self, gray: np.ndarray, scale: float, boxes: np.ndarray) -> None:
+        self._gray  = gray
+        self._scale = scale
+        self._boxes = np.array(boxes, dtype=np.float32, copy=True)
+
+    def update(self, gray: np.ndarray) -> np.ndarray:
+        if self._gray is None or len(self._boxes) == 0 or gray.shape != self._gray.shape:
+            self._gray = gray
+            return self._boxes.copy()
+
+        height, width = gray.shape[:2]
+        for box in self._boxes:
+            x1, y1, x2, y2 = (box[:4] * self._scale).astype(int)
+            x1, y1         = max(0, x1), max(0, y1)
+            x2, y2         = min(width, x2), min(height, y2)
+            if x2 - x1 < 2 or y2 - y1 < 2:
+                continue
+
+            mask             = np.zeros_like(gray)
+            mask[y1:y2, x1:x2] = 255
+            points           = cv2.goodFeaturesToTrack(self._gray, self.points_per_box, 0.01, 3, mask=mask)
+            if points is None:
+                continue
+
+            moved, status, _ = cv2.calcOpticalFlowPyrLK(self._gray, gray, points, None)
+            good             = status.reshape(-1) == 1
+            if not good.any():
+                continue
+
+            dx, dy   = np.median((moved - points).reshape(-1, 2)[good], axis=0) / self._scale
+            box[:4] += (dx, dy, dx, dy)
+
+        self._gray = gray
+        return self._boxes.copy()
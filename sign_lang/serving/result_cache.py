@@ -0,0 +1,146 @@
+# ─────────────────────────────────────────────────────────────
+# Result Cache — Content-Addressed, LRU by Byte Budget + TTL
+# ─────────────────────────────────────────────────────────────
+
+import time
+import hashlib
+import threading
+from collections                       import OrderedDict
+
+from sign_lang.logger                  import logger
+from sign_lang.utils.metrics           import registry
+from sign_lang.constant.application    import APP_RESULT_CACHE_MAX_BYTES, APP_RESULT_CACHE_TTL_SECONDS
+
+CACHE_REQUESTS_TOTAL = registry.counter("sign_lang_result_cache_requests_total", "Result cache lookups by outcome")
+CACHE_BYTES          = registry.gauge(  "sign_lang_result_cache_bytes",          "Bytes currently held by the result cache")
+
+# ─────────────────────────────────────────────────────────────
+# Stable digest of the raw uploaded image bytes
+# ─────────────────────────────────────────────────────────────
+def image_digest(image_bytes: bytes) -> str:
+    return hashlib.blake2b(image_bytes, digest_size=16).hexdigest()
+
+# ─────────────────────────────────────────────────────────────
+# Maps (image digest, response variant, weights signature) to a
+# finished response body. Entries belong to one model version and
+# one file on disk: the whole cache is dropped when either changes,
+# and nothing is served or stored while the weights on disk differ
+# from the loaded ones — a swapped best.pt is seen within the
+# holder's check interval even if every request is a hit.
+# ─────────────────────────────────────────────────────────────
+class ResultCache:
+    def __init__(
+                    self,
+                    model_source,               # a batcher — .version, .signature, .current_signature()
+                    max_bytes   : int   = APP_RESULT_CACHE_MAX_BYTES,
+                    ttl_seconds : float = APP_RESULT_CACHE_TTL_SECONDS,
+                ):
+        self.model_source   = model_source
+        self.max_bytes      = max_bytes
+        self.ttl_seconds    = ttl_seconds
+
+        self._lock          = threading.Lock()
+        self._entries       = OrderedDict()         # key -> (expires_at, size, value)
+        self._bytes         = 0
+        self._model_state   = None              # (version, signature on disk) the entries belong to
+
+        self.hits           = 0
+        self.misses         = 0
+        self.evictions      = 0
+        self.invalidations  = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    # ─────────────────────────────────────────────────────────
+    # Internal helpers (caller holds _lock)
+    # ─────────────────────────────────────────────────────────
+    def _check_model(self, signature) -> bool:
+        state = (self.model_source.version, signature)
+        if state != self._model_state:
+            if self._entries:
+                logger.info(f"Model {self._model_state} -> {state}, dropping {len(self._entries)} cached results")
+                self.invalidations += 1
+            self._entries.clear()
+            self._bytes         = 0
+            self._model_state   = state
+
+        # New weights on disk that are not loaded yet — results are from the old model
+        return signature is not None and signature == self.model_source.signature
+
+    def _remove(self, key) -> None:
+        _, size, _  = self._entries.pop(key)
+        self._bytes -= size
+
+    # ─────────────────────────────────────────────────────────
+    # Lookup — refreshes LRU position on hit, expires stale entries
+    # ─────────────────────────────────────────────────────────
+    def get(self, digest: str, variant: str):
+        if not self.enabled:
+            return None
+
+        signature = self.model_source.current_signature()
+        key       = (digest, variant, signature)
+        with self._lock:
+            entry = self._entries.get(key) if self._check_model(signature) else None
+
+            if entry is not None and entry[0] < time.monotonic():
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                CACHE_REQUESTS_TOTAL.inc(result="miss")
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            CACHE_REQUESTS_TOTAL.inc(result="hit")
+            return entry[2]
+
+    # ─────────────────────────────────────────────────────────
+    # Store — evicts least-recently-used entries over the budget.
+    # model_version is the version that produced the value, so a
+    # result computed just before a swap is never cached after it.
+    # ─────────────────────────────────────────────────────────
+    def put(self, digest: str, variant: str, value, size: int, model_version: int = None) -> None:
+        if not self.enabled or size > self.max_bytes:
+            return
+
+        signature = self.model_source.current_signature()
+        key       = (digest, variant, signature)
+        with self._lock:
+            if not self._check_model(signature):
+                return
+            if model_version is not None and model_version != self._model_state[0]:
+                return
+
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, size, value)
+            self._bytes       += size
+
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+            CACHE_BYTES.set(self._bytes)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                        "enabled"       : self.enabled,
+                        "entries"       : len(self._entries),
+                        "bytes"         : self._bytes,
+                        "max_bytes"     : self.max_bytes,
+                        "ttl_seconds"   : self.ttl_seconds,
+                        "hits"          : self.hits,
+                        "misses"        : self.misses,
+                        "hit_ratio"     : self.hits / lookups if lookups else 0.0,
+                        "evictions"     : self.evictions,
+                        "invalidations" : self.invalidations,
+                        "model_version" : self._model_state[0] if self._model_state else None,
+                   }
@@ -0,0 +1,144 @@
+# ─────────────────────────────────────────────────────────────
+# ROI Inference — Coarse Hand Localization + High-Res Crop Pass
+# ─────────────────────────────────────────────────────────────
+
+import numpy as np
+
+from sign_lang.logger                  import logger
+from sign_lang.serving.detections      import detections_array, results_from_detections
+from sign_lang.serving.instrumentation import STAGE_SECONDS
+from sign_lang.constant.application    import (
+                                                   APP_ROI_COARSE_IMAGE_SIZE,
+                                                   APP_ROI_FINE_IMAGE_SIZE,
+                                                   APP_ROI_COARSE_CONF,
+                                                   APP_ROI_CONF,
+                                                   APP_ROI_PAD,
+                                                   APP_ROI_MAX_REGIONS,
+                                                   APP_ROI_NMS_IOU
+                                              )
+
+# ─────────────────────────────────────────────────────────────
+# Square region around a box, grown by pad on every side and
+# clipped to the frame — letters need some context around the hand
+# ─────────────────────────────────────────────────────────────
+def expand_box(box, pad: float, width: int, height: int) -> tuple:
+    x1, y1, x2, y2 = (float(v) for v in box[:4])
+    cx, cy         = (x1 + x2) / 2, (y1 + y2) / 2
+    half           = max(x2 - x1, y2 - y1) * (0.5 + pad)
+
+    return (
+                max(0, int(cx - half)),
+                max(0, int(cy - half)),
+                min(width,  int(np.ceil(cx + half))),
+                min(height, int(np.ceil(cy + half))),
+           )
+
+# Regions that overlap are replaced by their union until none do
+def merge_regions(regions: list) -> list:
+    merged  = list(regions)
+    changed = True
+    while changed:
+        changed = False
+        for i in range(len(merged)):
+            for j in range(i + 1, len(merged)):
+                a, b = merged[i], merged[j]
+                if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                    merged[i] = (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+                    del merged[j]
+                    changed = True
+                    break
+            if changed:
+                break
+    return merged
+
+# ─────────────────────────────────────────────────────────────
+# Class-agnostic NMS on Nx6 detections — overlapping crops can
+# report the same hand twice, possibly as different letters
+# ─────────────────────────────────────────────────────────────
+def nms(detections: np.ndarray, iou_threshold: float) -> np.ndarray:
+    if len(detections) == 0:
+        return detections
+
+    order = np.argsort(-detections[:, 4])
+    boxes = detections[:, :4]
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    keep  = []
+
+    while order.size:
+        i = order[0]
+        keep.append(i)
+        rest  = order[1:]
+        w     = np.clip(np.minimum(boxes[i, 2], boxes[rest, 2]) - np.maximum(boxes[i, 0], boxes[rest, 0]), 0, None)
+        h     = np.clip(np.minimum(boxes[i, 3], boxes[rest, 3]) - np.maximum(boxes[i, 1], boxes[rest, 1]), 0, None)
+        iou   = w * h / (areas[i] + areas[rest] - w * h + 1e-9)
+        order = rest[iou < iou_threshold]
+
+    return detections[keep]
+
+# ─────────────────────────────────────────────────────────────
+# Two-stage detector on a MicroBatcher or InferenceWorkerPool.
+# A low-imgsz pass at a low confidence finds where the hands are;
+# only those regions are re-run, each crop letterboxed up to
+# fine_size, and the boxes are shifted back into full-frame
+# coordinates. Both passes go through the batcher with per-call
+# imgsz/conf, so the shared model is never driven from here.
+# ─────────────────────────────────────────────────────────────
+class RoiDetector:
+    def __init__(
+                    self,
+                    batcher,
+                    coarse_size : int   = APP_ROI_COARSE_IMAGE_SIZE,
+                    fine_size   : int   = APP_ROI_FINE_IMAGE_SIZE,
+                    coarse_conf : float = APP_ROI_COARSE_CONF,
+                    conf        : float = APP_ROI_CONF,
+                    pad         : float = APP_ROI_PAD,
+                    max_regions : int   = APP_ROI_MAX_REGIONS,
+                    iou         : float = APP_ROI_NMS_IOU,
+                ):
+        self.batcher      = batcher
+        self.coarse_size  = coarse_size
+        self.fine_size    = fine_size
+        self.coarse_conf  = coarse_conf
+        self.conf         = conf
+        self.pad          = pad
+        self.max_regions  = max(1, max_regions)
+        self.iou          = iou
+        self._warned      = False
+
+    # Candidate regions from coarse detections, most confident first
+    def regions(self, candidates: np.ndarray, width: int, height: int) -> list:
+        ordered = candidates[np.argsort(-candidates[:, 4])]
+        regions = merge_regions([expand_box(box, self.pad, width, height) for box in ordered])
+        return [r for r in regions if r[2] > r[0] and r[3] > r[1]][:self.max_regions]
+
+    def predict(self, image: np.ndarray, path: str = "roi"):
+        # Exported graphs are built for one input size — no second resolution
+        if self.batcher.backend not in (None, "pytorch"):
+            if not self._warned:
+                logger.warning(f"ROI inference needs the pytorch backend, {self.batcher.backend} runs single-pass")
+                self._warned = True
+            return self.batcher.predict(image)
+
+        with STAGE_SECONDS.time(path=path, stage="coarse"):
+            coarse     = self.batcher.predict(image, imgsz=self.coarse_size, conf=self.coarse_conf)
+        candidates     = detections_array(coarse)
+        height, width  = image.shape[:2]
+
+        regions        = self.regions(candidates, width, height) if len(candidates) else []
+        if not regions:
+            return results_from_detections(image, coarse.names, np.zeros((0, 6), dtype=np.float32))
+
+        with STAGE_SECONDS.time(path=path, stage="fine"):
+            crops      = [np.ascontiguousarray(image[y1:y2, x1:x2]) for x1, y1, x2, y2 in regions]
+            fine       = self.batcher.predict_many(crops, imgsz=self.fine_size, conf=self.conf)
+
+        with STAGE_SECONDS.time(path=path, stage="merge"):
+            shifted    = []
+            for (x1, y1, _, _), result in zip(regions, fine):
+                boxes              = detections_array(result).copy()
+                boxes[:, [0, 2]]  += x1
+                boxes[:, [1, 3]]  += y1
+                shifted.append(boxes)
+            merged     = nms(np.concatenate(shifted), self.iou)
+
+        return results_from_detections(image, coarse.names, np.ascontiguousarray(merged, dtype=np.float32))
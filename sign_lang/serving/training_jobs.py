@@ -0,0 +1,264 @@
+# ─────────────────────────────────────────────────────────────
+# Training Jobs — Background TrainPipeline Runs in a Child Process
+# ─────────────────────────────────────────────────────────────
+
+import os
+import time
+import uuid
+import queue
+import threading
+import multiprocessing as mp
+from collections                    import OrderedDict
+
+from sign_lang.logger                  import logger
+from sign_lang.serving.instrumentation import TRAIN_STAGE_SECONDS, TRAIN_STAGE_LAST_SECONDS
+from sign_lang.constant.application    import (
+                                                   APP_TRAIN_THREADS,
+                                                   APP_TRAIN_NICE,
+                                                   APP_TRAIN_CANCEL_GRACE_SECONDS,
+                                                   APP_TRAIN_JOB_HISTORY
+                                              )
+
+JOB_QUEUED    = "queued"
+JOB_RUNNING   = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED    = "failed"
+JOB_CANCELLED = "cancelled"
+
+FINISHED_STATES = (JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED)
+
+class TrainingCancelled(Exception):
+    pass
+
+# ─────────────────────────────────────────────────────────────
+# Child process entry point. Applies the CPU budget before torch
+# is imported, then streams stage and epoch events to the parent.
+# ─────────────────────────────────────────────────────────────
+def _run_training_job(force: list, threads: int, nice: int, events, cancel) -> None:
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[var] = str(threads)
+    if hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, cpus[-threads:])           # leave the lowest cores to serving
+    if nice:
+        os.nice(nice)
+
+    def on_stage(stage: str, state: str, reason: str = "", seconds: float = None) -> None:
+        events.put(("stage", {"stage": stage, "state": state, "reason": reason, "seconds": seconds}))
+
+    def on_epoch_end(trainer) -> None:
+        metrics = {key: round(float(value), 5) for key, value in (trainer.metrics or {}).items()}
+        losses  = trainer.label_loss_items(trainer.tloss, prefix="train") if trainer.tloss is not None else {}
+        metrics.update({key: round(float(value), 5) for key, value in losses.items()})
+
+        events.put(("epoch", {
+                                "epoch"      : trainer.epoch + 1,
+                                "epochs"     : trainer.epochs,
+                                "epoch_time" : round(float(trainer.epoch_time or 0.0), 2),
+                                "metrics"    : metrics,
+                             }))
+        if cancel.is_set():
+            raise TrainingCancelled("Training cancelled")
+
+    try:
+        import torch
+        torch.set_num_threads(threads)
+
+        from sign_lang.pipeline.training_pipeline import TrainPipeline
+
+        TrainPipeline(force=force, callbacks={"on_fit_epoch_end": on_epoch_end}, on_stage=on_stage).run_pipeline()
+        events.put(("done", {}))
+    except BaseException as e:
+        events.put(("failed", {"error": str(e)}))
+
+# ─────────────────────────────────────────────────────────────
+# Runs at most one training job at a time. Each job is a spawned
+# process — it shares neither the GIL nor torch thread pools with
+# the serving process — watched by a monitor thread that folds its
+# events into the job record.
+# ─────────────────────────────────────────────────────────────
+class TrainingJobManager:
+    def __init__(
+                    self,
+                    threads       : int   = APP_TRAIN_THREADS,
+                    nice          : int   = APP_TRAIN_NICE,
+                    cancel_grace  : float = APP_TRAIN_CANCEL_GRACE_SECONDS,
+                    history       : int   = APP_TRAIN_JOB_HISTORY,
+                ):
+        self.threads      = max(1, threads)
+        self.nice         = nice
+        self.cancel_grace = cancel_grace
+        self.history      = max(1, history)
+
+        self._ctx         = mp.get_context("spawn")
+        self._lock        = threading.Lock()
+        self._jobs        = OrderedDict()       # job id -> job record
+        self._active      = None                # (job id, process, cancel event) of the running job
+
+    # ─────────────────────────────────────────────────────────
+    # Submit — returns (job, created); created is False when a job
+    # is already running and that job is returned instead
+    # ─────────────────────────────────────────────────────────
+    def submit(self, force: list = ()) -> tuple:
+        with self._lock:
+            if self._active is not None:
+                return self._snapshot(self._active[0]), False
+
+            job_id  = uuid.uuid4().hex[:12]
+            events  = self._ctx.Queue()
+            cancel  = self._ctx.Event()
+            process = self._ctx.Process(
+                                            target = _run_training_job,
+                                            args   = (list(force), self.threads, self.nice, events, cancel),
+                                            name   = f"train-{job_id}",
+                                            daemon = False,     # training spawns dataloader and pool workers of its own
+                                       )
+
+            self._jobs[job_id] = {
+                                    "job_id"      : job_id,
+                                    "status"      : JOB_QUEUED,
+                                    "force"       : list(force),
+                                    "threads"     : self.threads,
+                                    "stage"       : None,
+                                    "stages"      : [],
+                                    "epoch"       : 0,
+                                    "epochs"      : None,
+                                    "progress"    : 0.0,
+                                    "history"     : [],
+                                    "metrics"     : {},
+                                    "error"       : None,
+                                    "created_at"  : time.time(),
+                                    "started_at"  : None,
+                                    "finished_at" : None,
+                                    "pid"         : None,
+                                 }
+            while len(self._jobs) > self.history:
+                oldest = next(iter(self._jobs))
+                if self._jobs[oldest]["status"] not in FINISHED_STATES:
+                    break
+                self._jobs.pop(oldest)
+
+            process.start()
+            self._update(job_id, status=JOB_RUNNING, started_at=time.time(), pid=process.pid)
+            self._active = (job_id, process, cancel)
+
+        threading.Thread(target=self._monitor, args=(job_id, process, events), name=f"train-monitor-{job_id}", daemon=True).start()
+        logger.info(f"Training job {job_id} started in process {process.pid} with {self.threads} thread(s)")
+        return self.get(job_id), True
+
+    # ─────────────────────────────────────────────────────────
+    # Cancel — asks the job to stop at the next epoch boundary and
+    # terminates the process if it has not exited after the grace
+    # ─────────────────────────────────────────────────────────
+    def cancel(self, job_id: str):
+        with self._lock:
+            if job_id not in self._jobs:
+                return None
+            if self._active is None or self._active[0] != job_id:
+                return self._snapshot(job_id)
+
+            _, process, cancel = self._active
+            cancel.set()
+            self._jobs[job_id]["cancel_requested_at"] = time.time()
+
+        def terminate_after_grace():
+            process.join(self.cancel_grace)
+            if process.is_alive():
+                logger.warning(f"Training job {job_id} ignored cancel for {self.cancel_grace}s, terminating")
+                process.terminate()
+
+        threading.Thread(target=terminate_after_grace, name=f"train-cancel-{job_id}", daemon=True).start()
+        logger.info(f"Cancel requested for training job {job_id}")
+        return self._snapshot(job_id)
+
+    # ─────────────────────────────────────────────────────────
+    # Monitor — applies child events until the process exits
+    # ─────────────────────────────────────────────────────────
+    def _monitor(self, job_id: str, process, events) -> None:
+        outcome = None
+        while outcome is None:
+            try:
+                kind, payload = events.get(timeout=0.5)
+            except queue.Empty:
+                if not process.is_alive():
+                    outcome = self._drain(job_id, events) or ("exited", {"error": f"Training process exited with code {process.exitcode}"})
+                continue
+
+            outcome = self._apply_event(job_id, kind, payload)
+
+        process.join(5.0)
+        kind, payload = outcome
+
+        with self._lock:
+            cancelled = self._active is not None and self._active[2].is_set()
+            if kind == "done":
+                status = JOB_SUCCEEDED
+            elif cancelled:
+                status = JOB_CANCELLED
+            else:
+                status = JOB_FAILED
+
+            self._update(job_id, status=status, error=payload.get("error") if status == JOB_FAILED else None, finished_at=time.time())
+            if status == JOB_SUCCEEDED:
+                self._jobs[job_id]["progress"] = 1.0
+            self._active = None
+
+        logger.info(f"Training job {job_id} {status}")
+
+    # Progress events update the job record; "done"/"failed" end it and are returned
+    def _apply_event(self, job_id: str, kind: str, payload: dict):
+        if kind == "stage":
+            # The child's registry is not scraped — record stage durations here
+            if payload.get("seconds") is not None:
+                TRAIN_STAGE_SECONDS.observe(payload["seconds"], stage=payload["stage"])
+                TRAIN_STAGE_LAST_SECONDS.set(payload["seconds"], stage=payload["stage"])
+            with self._lock:
+                job          = self._jobs[job_id]
+                job["stage"] = payload["stage"]
+                job["stages"].append({**payload, "at": time.time()})
+        elif kind == "epoch":
+            with self._lock:
+                job             = self._jobs[job_id]
+                job["epoch"]    = payload["epoch"]
+                job["epochs"]   = payload["epochs"]
+                job["progress"] = round(payload["epoch"] / payload["epochs"], 4) if payload["epochs"] else 0.0
+                job["metrics"]  = payload["metrics"]
+                job["history"].append(payload)
+        else:
+            return (kind, payload)
+        return None
+
+    # The child may have sent its last events and exited between the
+    # timed-out get() and the liveness check — apply whatever is left
+    def _drain(self, job_id: str, events):
+        while True:
+            try:
+                kind, payload = events.get_nowait()
+            except queue.Empty:
+                return None
+            outcome = self._apply_event(job_id, kind, payload)
+            if outcome is not None:
+                return outcome
+
+    # ─────────────────────────────────────────────────────────
+    # Job records (caller holds _lock for _update/_snapshot)
+    # ─────────────────────────────────────────────────────────
+    def _update(self, job_id: str, **fields) -> None:
+        self._jobs[job_id].update(fields)
+
+    def _snapshot(self, job_id: str) -> dict:
+        job = dict(self._jobs[job_id])
+        job["history"] = list(job["history"])
+        job["stages"]  = list(job["stages"])
+        return job
+
+    def get(self, job_id: str):
+        with self._lock:
+            return self._snapshot(job_id) if job_id in self._jobs else None
+
+    def list(self) -> list:
+        with self._lock:
+            return [
+                        {key: job[key] for key in ("job_id", "status", "stage", "epoch", "epochs", "progress", "created_at", "finished_at")}
+                        for job in reversed(self._jobs.values())
+                   ]
@@ -0,0 +1,621 @@
+# ─────────────────────────────────────────────────────────────
+# Inference Worker Pool — Model Replicas in Separate Processes
+# ─────────────────────────────────────────────────────────────
+
+import os
+import time
+import queue
+import atexit
+import itertools
+import threading
+import multiprocessing as mp
+from collections                       import deque
+from concurrent.futures                import Future
+from multiprocessing                   import shared_memory
+
+import numpy as np
+
+from sign_lang.logger                  import logger
+from sign_lang.serving.batcher         import settle
+from sign_lang.serving.detections      import results_from_detections
+from sign_lang.serving.model_holder    import ModelHolder
+from sign_lang.serving.instrumentation import STAGE_SECONDS, MODEL_VERSION, BATCH_SIZE
+from sign_lang.constant.application    import (
+                                                   APP_INFERENCE_WORKERS,
+                                                   APP_INFERENCE_WORKER_THREADS,
+                                                   APP_INFERENCE_WORKER_PIN,
+                                                   APP_BATCH_MAX_SIZE,
+                                                   APP_BATCH_MAX_DELAY_MS
+                                              )
+
+BLOCK_ALIGN          = 1 << 20      # shared-memory blocks are sized in whole MiB so they can be reused
+RESPAWN_DELAY        = 5.0          # first restart delay of a dead worker, doubled per consecutive failure
+RESPAWN_MAX_DELAY    = 300.0        # ceiling for a worker that keeps failing to start
+HEALTH_CHECK_SECONDS = 1.0
+
+# ─────────────────────────────────────────────────────────────
+# Worker process entry point. Applies the thread budget before
+# torch is imported, loads its own ModelHolder (so hot reload
+# works per replica) and answers frames from its request queue.
+# ─────────────────────────────────────────────────────────────
+def _worker_main(index: int, threads: int, cpus: list, max_batch: int, requests, responses) -> None:
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[var] = str(threads)
+    if cpus and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+
+    try:
+        import torch
+        torch.set_num_threads(threads)
+
+        from sign_lang.serving.model_holder import ModelHolder
+        from sign_lang.serving.detections   import detections_array
+
+        holder = ModelHolder()
+        if not holder.exists():
+            responses.put(("missing", index, holder.model_path))
+            while not holder.exists():
+                time.sleep(holder.check_interval)               # wait for the first training run
+        holder.get()                                            # load and warm up before reporting ready
+    except BaseException as e:
+        responses.put(("failed", index, str(e)))
+        return
+
+    responses.put(("ready", index, os.getpid(), holder.signature, holder.backend))
+
+    # Each message is one batch formed by the parent's dispatcher
+    stopping = False
+    while not stopping:
+        message = requests.get()
+        batch   = []
+        while message is not None:
+            batch.extend(message)
+            if len(batch) >= max_batch:
+                break
+            try:
+                message = requests.get_nowait()                 # batches already routed here
+            except queue.Empty:
+                break
+        stopping = message is None
+        if not batch:
+            continue
+
+        # One predict() per distinct set of per-call arguments (imgsz, conf)
+        groups = {}
+        for task in batch:
+            groups.setdefault(task[4], []).append(task)
+
+        for args, tasks in groups.items():
+            try:
+                # Copy out and detach right away — the predictor and Results keep
+                # references to their inputs, and a mapping with live views cannot close
+                frames = []
+                for _, name, shape, dtype, _ in tasks:
+                    block = shared_memory.SharedMemory(name=name)
+                    try:
+                        frames.append(np.ndarray(shape, dtype=dtype, buffer=block.buf).copy())
+                    finally:
+                        block.close()
+
+                started = time.perf_counter()
+                results = holder.predict(frames, **dict(args))
+                elapsed = time.perf_counter() - started
+
+                for (task_id, *_), result in zip(tasks, results):
+                    responses.put(("result", index, task_id, detections_array(result), result.names, elapsed, holder.signature))
+
+            except Exception as e:
+                for task_id, *_ in tasks:
+                    responses.put(("error", index, task_id, str(e)))
+
+# ─────────────────────────────────────────────────────────────
+# Reusable shared-memory blocks for decoded frames. A block goes
+# back on the free list once its worker has answered; only the
+# block name, shape and dtype travel through the request queue.
+# ─────────────────────────────────────────────────────────────
+class _FrameArena:
+    def __init__(self, max_free: int):
+        self.max_free = max(1, max_free)
+        self._lock    = threading.Lock()
+        self._free    = []              # released blocks, smallest first
+        self._blocks  = 0
+        self._bytes   = 0
+
+    def acquire(self, nbytes: int):
+        with self._lock:
+            for i, block in enumerate(self._free):
+                if block.size >= nbytes:
+                    return self._free.pop(i)
+
+            size          = -(-max(1, nbytes) // BLOCK_ALIGN) * BLOCK_ALIGN
+            self._blocks += 1
+            self._bytes  += size
+        return shared_memory.SharedMemory(create=True, size=size)
+
+    def release(self, block) -> None:
+        with self._lock:
+            if len(self._free) < self.max_free:
+                self._free.append(block)
+                self._free.sort(key=lambda b: b.size)
+                return
+            self._blocks -= 1
+            self._bytes  -= block.size
+        self._destroy(block)
+
+    @staticmethod
+    def _destroy(block) -> None:
+        block.close()
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            free, self._free = self._free, []
+        for block in free:
+            self._destroy(block)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"blocks": self._blocks, "free": len(self._free), "mb": round(self._bytes / 2**20, 1)}
+
+# ─────────────────────────────────────────────────────────────
+# One submitted frame plus the future its caller is waiting on.
+# worker is set when the dispatcher routes the frame's batch.
+# ─────────────────────────────────────────────────────────────
+class _PendingFrame:
+    __slots__ = ("image", "args", "future", "worker", "block", "submitted_at")
+
+    def __init__(self, image, block, args: tuple = ()):
+        self.image        = image
+        self.args         = args
+        self.future       = Future()
+        self.worker       = None
+        self.block        = block
+        self.submitted_at = time.perf_counter()
+
+# Parent-side state of one worker process
+class _WorkerSlot:
+    def __init__(self, index: int, cpus: list):
+        self.index           = index
+        self.cpus            = cpus
+        self.process         = None
+        self.requests        = None
+        self.pid             = None
+        self.ready           = False
+        self.error           = None         # why the worker last failed to start
+        self.started_at      = 0.0
+        self.failures        = 0            # consecutive exits without becoming ready
+        self.restart_at      = None         # monotonic time of the scheduled restart, None while alive
+        self.in_flight       = 0
+        self.completed       = 0
+        self.errors          = 0
+        self.restarts        = 0
+        self.inference_total = 0.0
+
+# ─────────────────────────────────────────────────────────────
+# Same interface as MicroBatcher — submit() / predict() / stats()
+# — backed by N spawned worker processes, each with its own model
+# and a fixed torch thread count. Frames are written once into
+# shared memory; a dispatcher thread gathers them with the same
+# size/delay window as MicroBatcher and sends each batch to the
+# worker with the fewest frames in flight. A collector thread
+# turns the returned Nx6 detections back into Results and
+# restarts workers that die.
+# ─────────────────────────────────────────────────────────────
+class InferenceWorkerPool:
+    def __init__(
+                    self,
+                    workers        : int   = APP_INFERENCE_WORKERS,
+                    threads        : int   = APP_INFERENCE_WORKER_THREADS,
+                    pin            : bool  = APP_INFERENCE_WORKER_PIN,
+                    max_batch_size : int   = APP_BATCH_MAX_SIZE,
+                    max_delay_ms   : float = APP_BATCH_MAX_DELAY_MS,
+                ):
+        cpus                 = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count() or 1))
+
+        self.workers         = max(1, workers)
+        self.threads         = threads or max(1, len(cpus) // self.workers)
+        self.max_batch_size  = max(1, max_batch_size)
+        self.max_delay       = max(0.0, max_delay_ms) / 1000.0
+
+        # Disjoint core sets when they fit — from the lowest cores, training takes the highest
+        pinned               = pin and self.workers * self.threads <= len(cpus)
+        self._slots          = [
+                                    _WorkerSlot(i, cpus[i * self.threads:(i + 1) * self.threads] if pinned else None)
+                                    for i in range(self.workers)
+                               ]
+
+        self._ctx            = mp.get_context("spawn")
+        self._responses      = None
+        self._arena          = _FrameArena(max_free=self.workers * self.max_batch_size * 2)
+        self._lock           = threading.Lock()
+        self._queue          = queue.Queue()    # submitted frames waiting for the dispatcher
+        self._pending        = {}               # task id -> _PendingFrame, routed to a worker
+        self._task_ids       = itertools.count()
+        self._dispatcher     = None
+        self._collector      = None
+        self._closed         = False
+
+        # Served model — bumped when a worker reports newer weights than seen so far
+        self._signature      = None
+        self._version        = 0
+        self._watcher        = ModelHolder()    # never loads — only stats the weights on disk
+        self.backend         = None             # reported by the workers once they have loaded
+
+        # Counters — read by stats()
+        self._requests       = 0
+        self._recent_latency = deque(maxlen=1024)
+        self._recent_done    = deque(maxlen=4096)   # completion times for throughput
+
+    # ─────────────────────────────────────────────────────────
+    # Public state — version follows the workers' loaded weights
+    # so the result cache drops entries when they hot-reload
+    # ─────────────────────────────────────────────────────────
+    @property
+    def version(self) -> int:
+        return self._version
+
+    # Newest weights a worker has loaded vs the weights on disk now
+    @property
+    def signature(self):
+        return self._signature
+
+    def current_signature(self):
+        return self._watcher.current_signature()
+
+    # At least one worker has loaded and warmed up its model — /readyz
+    @property
+    def ready(self) -> bool:
+        return any(slot.ready for slot in self._slots)
+
+    def readiness(self) -> dict:
+        return {
+                    "mode"          : "workers",
+                    "ready"         : self.ready,
+                    "workers"       : self.workers,
+                    "workers_ready" : sum(slot.ready for slot in self._slots),
+                    "errors"        : {slot.index: slot.error for slot in self._slots if slot.error},
+                    "failing"       : {slot.index: slot.failures for slot in self._slots if slot.failures},
+               }
+
+    # Spawn the workers now — each loads and warms up its model
+    def start(self) -> None:
+        self._ensure_started()
+
+    # ─────────────────────────────────────────────────────────
+    # Start workers and the collector thread on first use
+    # ─────────────────────────────────────────────────────────
+    def _ensure_started(self) -> None:
+        if self._collector is not None:
+            return
+        with self._lock:
+            if self._collector is not None:
+                return
+            self._responses = self._ctx.Queue()
+            for slot in self._slots:
+                self._spawn(slot)
+            self._collector  = threading.Thread(target=self._collect, name="inference-pool", daemon=True)
+            self._collector.start()
+            self._dispatcher = threading.Thread(target=self._dispatch, name="inference-pool-dispatch", daemon=True)
+            self._dispatcher.start()
+            atexit.register(self.close)
+
+        logger.info(f"Started {self.workers} inference worker(s) with {self.threads} thread(s) each")
+
+    # Caller holds _lock
+    def _spawn(self, slot: _WorkerSlot) -> None:
+        slot.requests   = self._ctx.Queue()
+        slot.process    = self._ctx.Process(
+                                                target = _worker_main,
+                                                args   = (slot.index, self.threads, slot.cpus, self.max_batch_size, slot.requests, self._responses),
+                                                name   = f"inference-worker-{slot.index}",
+                                                daemon = True,
+                                           )
+        slot.ready      = False
+        slot.started_at = time.monotonic()
+        slot.restart_at = None
+        slot.process.start()
+        slot.pid        = slot.process.pid
+
+    # ─────────────────────────────────────────────────────────
+    # Enqueue one image — the future resolves to its own Results.
+    # predict_args (imgsz, conf) override the model defaults for it.
+    # ─────────────────────────────────────────────────────────
+    def submit(self, image, **predict_args) -> Future:
+        self._ensure_started()
+
+        image  = np.ascontiguousarray(image)
+        block  = self._arena.acquire(image.nbytes)
+        np.ndarray(image.shape, dtype=image.dtype, buffer=block.buf)[...] = image
+
+        pending = _PendingFrame(image, block, tuple(sorted(predict_args.items())))
+        with self._lock:
+            self._requests += 1
+        self._queue.put(pending)
+        return pending.future
+
+    def predict(self, image, timeout: float = None, **predict_args):
+        return self.submit(image, **predict_args).result(timeout=timeout)
+
+    # Several images submitted together, so they can share a batch
+    def predict_many(self, images: list, timeout: float = None, **predict_args) -> list:
+        futures = [self.submit(image, **predict_args) for image in images]
+        return [future.result(timeout=timeout) for future in futures]
+
+    # ─────────────────────────────────────────────────────────
+    # Block for the first frame, then gather batch-mates until the
+    # batch is full or the first frame's deadline passes. None is
+    # the stop sentinel from close().
+    # ─────────────────────────────────────────────────────────
+    def _collect_batch(self) -> list:
+        batch    = [self._queue.get()]
+        deadline = batch[0].submitted_at + self.max_delay if batch[0] is not None else 0.0
+
+        while batch[-1] is not None and len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining <= 0:
+                    batch.append(self._queue.get_nowait())     # drain whatever is already waiting
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    # ─────────────────────────────────────────────────────────
+    # Dispatcher — one message per batch to the least loaded worker
+    # ─────────────────────────────────────────────────────────
+    def _dispatch(self) -> None:
+        while True:
+            batch   = self._collect_batch()
+            closing = batch[-1] is None
+            frames  = []
+            for pending in batch:
+                if pending is None:
+                    continue
+                if pending.future.set_running_or_notify_cancel():   # routed — no longer cancellable
+                    frames.append(pending)
+                else:
+                    self._arena.release(pending.block)             # cancelled while queued
+
+            if frames:
+                self._send(frames)
+            if closing:
+                return
+
+    def _send(self, frames: list) -> None:
+        started_at = time.perf_counter()
+        BATCH_SIZE.observe(len(frames))
+        for pending in frames:
+            STAGE_SECONDS.observe(started_at - pending.submitted_at, path="pool", stage="queue_wait")
+
+        with self._lock:
+            if self._closed:
+                for pending in frames:
+                    settle(pending.future, error=RuntimeError("Inference worker pool closed"))
+                    self._arena.release(pending.block)
+                return
+
+            # Least loaded first; workers still loading their model, then dead ones, last
+            slot  = min(self._slots, key=lambda s: (not s.ready, s.restart_at is not None, s.in_flight))
+            tasks = []
+            for pending in frames:
+                task_id                 = next(self._task_ids)
+                pending.worker          = slot.index
+                self._pending[task_id]  = pending
+                tasks.append((task_id, pending.block.name, pending.image.shape, pending.image.dtype.str, pending.args))
+            slot.in_flight += len(tasks)
+            slot.requests.put(tasks)
+
+    # ─────────────────────────────────────────────────────────
+    # Collector — resolves futures from worker responses and
+    # checks worker health whenever it is idle or a second passes
+    # ─────────────────────────────────────────────────────────
+    def _collect(self) -> None:
+        last_check = time.monotonic()
+        while not self._closed:
+            try:
+                message = self._responses.get(timeout=HEALTH_CHECK_SECONDS)
+            except queue.Empty:
+                message = None
+            except (EOFError, OSError):
+                return
+
+            if message is not None:
+                self._handle(message)
+            if message is None or time.monotonic() - last_check >= HEALTH_CHECK_SECONDS:
+                self._check_workers()
+                last_check = time.monotonic()
+
+    def _handle(self, message: tuple) -> None:
+        kind, index = message[0], message[1]
+        slot        = self._slots[index]
+
+        if kind == "ready":
+            slot.ready    = True
+            slot.error    = None
+            slot.failures = 0
+            self.backend  = message[4]
+            self._observe_model(message[3])
+            logger.info(f"Inference worker {index} ready in process {message[2]}")
+            return
+        if kind == "missing":
+            slot.error = f"no model at {message[2]}"
+            return
+        if kind == "failed":
+            slot.error = message[2]
+            logger.error(f"Inference worker {index} failed to start: {message[2]}")
+            return
+
+        task_id = message[2]
+        with self._lock:
+            pending = self._pending.pop(task_id, None)
+            if pending is None:
+                return                                          # already failed by the health check
+            slot.in_flight -= 1
+
+        self._arena.release(pending.block)
+        round_trip = time.perf_counter() - pending.submitted_at
+
+        if kind == "error":
+            slot.errors += 1
+            settle(pending.future, error=RuntimeError(f"Inference worker {index}: {message[3]}"))
+            return
+
+        _, _, _, boxes, names, elapsed, signature = message
+        self._observe_model(signature)
+
+        slot.completed       += 1
+        slot.inference_total += elapsed
+        self._recent_latency.append(round_trip)
+        self._recent_done.append(time.monotonic())
+        STAGE_SECONDS.observe(elapsed, path="pool", stage="inference")
+        STAGE_SECONDS.observe(round_trip, path="pool", stage="round_trip")
+
+        try:
+            settle(pending.future, results_from_detections(pending.image, names, boxes))
+        except Exception as e:
+            settle(pending.future, error=e)
+
+    # Newer weights than any worker reported before → new version
+    def _observe_model(self, signature) -> None:
+        if signature is None or signature == self._signature:
+            return
+        if self._signature is None or signature[1] >= self._signature[1]:
+            self._signature  = signature
+            self._version   += 1
+            MODEL_VERSION.set(self._version)
+
+    # ─────────────────────────────────────────────────────────
+    # A dead worker fails its in-flight frames and is restarted,
+    # with the delay doubling for each exit that happens before it
+    # became ready — a worker that cannot load is not respawned
+    # every few seconds forever
+    # ─────────────────────────────────────────────────────────
+    def _check_workers(self) -> None:
+        for slot in self._slots:
+            if self._closed or slot.process is None or slot.process.is_alive():
+                continue
+
+            exitcode = slot.process.exitcode
+            with self._lock:
+                lost           = self._take_pending(slot)
+                slot.ready     = False
+            self._fail_lost(slot, lost, exitcode)
+
+            if slot.restart_at is None:
+                slot.failures   += 1
+                delay            = min(RESPAWN_DELAY * 2 ** (slot.failures - 1), RESPAWN_MAX_DELAY)
+                slot.restart_at  = time.monotonic() + delay
+                logger.warning(
+                                f"Inference worker {slot.index} exited with code {exitcode} "
+                                f"({slot.failures} consecutive failure(s)), restarting in {delay:.0f}s"
+                              )
+            if time.monotonic() < slot.restart_at:
+                continue
+            with self._lock:
+                lost           = self._take_pending(slot)    # routed here since the last check
+                slot.restarts += 1
+                self._spawn(slot)
+            self._fail_lost(slot, lost, exitcode)
+
+    # Frames routed to a dead worker (caller holds _lock)
+    def _take_pending(self, slot: _WorkerSlot) -> list:
+        lost = [(task_id, p) for task_id, p in self._pending.items() if p.worker == slot.index]
+        for task_id, _ in lost:
+            del self._pending[task_id]
+        slot.in_flight = 0
+        return lost
+
+    def _fail_lost(self, slot: _WorkerSlot, lost: list, exitcode) -> None:
+        for _, pending in lost:
+            self._arena.release(pending.block)
+            settle(pending.future, error=RuntimeError(f"Inference worker {slot.index} exited with code {exitcode}"))
+
+    # ─────────────────────────────────────────────────────────
+    # Stop workers and free shared memory at interpreter exit
+    # ─────────────────────────────────────────────────────────
+    def close(self) -> None:
+        if self._closed:
+            return
+        with self._lock:
+            self._closed = True
+        self._queue.put(None)
+        if self._dispatcher is not None:
+            self._dispatcher.join(2.0)
+
+        for slot in self._slots:
+            if slot.process is not None and slot.process.is_alive():
+                slot.requests.put(None)
+        for slot in self._slots:
+            if slot.process is not None:
+                slot.process.join(5.0)
+                if slot.process.is_alive():
+                    slot.process.terminate()
+
+        with self._lock:
+            pending, self._pending = list(self._pending.values()), {}
+        while True:
+            try:
+                item = self._queue.get_nowait()                 # never dispatched
+            except queue.Empty:
+                break
+            if item is not None:
+                pending.append(item)
+        for item in pending:
+            settle(item.future, error=RuntimeError("Inference worker pool closed"))
+            self._arena.release(item.block)
+        self._arena.close()
+
+    # ─────────────────────────────────────────────────────────
+    # Counters — per-worker load, round-trip latency, throughput
+    # ─────────────────────────────────────────────────────────
+    def stats(self) -> dict:
+        with self._lock:
+            recent = sorted(self._recent_latency)
+            now    = time.monotonic()
+            done   = [t for t in self._recent_done if now - t <= 10.0]
+
+            def percentile(p: float) -> float:
+                if not recent:
+                    return 0.0
+                return recent[min(len(recent) - 1, int(p * len(recent)))] * 1000.0
+
+            return {
+                        "mode"               : "workers",
+                        "workers"            : self.workers,
+                        "threads_per_worker" : self.threads,
+                        "max_batch_size"     : self.max_batch_size,
+                        "max_delay_ms"       : self.max_delay * 1000.0,
+                        "requests"           : self._requests,
+                        "queue_depth"        : self._queue.qsize(),
+                        "in_flight"          : len(self._pending),
+                        "model_version"      : self._version,
+                        "throughput_fps"     : round(len(done) / 10.0, 2),
+                        "round_trip_ms"      : {
+                                                    "mean" : sum(recent) / len(recent) * 1000.0 if recent else 0.0,
+                                                    "p50"  : percentile(0.50),
+                                                    "p95"  : percentile(0.95),
+                                                    "p99"  : percentile(0.99),
+                                               },
+                        "shared_memory"      : self._arena.stats(),
+                        "per_worker"         : [
+                                                    {
+                                                        "index"             : slot.index,
+                                                        "pid"               : slot.pid,
+                                                        "cpus"              : slot.cpus,
+                                                        "ready"             : slot.ready,
+                                                        "alive"             : slot.process is not None and slot.process.is_alive(),
+                                                        "in_flight"         : slot.in_flight,
+                                                        "completed"         : slot.completed,
+                                                        "errors"            : slot.errors,
+                                                        "restarts"          : slot.restarts,
+                                                        "failures"          : slot.failures,
+                                                        "mean_batch_ms"     : slot.inference_total / slot.completed * 1000.0 if slot.completed else 0.0,
+                                                    }
+                                                    for slot in self._slots
+                                               ],
+                   }
@@ -0,0 +1,252 @@
+# ─────────────────────────────────────────────────────────────
+# WebSocket Server — Client Camera Frames In, Detections Out
+#
+# Protocol — each binary message from the client is one frame:
+#   <uint32 big-endian sequence number><JPEG/PNG/WebP bytes>
+# and each reply is a JSON text message:
+#   {"seq", "width", "height", "detections", "latency_ms", "dropped"}
+# or {"seq", "error"} when the frame could not be processed.
+# ─────────────────────────────────────────────────────────────
+
+import json
+import time
+import asyncio
+import threading
+
+import websockets
+
+from sign_lang.logger                  import logger
+from sign_lang.utils.main_utils        import decodeBytesToArray
+from sign_lang.serving.detections      import detections_payload
+from sign_lang.serving.instrumentation import STAGE_SECONDS, WS_FRAMES_TOTAL, WS_CONNECTIONS
+from sign_lang.constant.application    import (
+                                                   APP_HOST,
+                                                   APP_WS_PORT,
+                                                   APP_WS_MAX_CONNECTIONS,
+                                                   APP_WS_MAX_IN_FLIGHT,
+                                                   APP_WS_MAX_MESSAGE_BYTES
+                                              )
+
+SEQ_BYTES            = 4
+CLOSE_TRY_AGAIN      = 1013         # RFC 6455 "Try Again Later" — connection cap reached
+
+# ─────────────────────────────────────────────────────────────
+# Per-connection state. At most max_in_flight frames are being
+# inferred; a frame that arrives meanwhile waits in a single slot
+# and is replaced — counted as dropped — by any newer frame.
+# ─────────────────────────────────────────────────────────────
+class _Connection:
+    def __init__(self, websocket, remote):
+        self.websocket = websocket
+        self.remote    = remote
+        self.in_flight = 0
+        self.waiting   = None           # (seq, data, received_at) of the newest frame not yet dispatched
+        self.tasks     = set()
+        self.closed    = False
+
+        self.received  = 0
+        self.inferred  = 0
+        self.dropped   = 0
+        self.errors    = 0
+
+# ─────────────────────────────────────────────────────────────
+# Asyncio WebSocket server on its own port and event-loop thread,
+# sharing the Flask app's batcher (MicroBatcher or worker pool).
+# Decoding runs on the loop's executor and inference on the
+# batcher, so the loop only moves bytes and futures.
+# ─────────────────────────────────────────────────────────────
+class FrameSocketServer:
+    def __init__(
+                    self,
+                    batcher,
+                    host              : str = APP_HOST,
+                    port              : int = APP_WS_PORT,
+                    max_connections   : int = APP_WS_MAX_CONNECTIONS,
+                    max_in_flight     : int = APP_WS_MAX_IN_FLIGHT,
+                    max_message_bytes : int = APP_WS_MAX_MESSAGE_BYTES,
+                ):
+        self.batcher           = batcher
+        self.host              = host
+        self.port              = port
+        self.max_connections   = max(1, max_connections)
+        self.max_in_flight     = max(1, max_in_flight)
+        self.max_message_bytes = max_message_bytes
+
+        self._connections      = set()
+        self._thread           = None
+
+        # Counters — read by stats()
+        self.rejected          = 0
+        self.received          = 0
+        self.inferred          = 0
+        self.dropped           = 0
+        self.errors            = 0
+
+    # ─────────────────────────────────────────────────────────
+    # Run the server on a daemon thread next to Flask
+    # ─────────────────────────────────────────────────────────
+    def start(self) -> "FrameSocketServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="ws-server", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        try:
+            asyncio.run(self.serve())
+        except Exception as e:
+            logger.error(f"WebSocket server on port {self.port} stopped: {e}")
+
+    async def serve(self) -> None:
+        async with websockets.serve(
+                                        self._handle,
+                                        self.host,
+                                        self.port,
+                                        max_size    = self.max_message_bytes,
+                                        compression = None,         # frames are already compressed
+                                   ):
+            logger.info(f"WebSocket server listening on ws://{self.host}:{self.port}")
+            await asyncio.Future()
+
+    # ─────────────────────────────────────────────────────────
+    # One client — enforce the connection cap, then read frames
+    # ─────────────────────────────────────────────────────────
+    async def _handle(self, websocket) -> None:
+        if len(self._connections) >= self.max_connections:
+            self.rejected += 1
+            WS_FRAMES_TOTAL.inc(outcome="rejected_connection")
+            await websocket.close(CLOSE_TRY_AGAIN, "server at connection limit")
+            return
+
+        conn = _Connection(websocket, websocket.remote_address)
+        self._connections.add(conn)
+        WS_CONNECTIONS.set(len(self._connections))
+
+        try:
+            async for message in websocket:
+                if isinstance(message, str):
+                    await self._control(conn, message)
+                    continue
+                if len(message) <= SEQ_BYTES:
+                    await self._send(conn, {"error": "frame message is too short"})
+                    continue
+
+                conn.received += 1
+                self.received += 1
+                frame          = (int.from_bytes(message[:SEQ_BYTES], "big"), message[SEQ_BYTES:], time.perf_counter())
+
+                if conn.in_flight < self.max_in_flight:
+                    self._dispatch(conn, frame)
+                else:
+                    if conn.waiting is not None:
+                        self._drop(conn)
+                    conn.waiting = frame
+
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            conn.closed  = True
+            conn.waiting = None
+            for task in list(conn.tasks):
+                task.cancel()
+            self._connections.discard(conn)
+            WS_CONNECTIONS.set(len(self._connections))
+
+    # Text messages — {"type": "stats"} returns this connection's counters
+    async def _control(self, conn: _Connection, message: str) -> None:
+        try:
+            kind = json.loads(message).get("type")
+        except (ValueError, AttributeError):
+            kind = None
+
+        if kind == "stats":
+            await self._send(conn, {"type": "stats", **self._connection_stats(conn)})
+        else:
+            await self._send(conn, {"error": "unknown control message"})
+
+    def _drop(self, conn: _Connection) -> None:
+        conn.dropped += 1
+        self.dropped += 1
+        WS_FRAMES_TOTAL.inc(outcome="dropped")
+
+    # ─────────────────────────────────────────────────────────
+    # Frame lifecycle — decode, infer, reply; then start the
+    # waiting frame, if any, in the slot this one freed
+    # ─────────────────────────────────────────────────────────
+    def _dispatch(self, conn: _Connection, frame: tuple) -> None:
+        conn.in_flight += 1
+        task            = asyncio.get_running_loop().create_task(self._infer(conn, *frame))
+        conn.tasks.add(task)
+        task.add_done_callback(conn.tasks.discard)
+
+    async def _infer(self, conn: _Connection, seq: int, data: bytes, received_at: float) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            started = time.perf_counter()
+            image   = await loop.run_in_executor(None, decodeBytesToArray, data)
+            STAGE_SECONDS.observe(time.perf_counter() - started, path="ws", stage="decode")
+
+            started = time.perf_counter()
+            # Shielded — a client disconnecting cancels this task, and that must not
+            # cancel the shared batcher future its batch-mates are resolved with
+            result  = await asyncio.shield(asyncio.wrap_future(self.batcher.submit(image)))
+            STAGE_SECONDS.observe(time.perf_counter() - started, path="ws", stage="inference")
+
+            latency = time.perf_counter() - received_at
+            STAGE_SECONDS.observe(latency, path="ws", stage="total")
+
+            conn.inferred += 1
+            self.inferred += 1
+            WS_FRAMES_TOTAL.inc(outcome="inferred")
+            await self._send(conn, {"seq": seq, **detections_payload(result), "latency_ms": round(latency * 1000.0, 1), "dropped": conn.dropped})
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            conn.errors += 1
+            self.errors += 1
+            WS_FRAMES_TOTAL.inc(outcome="error")
+            await self._send(conn, {"seq": seq, "error": str(e)})
+
+        finally:
+            conn.in_flight -= 1
+            if conn.waiting is not None and not conn.closed:
+                frame, conn.waiting = conn.waiting, None
+                self._dispatch(conn, frame)
+
+    async def _send(self, conn: _Connection, payload: dict) -> None:
+        try:
+            await conn.websocket.send(json.dumps(payload))
+        except websockets.ConnectionClosed:
+            conn.closed = True
+
+    # ─────────────────────────────────────────────────────────
+    # Counters — server totals plus one entry per connection
+    # ─────────────────────────────────────────────────────────
+    @staticmethod
+    def _connection_stats(conn: _Connection) -> dict:
+        return {
+                    "received"  : conn.received,
+                    "inferred"  : conn.inferred,
+                    "dropped"   : conn.dropped,
+                    "errors"    : conn.errors,
+                    "in_flight" : conn.in_flight,
+               }
+
+    def stats(self) -> dict:
+        connections = list(self._connections)
+        return {
+                    "port"                 : self.port,
+                    "connections"          : len(connections),
+                    "max_connections"      : self.max_connections,
+                    "max_in_flight"        : self.max_in_flight,
+                    "rejected_connections" : self.rejected,
+                    "received"             : self.received,
+                    "inferred"             : self.inferred,
+                    "dropped"              : self.dropped,
+                    "errors"               : self.errors,
+                    "per_connection"       : [
+                                                {"remote": str(conn.remote), **self._connection_stats(conn)}
+                                                for conn in connections
+                                             ],
+               }
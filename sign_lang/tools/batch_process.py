@@ -0,0 +1,395 @@
+# ─────────────────────────────────────────────────────────────
+# Offline Batch Processing — Video Files and Image Directories
+#
+# Usage:
+#   python -m sign_lang.tools.batch_process \
+#       --source sessions/ --jsonl detections.jsonl \
+#       --video annotated.mp4 --batch 8 --resume
+#
+# Frames flow decode thread → bounded queue → batched predict →
+# bounded queue → writer thread, so memory stays flat however
+# long the input is. Every JSONL line carries a global frame
+# index; --resume continues after the last complete line.
+# ─────────────────────────────────────────────────────────────
+
+import os
+import sys
+import json
+import time
+import queue
+import argparse
+import threading
+from collections                     import deque
+from concurrent.futures              import ThreadPoolExecutor
+
+import cv2
+
+from sign_lang.logger                import logger
+from sign_lang.exception             import AppException
+from sign_lang.serving.model_holder  import ModelHolder
+from sign_lang.serving.detections    import detections_payload, limit_resolution
+from sign_lang.constant.application  import APP_MODEL_PATH
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".webp")
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv", ".webm", ".m4v")
+
+_END             = object()         # end-of-stream marker on both queues
+
+# ─────────────────────────────────────────────────────────────
+# Inputs in processing order — a single file, or every image and
+# video under a directory sorted by path
+# ─────────────────────────────────────────────────────────────
+def list_inputs(source: str) -> list:
+    if not os.path.isdir(source):
+        return [source]
+
+    paths = []
+    for root, dirs, files in os.walk(source):
+        dirs.sort()
+        paths.extend(
+                        os.path.join(root, name) for name in sorted(files)
+                        if name.lower().endswith(IMAGE_EXTENSIONS + VIDEO_EXTENSIONS)
+                    )
+    return paths
+
+# ─────────────────────────────────────────────────────────────
+# Resume point — frame index after the last complete JSONL line.
+# A torn last line (killed mid-write) is cut off first. Only the
+# file's tail is read.
+# ─────────────────────────────────────────────────────────────
+def resume_frame(jsonl_path: str, tail_bytes: int = 1 << 20) -> int:
+    if not jsonl_path or not os.path.exists(jsonl_path):
+        return 0
+
+    with open(jsonl_path, "rb+") as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - tail_bytes))
+        tail = f.read()
+
+        end  = tail.rfind(b"\n")
+        if end < 0:
+            f.truncate(0)
+            return 0
+        if end != len(tail) - 1:
+            f.truncate(size - len(tail) + end + 1)
+
+        last = tail[:end].rsplit(b"\n", 1)[-1]
+        return json.loads(last)["frame"] + 1
+
+# One decoded frame and where it came from
+class Frame:
+    __slots__ = ("index", "source", "position", "image")
+
+    def __init__(self, index: int, source: str, position: int, image):
+        self.index    = index       # global frame number across all inputs
+        self.source   = source
+        self.position = position    # frame number within its source file
+        self.image    = image
+
+# ─────────────────────────────────────────────────────────────
+# Runs one source through the model and writes the outputs
+# ─────────────────────────────────────────────────────────────
+class BatchProcessor:
+    def __init__(
+                    self,
+                    model_path     : str   = APP_MODEL_PATH,
+                    batch_size     : int   = 8,
+                    image_size     : int   = None,
+                    decode_workers : int   = 4,
+                    queue_batches  : int   = 4,
+                    log_every      : float = 10.0,
+                ):
+        self.model_holder   = ModelHolder(model_path=model_path, check_interval=float("inf"))
+        self.batch_size     = max(1, batch_size)
+        self.image_size     = image_size
+        self.decode_workers = max(1, decode_workers)
+        self.log_every      = log_every
+
+        # Bounded queues — the only frames held in memory at any time
+        self._frames        = queue.Queue(maxsize=self.batch_size * queue_batches)
+        self._results       = queue.Queue(maxsize=queue_batches)
+        self._stop          = threading.Event()
+        self._errors        = []
+
+    # ─────────────────────────────────────────────────────────
+    # Blocking put that gives up once the run is stopping
+    # ─────────────────────────────────────────────────────────
+    def _put(self, target: queue.Queue, item) -> bool:
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    # Blocking get that returns _END once the run is stopping
+    def _get(self, source: queue.Queue):
+        while not self._stop.is_set():
+            try:
+                return source.get(timeout=0.5)
+            except queue.Empty:
+                continue
+        return _END
+
+    # ─────────────────────────────────────────────────────────
+    # Decode thread — images are read by a thread pool with a
+    # bounded look-ahead, videos frame by frame; order is kept
+    # ─────────────────────────────────────────────────────────
+    def _decode(self, inputs: list, start_frame: int) -> None:
+        index   = 0
+        pending = deque()           # (index, path, future) of images being decoded
+
+        def flush(keep: int) -> bool:
+            while len(pending) > keep:
+                frame_index, path, future = pending.popleft()
+                image                     = future.result()
+                if image is None:
+                    logger.warning(f"Skipping unreadable image {path}")
+                    continue
+                if not self._put(self._frames, Frame(frame_index, path, 0, image)):
+                    return False
+            return True
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.decode_workers) as pool:
+                for path in inputs:
+                    if self._stop.is_set():
+                        break
+
+                    if not path.lower().endswith(VIDEO_EXTENSIONS):
+                        if index >= start_frame:
+                            pending.append((index, path, pool.submit(cv2.imread, path, cv2.IMREAD_COLOR)))
+                            if not flush(self.decode_workers * 2):
+                                break
+                        index += 1
+                        continue
+
+                    # Videos are sequential — drain queued images first to keep order
+                    if not flush(0):
+                        break
+                    index = self._decode_video(path, index, start_frame)
+                    if index is None:
+                        break
+
+                flush(0)
+        except Exception as e:
+            self._errors.append(e)
+            self._stop.set()
+        finally:
+            self._put(self._frames, _END)
+
+    # Returns the next global index, or None when the run is stopping
+    def _decode_video(self, path: str, index: int, start_frame: int):
+        capture = cv2.VideoCapture(path)
+        if not capture.isOpened():
+            logger.warning(f"Skipping unreadable video {path}")
+            return index
+
+        try:
+            count    = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+            if count > 0 and index + count <= start_frame:
+                return index + count                            # resumed past this file entirely
+
+            position = 0
+            if index < start_frame:
+                position = start_frame - index
+                capture.set(cv2.CAP_PROP_POS_FRAMES, position)
+                index    = start_frame
+
+            while True:
+                ok, image = capture.read()
+                if not ok:
+                    return index
+                if not self._put(self._frames, Frame(index, path, position, image)):
+                    return None
+                index    += 1
+                position += 1
+        finally:
+            capture.release()
+
+    # ─────────────────────────────────────────────────────────
+    # Writer thread — JSONL line per frame and annotated video,
+    # flushed once per batch so --resume never loses a batch
+    # ─────────────────────────────────────────────────────────
+    def _write(self, jsonl_path: str, video_path: str, video_fps: float, max_size: int, append: bool) -> None:
+        jsonl  = open(jsonl_path, "a" if append else "w") if jsonl_path else None
+        writer = None
+        size   = None
+
+        try:
+            while True:
+                item = self._get(self._results)
+                if item is _END:
+                    break
+
+                for frame, result in item:
+                    if jsonl is not None:
+                        row = {"frame": frame.index, "source": frame.source, "position": frame.position, **detections_payload(result)}
+                        jsonl.write(json.dumps(row) + "\n")
+
+                    if video_path:
+                        annotated = limit_resolution(result.plot(), max_size)
+                        if writer is None:
+                            size   = (annotated.shape[1], annotated.shape[0])
+                            writer = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*"mp4v"), video_fps, size)
+                        if (annotated.shape[1], annotated.shape[0]) != size:
+                            annotated = cv2.resize(annotated, size, interpolation=cv2.INTER_AREA)
+                        writer.write(annotated)
+
+                if jsonl is not None:
+                    jsonl.flush()
+
+        except Exception as e:
+            self._errors.append(e)
+            self._stop.set()
+        finally:
+            if jsonl is not None:
+                jsonl.close()
+            if writer is not None:
+                writer.release()
+
+    # ─────────────────────────────────────────────────────────
+    # Main loop — full batches from the decode queue through one
+    # predict() each; returns the run summary
+    # ─────────────────────────────────────────────────────────
+    def run(
+                self,
+                source      : str,
+                jsonl_path  : str   = None,
+                video_path  : str   = None,
+                start_frame : int   = 0,
+                resume      : bool  = False,
+                video_fps   : float = None,
+                max_size    : int   = None,
+            ) -> dict:
+        try:
+            if not jsonl_path and not video_path:
+                raise ValueError("Nothing to write — pass a JSONL path, a video path or both")
+
+            inputs      = list_inputs(source)
+            if not inputs or not os.path.exists(inputs[0]):
+                raise ValueError(f"No images or videos found at {source}")
+
+            if resume:
+                start_frame = max(start_frame, resume_frame(jsonl_path))
+
+            # An mp4 cannot be appended to — a resumed run writes its own segment
+            if video_path and start_frame > 0:
+                stem, ext  = os.path.splitext(video_path)
+                video_path = f"{stem}.from{start_frame}{ext}"
+
+            if video_fps is None:
+                capture   = cv2.VideoCapture(inputs[0]) if inputs[0].lower().endswith(VIDEO_EXTENSIONS) else None
+                video_fps = (capture.get(cv2.CAP_PROP_FPS) if capture is not None else 0) or 30.0
+                if capture is not None:
+                    capture.release()
+
+            model    = self.model_holder.get()
+            args     = {"verbose": False, **({"imgsz": self.image_size} if self.image_size else {})}
+            logger.info(f"Processing {len(inputs)} input(s) from {source} starting at frame {start_frame}")
+
+            decoder  = threading.Thread(target=self._decode, args=(inputs, start_frame), name="batch-decode", daemon=True)
+            writer   = threading.Thread(target=self._write, args=(jsonl_path, video_path, video_fps, max_size, start_frame > 0), name="batch-write", daemon=True)
+            decoder.start()
+            writer.start()
+
+            frames, infer_s, wait_s = 0, 0.0, 0.0
+            next_frame              = start_frame
+            started  = time.perf_counter()
+            last_log = started
+            done     = False
+
+            while not done and not self._stop.is_set():
+                waited = time.perf_counter()
+                batch  = []
+                while len(batch) < self.batch_size:
+                    item = self._get(self._frames)
+                    if item is _END:
+                        done = True
+                        break
+                    batch.append(item)
+                wait_s += time.perf_counter() - waited
+
+                if batch:
+                    predicted   = time.perf_counter()
+                    results     = model.predict([frame.image for frame in batch], **args)
+                    infer_s    += time.perf_counter() - predicted
+
+                    self._put(self._results, list(zip(batch, results)))
+                    frames     += len(batch)
+                    next_frame  = batch[-1].index + 1
+
+                if time.perf_counter() - last_log >= self.log_every:
+                    last_log = time.perf_counter()
+                    logger.info(f"{frames} frames, {frames / (last_log - started):.1f} FPS, last frame {batch[-1].index if batch else '-'}")
+
+            self._put(self._results, _END)
+            writer.join()
+            self._stop.set()
+            decoder.join()
+            if self._errors:
+                raise self._errors[0]
+
+            elapsed  = time.perf_counter() - started
+            summary  = {
+                            "source"          : source,
+                            "start_frame"     : start_frame,
+                            "frames"          : frames,
+                            "next_frame"      : next_frame,
+                            "seconds"         : round(elapsed, 2),
+                            "fps"             : round(frames / elapsed, 2) if elapsed else 0.0,
+                            "inference_fps"   : round(frames / infer_s, 2) if infer_s else 0.0,
+                            "decode_wait_s"   : round(wait_s, 2),            # time the model sat idle waiting for frames
+                            "batch_size"      : self.batch_size,
+                            "backend"         : self.model_holder.backend,
+                            "jsonl_path"      : jsonl_path,
+                            "video_path"      : video_path,
+                       }
+            logger.info(f"Processed {frames} frames in {elapsed:.1f}s ({summary['fps']} FPS)")
+            return summary
+
+        except Exception as e:
+            self._stop.set()
+            raise AppException(e, sys)
+
+def process_source(source: str, jsonl_path: str = None, video_path: str = None, **kwargs) -> dict:
+    run_args = {key: kwargs.pop(key) for key in ("start_frame", "resume", "video_fps", "max_size") if key in kwargs}
+    return BatchProcessor(**kwargs).run(source, jsonl_path, video_path, **run_args)
+
+# ─────────────────────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────────────────────
+def main(argv: list = None) -> None:
+    parser = argparse.ArgumentParser(description="Run sign-language detection over video files or image directories")
+    parser.add_argument("--source",         required=True,                                   help="video file, image file or directory")
+    parser.add_argument("--jsonl",          default=None,                                    help="per-frame detections output (JSON lines)")
+    parser.add_argument("--video",          default=None,                                    help="annotated video output (.mp4)")
+    parser.add_argument("--model",          default=APP_MODEL_PATH,                          help="PyTorch weights (best.pt); exports are picked up as in serving")
+    parser.add_argument("--batch",          default=8,                    type=int,          help="frames per predict call")
+    parser.add_argument("--imgsz",          default=None,                 type=int,          help="inference image size, default the model's")
+    parser.add_argument("--decode-workers", default=4,                    type=int,          help="threads decoding images")
+    parser.add_argument("--start-frame",    default=0,                    type=int,          help="skip frames before this global index")
+    parser.add_argument("--resume",         action="store_true",                             help="continue after the last frame in --jsonl")
+    parser.add_argument("--fps",            default=None,                 type=float,        help="output video FPS, default the source's or 30")
+    parser.add_argument("--max-size",       default=None,                 type=int,          help="longest side of the annotated video")
+    args   = parser.parse_args(argv)
+
+    summary = process_source(
+                                args.source,
+                                jsonl_path     = args.jsonl,
+                                video_path     = args.video,
+                                model_path     = args.model,
+                                batch_size     = args.batch,
+                                image_size     = args.imgsz,
+                                decode_workers = args.decode_workers,
+                                start_frame    = args.start_frame,
+                                resume         = args.resume,
+                                video_fps      = args.fps,
+                                max_size       = args.max_size,
+                            )
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+# ─────────────────────────────────────────────────────────────
+# Inference Benchmark — Backends × Image Size × Batch × Threads
+#
+# Usage:
+#   python -m sign_lang.tools.benchmark \
+#       --model artifacts/model_trainer/best.pt --backends auto \
+#       --imgsz 320,416,640 --batch 1,4 --threads 1,4 \
+#       --source data/inputImage.jpg --output bench.json
+# ─────────────────────────────────────────────────────────────
+
+import os
+import sys
+import glob
+import json
+import time
+import queue
+import platform
+import argparse
+import resource
+import itertools
+import subprocess
+import multiprocessing as mp
+
+import numpy as np
+
+from sign_lang.logger                import logger
+from sign_lang.exception             import AppException
+from sign_lang.utils.main_utils      import read_json_file, write_json_file
+from sign_lang.constant.application  import APP_MODEL_PATH, APP_EXPORT_REPORT_PATH
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".webp")
+
+# ─────────────────────────────────────────────────────────────
+# Resolve backend names to model paths — "auto" means every
+# backend listed in the ModelExporter report
+# ─────────────────────────────────────────────────────────────
+def resolve_backends(model_path: str, backends: list, report_path: str = APP_EXPORT_REPORT_PATH) -> dict:
+    exported = read_json_file(report_path).get("models", {}) if os.path.exists(report_path) else {}
+
+    if backends == ["auto"]:
+        return {"pytorch": model_path, **{name: path for name, path in exported.items() if name != "pytorch"}}
+
+    resolved = {}
+    for backend in backends:
+        if backend == "pytorch":
+            resolved[backend] = model_path
+        elif backend in exported:
+            resolved[backend] = exported[backend]
+        else:
+            raise ValueError(f"Backend {backend!r} not found in {report_path}")
+    return resolved
+
+# ─────────────────────────────────────────────────────────────
+# Collect benchmark images from a file or a directory tree
+# ─────────────────────────────────────────────────────────────
+def collect_images(source: str) -> list:
+    if os.path.isdir(source):
+        return sorted(
+                        path for path in glob.glob(os.path.join(source, "**", "*"), recursive=True)
+                        if path.lower().endswith(IMAGE_EXTENSIONS)
+                     )
+    return [source]
+
+# ─────────────────────────────────────────────────────────────
+# Latency summary in milliseconds
+# ─────────────────────────────────────────────────────────────
+def summarize(latencies_s: list) -> dict:
+    values = np.asarray(latencies_s, dtype=np.float64) * 1000.0
+    if values.size == 0:
+        return {}
+    return {
+                "mean" : float(values.mean()),
+                "p50"  : float(np.percentile(values, 50)),
+                "p90"  : float(np.percentile(values, 90)),
+                "p95"  : float(np.percentile(values, 95)),
+                "p99"  : float(np.percentile(values, 99)),
+                "min"  : float(values.min()),
+                "max"  : float(values.max()),
+           }
+
+# ─────────────────────────────────────────────────────────────
+# One benchmark case — runs in a fresh process so cold-start and
+# peak RSS belong to this configuration alone
+# ─────────────────────────────────────────────────────────────
+def run_case(case: dict, image_paths: list, warmup: int, iterations: int) -> dict:
+    import cv2
+    import torch
+    from ultralytics import YOLO
+
+    torch.set_num_threads(case["threads"])
+    cv2.setNumThreads(case["threads"])
+
+    images  = [cv2.imread(path) for path in image_paths]
+    images  = [image for image in images if image is not None]
+    if not images:
+        raise ValueError("No readable images in benchmark source")
+
+    batches = itertools.cycle(
+                                [images[(i + j) % len(images)] for j in range(case["batch"])]
+                                for i in range(0, len(images), case["batch"])
+                             )
+    args    = dict(imgsz=case["imgsz"], device="cpu", verbose=False)
+
+    # Cold — model construction plus the very first batch
+    started   = time.perf_counter()
+    model     = YOLO(case["model_path"], task="detect")
+    load_s    = time.perf_counter() - started
+
+    started   = time.perf_counter()
+    model.predict(next(batches), **args)
+    cold_s    = time.perf_counter() - started
+
+    for _ in range(max(0, warmup - 1)):
+        model.predict(next(batches), **args)
+
+    # Warm — timed steady-state iterations
+    latencies = []
+    stages    = {"preprocess": [], "inference": [], "postprocess": []}
+    started   = time.perf_counter()
+    for _ in range(iterations):
+        batch_started = time.perf_counter()
+        results       = model.predict(next(batches), **args)
+        latencies.append(time.perf_counter() - batch_started)
+
+        # Ultralytics reports per-image stage timings in ms
+        for stage in stages:
+            stages[stage].append(float(np.mean([r.speed.get(stage, 0.0) for r in results])))
+    total_s   = time.perf_counter() - started
+
+    return {
+                **case,
+                "load_ms"               : load_s * 1000.0,
+                "cold_batch_ms"         : cold_s * 1000.0,
+                "warm_batch_ms"         : summarize(latencies),
+                "warm_image_ms"         : summarize([l / case["batch"] for l in latencies]),
+                "stage_ms_per_image"    : {stage: float(np.mean(values)) for stage, values in stages.items()},
+                "throughput_img_per_s"  : iterations * case["batch"] / total_s if total_s else 0.0,
+                "peak_rss_mb"           : resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0,   # KiB on Linux
+           }
+
+def _case_worker(case, image_paths, warmup, iterations, results_queue) -> None:
+    try:
+        results_queue.put(run_case(case, image_paths, warmup, iterations))
+    except Exception as e:
+        results_queue.put({**case, "error": str(e)})
+
+# Wait for the child's result, noticing if it dies (e.g. OOM-killed)
+def _run_isolated(context, case, image_paths, warmup, iterations) -> dict:
+    results_queue = context.Queue()
+    process       = context.Process(target=_case_worker, args=(case, image_paths, warmup, iterations, results_queue))
+    process.start()
+
+    while True:
+        try:
+            result = results_queue.get(timeout=1.0)
+            break
+        except queue.Empty:
+            if not process.is_alive():
+                result = {**case, "error": f"benchmark worker exited with code {process.exitcode}"}
+                break
+
+    process.join()
+    return result
+
+# ─────────────────────────────────────────────────────────────
+# Metadata that makes results comparable across commits
+# ─────────────────────────────────────────────────────────────
+def run_metadata(source: str, n_images: int) -> dict:
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        commit = None
+
+    return {
+                "commit"    : commit,
+                "timestamp" : time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "host"      : platform.node(),
+                "platform"  : platform.platform(),
+                "python"    : platform.python_version(),
+                "cpu_count" : os.cpu_count(),
+                "source"    : source,
+                "n_images"  : n_images,
+           }
+
+# ─────────────────────────────────────────────────────────────
+# Sweep every combination and write a JSON report
+# ─────────────────────────────────────────────────────────────
+def run_benchmark(
+                    model_path  : str  = APP_MODEL_PATH,
+                    backends    : list = ("pytorch",),
+                    image_sizes : list = (416,),
+                    batch_sizes : list = (1,),
+                    threads     : list = (os.cpu_count() or 1,),
+                    source      : str  = os.path.join("data", "inputImage.jpg"),
+                    warmup      : int  = 3,
+                    iterations  : int  = 20,
+                    isolate     : bool = True,
+                    output_path : str  = None,
+                 ) -> dict:
+    try:
+        models      = resolve_backends(model_path, list(backends))
+        image_paths = collect_images(source)
+        if not image_paths:
+            raise ValueError(f"No images found at {source}")
+
+        report  = {"meta": run_metadata(source, len(image_paths)), "results": []}
+        context = mp.get_context("spawn")
+
+        for (backend, path), imgsz, batch, n_threads in itertools.product(models.items(), image_sizes, batch_sizes, threads):
+            case = {"backend": backend, "model_path": path, "imgsz": imgsz, "batch": batch, "threads": n_threads}
+            logger.info(f"Benchmarking {case}")
+
+            if isolate:
+                result  = _run_isolated(context, case, image_paths, warmup, iterations)
+            else:
+                result  = run_case(case, image_paths, warmup, iterations)
+
+            report["results"].append(result)
+            if "error" in result:
+                logger.warning(f"Case failed: {result['error']}")
+            else:
+                logger.info(
+                                f"{backend} imgsz={imgsz} batch={batch} threads={n_threads}: "
+                                f"p50 {result['warm_image_ms']['p50']:.1f} ms/img, "
+                                f"{result['throughput_img_per_s']:.1f} img/s, "
+                                f"peak RSS {result['peak_rss_mb']:.0f} MB"
+                           )
+
+        if output_path:
+            write_json_file(output_path, report)
+            logger.info(f"Benchmark report written to {output_path}")
+
+        return report
+
+    except Exception as e:
+        raise AppException(e, sys)
+
+# ─────────────────────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────────────────────
+def _int_list(value: str) -> list:
+    return [int(v) for v in value.split(",") if v]
+
+def main(argv: list = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark YOLOv11 sign-language inference on CPU")
+    parser.add_argument("--model",      default=APP_MODEL_PATH,                          help="PyTorch weights (best.pt)")
+    parser.add_argument("--backends",   default="pytorch",                               help="comma list of pytorch,onnx,openvino,openvino_int8 or 'auto'")
+    parser.add_argument("--imgsz",      default="416",                type=_int_list,    help="comma list of image sizes")
+    parser.add_argument("--batch",      default="1",                  type=_int_list,    help="comma list of batch sizes")
+    parser.add_argument("--threads",    default=str(os.cpu_count() or 1), type=_int_list, help="comma list of torch thread counts")
+    parser.add_argument("--source",     default=os.path.join("data", "inputImage.jpg"),  help="image file or directory")
+    parser.add_argument("--warmup",     default=3,                    type=int)
+    parser.add_argument("--iterations", default=20,                   type=int)
+    parser.add_argument("--no-isolate", action="store_true",                             help="run every case in this process")
+    parser.add_argument("--output",     default="bench_output.json",                     help="JSON report path")
+    args   = parser.parse_args(argv)
+
+    report = run_benchmark(
+                            model_path  = args.model,
+                            backends    = args.backends.split(","),
+                            image_sizes = args.imgsz,
+                            batch_sizes = args.batch,
+                            threads     = args.threads,
+                            source      = args.source,
+                            warmup      = args.warmup,
+                            iterations  = args.iterations,
+                            isolate     = not args.no_isolate,
+                            output_path = args.output,
+                          )
+    print(json.dumps(report["results"], indent=2))
+
+
+if __name__ == "__main__":
+    main()
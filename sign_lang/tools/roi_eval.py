@@ -0,0 +1,216 @@
+# ─────────────────────────────────────────────────────────────
+# ROI Evaluation — Two-Stage vs Single-Pass Latency and mAP
+#
+# Usage:
+#   python -m sign_lang.tools.roi_eval \
+#       --model artifacts/model_trainer/best.pt \
+#       --data artifacts/data_ingestion/feature_store/Sign_Language_Images \
+#       --coarse 256 --fine 416 --output roi_eval.json
+# ─────────────────────────────────────────────────────────────
+
+import os
+import sys
+import json
+import time
+import argparse
+
+import cv2
+import numpy as np
+
+from sign_lang.logger                     import logger
+from sign_lang.exception                  import AppException
+from sign_lang.utils.main_utils           import write_json_file
+from sign_lang.serving.roi                import RoiDetector
+from sign_lang.serving.batcher            import MicroBatcher
+from sign_lang.serving.detections         import detections_array
+from sign_lang.serving.model_holder       import ModelHolder
+from sign_lang.tools.benchmark            import collect_images, summarize, run_metadata
+from sign_lang.constant.training_pipeline import (
+                                                    ARTIFACTS_DIR,
+                                                    DATA_INGESTION_DIR_NAME,
+                                                    DATA_INGESTION_FEATURE_STORE_DIR
+                                                 )
+from sign_lang.constant.application       import (
+                                                    APP_MODEL_PATH,
+                                                    APP_ROI_COARSE_IMAGE_SIZE,
+                                                    APP_ROI_FINE_IMAGE_SIZE
+                                                 )
+
+IOU_THRESHOLDS   = np.linspace(0.5, 0.95, 10)
+DEFAULT_DATA_DIR = os.path.join(ARTIFACTS_DIR, DATA_INGESTION_DIR_NAME, DATA_INGESTION_FEATURE_STORE_DIR, "Sign_Language_Images")
+
+# ─────────────────────────────────────────────────────────────
+# Ground truth for one image — YOLO label lines to pixel xyxy
+# ─────────────────────────────────────────────────────────────
+def load_labels(label_path: str, width: int, height: int) -> np.ndarray:
+    rows = []
+    if os.path.exists(label_path):
+        with open(label_path) as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) == 5:
+                    cls, cx, cy, w, h = (float(v) for v in fields)
+                    rows.append([(cx - w / 2) * width, (cy - h / 2) * height, (cx + w / 2) * width, (cy + h / 2) * height, cls])
+    return np.asarray(rows, dtype=np.float32).reshape(-1, 5)
+
+def box_iou(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    w     = np.clip(np.minimum(a[:, None, 2], b[None, :, 2]) - np.maximum(a[:, None, 0], b[None, :, 0]), 0, None)
+    h     = np.clip(np.minimum(a[:, None, 3], b[None, :, 3]) - np.maximum(a[:, None, 1], b[None, :, 1]), 0, None)
+    inter = w * h
+    area  = lambda boxes: (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    return inter / (area(a)[:, None] + area(b)[None, :] - inter + 1e-9)
+
+# ─────────────────────────────────────────────────────────────
+# True-positive matrix [predictions × IoU thresholds] — each label
+# is matched at most once, most confident prediction first
+# ─────────────────────────────────────────────────────────────
+def match_predictions(predictions: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    tp = np.zeros((len(predictions), len(IOU_THRESHOLDS)), dtype=bool)
+    if not len(predictions) or not len(labels):
+        return tp
+
+    iou   = box_iou(predictions[:, :4], labels[:, :4])
+    iou[predictions[:, 5][:, None] != labels[:, 4][None, :]] = 0.0
+    order = np.argsort(-predictions[:, 4])
+
+    for t, threshold in enumerate(IOU_THRESHOLDS):
+        taken = np.zeros(len(labels), dtype=bool)
+        for i in order:
+            candidates = np.where(~taken & (iou[i] >= threshold))[0]
+            if candidates.size:
+                taken[candidates[np.argmax(iou[i, candidates])]] = True
+                tp[i, t] = True
+    return tp
+
+def detection_metrics(stats: list, names: dict) -> dict:
+    from ultralytics.utils.metrics import ap_per_class
+
+    empty = {"precision": 0.0, "recall": 0.0, "map50": 0.0, "map50_95": 0.0, "per_class_map50_95": {}}
+    if not stats:
+        return empty
+
+    tp, conf, pred_cls, target_cls = (np.concatenate(parts, 0) for parts in zip(*stats))
+    if not len(tp):
+        return empty
+
+    _, _, p, r, _, ap, classes, *_ = ap_per_class(tp, conf, pred_cls, target_cls, names=names)
+    return {
+                "precision"          : float(p.mean()) if len(p) else 0.0,
+                "recall"             : float(r.mean()) if len(r) else 0.0,
+                "map50"              : float(ap[:, 0].mean()) if len(ap) else 0.0,
+                "map50_95"           : float(ap.mean()) if len(ap) else 0.0,
+                "per_class_map50_95" : {names.get(int(c), str(int(c))): float(ap[i].mean()) for i, c in enumerate(classes)},
+           }
+
+# ─────────────────────────────────────────────────────────────
+# Score every mode on the same images — single pass at the
+# coarse and fine sizes, and the two-stage ROI detector
+# ─────────────────────────────────────────────────────────────
+def evaluate_roi(
+                    model_path  : str   = APP_MODEL_PATH,
+                    data_dir    : str   = DEFAULT_DATA_DIR,
+                    split       : str   = "valid",
+                    coarse_size : int   = APP_ROI_COARSE_IMAGE_SIZE,
+                    fine_size   : int   = APP_ROI_FINE_IMAGE_SIZE,
+                    conf        : float = 0.001,
+                    limit       : int   = None,
+                    warmup      : int   = 3,
+                    output_path : str   = None,
+                ) -> dict:
+    try:
+        image_paths = collect_images(os.path.join(data_dir, split, "images"))[:limit]
+        if not image_paths:
+            raise ValueError(f"No images found under {data_dir}/{split}/images")
+
+        # Always the PyTorch weights — exported graphs cannot switch input size
+        holder      = ModelHolder(model_path=model_path, check_interval=float("inf"), resolver=lambda path: ("pytorch", path, None))
+        model       = holder.get()
+        roi         = RoiDetector(MicroBatcher(holder), coarse_size=coarse_size, fine_size=fine_size, conf=conf)
+
+        modes       = {
+                        f"single@{coarse_size}" : lambda image: model.predict(image, imgsz=coarse_size, conf=conf, verbose=False)[0],
+                        f"single@{fine_size}"   : lambda image: model.predict(image, imgsz=fine_size, conf=conf, verbose=False)[0],
+                        "roi"                   : lambda image: roi.predict(image, path="roi_eval"),
+                      }
+        latencies   = {name: [] for name in modes}
+        stats       = {name: [] for name in modes}
+
+        # First calls per image size pay predictor setup — keep them out of the timings
+        first       = cv2.imread(image_paths[0])
+        for _ in range(warmup if first is not None else 0):
+            for predict in modes.values():
+                predict(first)
+
+        for image_path in image_paths:
+            image         = cv2.imread(image_path)
+            if image is None:
+                continue
+            height, width = image.shape[:2]
+            stem          = os.path.splitext(os.path.basename(image_path))[0]
+            labels        = load_labels(os.path.join(data_dir, split, "labels", f"{stem}.txt"), width, height)
+
+            for name, predict in modes.items():
+                started     = time.perf_counter()
+                predictions = detections_array(predict(image))
+                elapsed     = time.perf_counter() - started
+
+                latencies[name].append(elapsed)
+                stats[name].append((match_predictions(predictions, labels), predictions[:, 4], predictions[:, 5], labels[:, 4]))
+
+        names   = model.names
+        report  = {"meta": {**run_metadata(data_dir, len(image_paths)), "split": split, "conf": conf}, "modes": {}}
+        for name in modes:
+            report["modes"][name] = {"latency_ms": summarize(latencies[name]), **detection_metrics(stats[name], names)}
+
+        baseline = report["modes"][f"single@{fine_size}"]
+        for name, result in report["modes"].items():
+            result["delta_vs_single_fine"] = {
+                                                "map50_95"     : result["map50_95"] - baseline["map50_95"],
+                                                "latency_p50"  : result["latency_ms"].get("p50", 0.0) - baseline["latency_ms"].get("p50", 0.0),
+                                             }
+            logger.info(
+                            f"{name}: mAP50-95 {result['map50_95']:.4f}, mAP50 {result['map50']:.4f}, "
+                            f"p50 {result['latency_ms'].get('p50', 0.0):.1f} ms"
+                       )
+
+        if output_path:
+            write_json_file(output_path, report)
+            logger.info(f"ROI evaluation written to {output_path}")
+
+        return report
+
+    except Exception as e:
+        raise AppException(e, sys)
+
+# ─────────────────────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────────────────────
+def main(argv: list = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare two-stage ROI inference with single-pass inference")
+    parser.add_argument("--model",  default=APP_MODEL_PATH,                             help="PyTorch weights (best.pt)")
+    parser.add_argument("--data",   default=DEFAULT_DATA_DIR,                           help="dataset root with <split>/images and <split>/labels")
+    parser.add_argument("--split",  default="valid")
+    parser.add_argument("--coarse", default=APP_ROI_COARSE_IMAGE_SIZE, type=int,        help="hand-finding pass image size")
+    parser.add_argument("--fine",   default=APP_ROI_FINE_IMAGE_SIZE,   type=int,        help="crop pass (and single-pass baseline) image size")
+    parser.add_argument("--conf",   default=0.001,                     type=float,      help="final confidence threshold for every mode")
+    parser.add_argument("--limit",  default=None,                      type=int,        help="evaluate only the first N images")
+    parser.add_argument("--warmup", default=3,                         type=int,        help="untimed passes over the first image per mode")
+    parser.add_argument("--output", default="roi_eval_output.json",                     help="JSON report path")
+    args   = parser.parse_args(argv)
+
+    report = evaluate_roi(
+                            model_path  = args.model,
+                            data_dir    = args.data,
+                            split       = args.split,
+                            coarse_size = args.coarse,
+                            fine_size   = args.fine,
+                            conf        = args.conf,
+                            limit       = args.limit,
+                            warmup      = args.warmup,
+                            output_path = args.output,
+                         )
+    print(json.dumps({name: {key: value for key, value in result.items() if key != "per_class_map50_95"} for name, result in report["modes"].items()}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
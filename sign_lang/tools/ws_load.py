@@ -0,0 +1,163 @@
+# ─────────────────────────────────────────────────────────────
+# WebSocket Load Test — Concurrent Camera Clients at a Target FPS
+#
+# Usage:
+#   python -m sign_lang.tools.ws_load \
+#       --url ws://localhost:8765 --connections 8 --fps 15 \
+#       --duration 30 --source data/inputImage.jpg --output ws_load.json
+# ─────────────────────────────────────────────────────────────
+
+import sys
+import json
+import time
+import asyncio
+import argparse
+import itertools
+
+import websockets
+
+from sign_lang.logger                import logger
+from sign_lang.exception             import AppException
+from sign_lang.utils.main_utils      import write_json_file
+from sign_lang.tools.benchmark       import collect_images, summarize, run_metadata
+from sign_lang.constant.application  import APP_WS_PORT
+
+# ─────────────────────────────────────────────────────────────
+# One simulated camera — sends a frame every 1/fps seconds no
+# matter how far behind the server is, like a real camera would,
+# and times each reply against its frame's send time
+# ─────────────────────────────────────────────────────────────
+async def run_client(url: str, frames: list, fps: float, duration: float) -> dict:
+    stats     = {"sent": 0, "answered": 0, "errors": 0, "server_dropped": 0, "rejected": False, "latencies": []}
+    sent_at   = {}
+
+    try:
+        async with websockets.connect(url, max_size=None, compression=None) as websocket:
+            async def receive():
+                try:
+                    async for message in websocket:
+                        reply = json.loads(message)
+                        sent  = sent_at.pop(reply.get("seq"), None)
+                        if "error" in reply:
+                            stats["errors"] += 1
+                        elif sent is not None:
+                            stats["answered"]      += 1
+                            stats["server_dropped"]  = reply.get("dropped", 0)
+                            stats["latencies"].append(time.perf_counter() - sent)
+                except websockets.ConnectionClosed:
+                    pass                                    # the sender sees it too and records why
+
+            receiver = asyncio.ensure_future(receive())
+            started  = time.perf_counter()
+
+            for seq, frame in zip(itertools.count(), itertools.cycle(frames)):
+                due = started + seq / fps
+                if due - started >= duration:
+                    break
+                await asyncio.sleep(max(0.0, due - time.perf_counter()))
+
+                sent_at[seq] = time.perf_counter()
+                await websocket.send(seq.to_bytes(4, "big") + frame)
+                stats["sent"] += 1
+
+            # Let the last in-flight frame come back
+            await asyncio.sleep(1.0)
+            receiver.cancel()
+
+    except websockets.ConnectionClosed as e:
+        stats["rejected"] = e.rcvd is not None and e.rcvd.code == 1013
+
+    return stats
+
+# ─────────────────────────────────────────────────────────────
+# Run every client at once and fold their counters together
+# ─────────────────────────────────────────────────────────────
+def run_load_test(
+                    url         : str   = f"ws://localhost:{APP_WS_PORT}",
+                    connections : int   = 4,
+                    fps         : float = 15.0,
+                    duration    : float = 30.0,
+                    source      : str   = "data/inputImage.jpg",
+                    output_path : str   = None,
+                 ) -> dict:
+    try:
+        image_paths = collect_images(source)
+        if not image_paths:
+            raise ValueError(f"No images found at {source}")
+
+        frames = []
+        for path in image_paths:
+            with open(path, "rb") as f:
+                frames.append(f.read())                     # already-encoded bytes, as a browser sends them
+
+        logger.info(f"Load testing {url}: {connections} connection(s) at {fps} FPS for {duration}s")
+
+        async def run_all():
+            return await asyncio.gather(*(run_client(url, frames, fps, duration) for _ in range(connections)))
+
+        started   = time.perf_counter()
+        clients   = asyncio.run(run_all())
+        elapsed   = time.perf_counter() - started
+
+        latencies = [latency for client in clients for latency in client["latencies"]]
+        sent      = sum(client["sent"] for client in clients)
+        answered  = sum(client["answered"] for client in clients)
+
+        report    = {
+                        "meta"    : {**run_metadata(source, len(image_paths)), "url": url},
+                        "config"  : {"connections": connections, "fps": fps, "duration": duration},
+                        "summary" : {
+                                        "sent"                 : sent,
+                                        "answered"             : answered,
+                                        "answered_ratio"       : answered / sent if sent else 0.0,
+                                        "server_dropped"       : sum(client["server_dropped"] for client in clients),
+                                        "errors"               : sum(client["errors"] for client in clients),
+                                        "rejected_connections" : sum(client["rejected"] for client in clients),
+                                        "answered_fps"         : answered / elapsed if elapsed else 0.0,
+                                        "latency_ms"           : summarize(latencies),
+                                    },
+                        "clients" : [{key: value for key, value in client.items() if key != "latencies"} for client in clients],
+                    }
+
+        summary   = report["summary"]
+        logger.info(
+                        f"Answered {answered}/{sent} frames ({summary['answered_fps']:.1f} FPS), "
+                        f"{summary['server_dropped']} dropped by the server, "
+                        f"{summary['rejected_connections']} connection(s) rejected"
+                   )
+
+        if output_path:
+            write_json_file(output_path, report)
+            logger.info(f"Load test report written to {output_path}")
+
+        return report
+
+    except Exception as e:
+        raise AppException(e, sys)
+
+# ─────────────────────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────────────────────
+def main(argv: list = None) -> None:
+    parser = argparse.ArgumentParser(description="Load-test the sign-language WebSocket endpoint")
+    parser.add_argument("--url",         default=f"ws://localhost:{APP_WS_PORT}",        help="WebSocket server URL")
+    parser.add_argument("--connections", default=4,                    type=int,         help="concurrent simulated cameras")
+    parser.add_argument("--fps",         default=15.0,                 type=float,       help="frames per second per camera")
+    parser.add_argument("--duration",    default=30.0,                 type=float,       help="seconds to send for")
+    parser.add_argument("--source",      default="data/inputImage.jpg",                  help="image file or directory")
+    parser.add_argument("--output",      default="ws_load_output.json",                  help="JSON report path")
+    args   = parser.parse_args(argv)
+
+    report = run_load_test(
+                            url         = args.url,
+                            connections = args.connections,
+                            fps         = args.fps,
+                            duration    = args.duration,
+                            source      = args.source,
+                            output_path = args.output,
+                          )
+    print(json.dumps(report["summary"], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# ─────────────────────────────────────────────────────────────
+# Cached Dataset — Ultralytics Trainer/Validator Reading the Image Cache
+# ─────────────────────────────────────────────────────────────
+
+from ultralytics.data.dataset        import YOLODataset
+from ultralytics.models.yolo.detect  import DetectionTrainer, DetectionValidator
+
+# ─────────────────────────────────────────────────────────────
+# YOLODataset whose load_image copies from the memory-mapped cache
+# instead of decoding. The mosaic buffer bookkeeping is the same
+# as BaseDataset.load_image, so augmentation behaves identically.
+# ─────────────────────────────────────────────────────────────
+class MmapYOLODataset(YOLODataset):
+    image_cache = None
+
+    def load_image(self, i, rect_mode=True):
+        if self.image_cache is None or not rect_mode or self.ims[i] is not None:
+            return super().load_image(i, rect_mode)
+
+        cached = self.image_cache.lookup(self.im_files[i])
+        if cached is None:
+            return super().load_image(i, rect_mode)
+
+        im, hw0, hw = cached
+        if im.ndim == 2:
+            im = im[..., None]
+
+        if self.augment:
+            self.ims[i], self.im_hw0[i], self.im_hw[i] = im, hw0, hw
+            self.buffer.append(i)
+            if 1 < len(self.buffer) >= self.max_buffer_length:
+                j = self.buffer.pop(0)
+                if self.cache != "ram":
+                    self.ims[j], self.im_hw0[j], self.im_hw[j] = None, None, None
+
+        return im, hw0, hw
+
+# Switch a dataset built by Ultralytics over to the cache — only
+# when it was built at the size the cache was decoded for
+def attach_image_cache(dataset, image_cache):
+    if image_cache is not None and isinstance(dataset, YOLODataset) and dataset.imgsz == image_cache.image_size:
+        dataset.__class__   = MmapYOLODataset
+        dataset.image_cache = image_cache
+    return dataset
+
+# ─────────────────────────────────────────────────────────────
+# Trainer / validator that hand their datasets the cache. Bind a
+# cache with with_image_cache(), since Ultralytics constructs
+# these classes itself from model.train(trainer=...) / val(validator=...)
+# ─────────────────────────────────────────────────────────────
+class MmapDetectionTrainer(DetectionTrainer):
+    image_cache = None
+
+    def build_dataset(self, img_path, mode="train", batch=None):
+        return attach_image_cache(super().build_dataset(img_path, mode, batch), self.image_cache)
+
+class MmapDetectionValidator(DetectionValidator):
+    image_cache = None
+
+    def build_dataset(self, img_path, mode="val", batch=None):
+        return attach_image_cache(super().build_dataset(img_path, mode, batch), self.image_cache)
+
+def with_image_cache(cls, image_cache):
+    return type(cls.__name__, (cls,), {"image_cache": image_cache})
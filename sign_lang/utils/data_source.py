@@ -0,0 +1,110 @@
+# ─────────────────────────────────────────────────────────────
+# Data Sources — Pluggable, Resumable Dataset Downloads
+# ─────────────────────────────────────────────────────────────
+
+import os
+import shutil
+import hashlib
+from urllib.parse          import urlparse
+
+from sign_lang.logger      import logger
+
+CHUNK_SIZE = 1 << 20        # 1 MiB read/write chunks
+
+# ─────────────────────────────────────────────────────────────
+# SHA-256 of a file, streamed so large archives stay off the heap
+# ─────────────────────────────────────────────────────────────
+def file_sha256(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# ─────────────────────────────────────────────────────────────
+# Base source — fetch() leaves the complete file at dest_path and
+# may resume whatever an interrupted earlier call left behind
+# ─────────────────────────────────────────────────────────────
+class DataSource:
+    def __init__(self, url: str):
+        self.url = url
+
+    def fetch(self, dest_path: str) -> None:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.url!r})"
+
+# ─────────────────────────────────────────────────────────────
+# Google Drive share link — gdown keeps and resumes its own
+# .part files next to the output path
+# ─────────────────────────────────────────────────────────────
+class GoogleDriveSource(DataSource):
+    @property
+    def file_id(self) -> str:
+        parts = urlparse(self.url).path.rstrip("/").split("/")
+        return parts[parts.index("d") + 1] if "d" in parts else parts[-1]
+
+    def fetch(self, dest_path: str) -> None:
+        import gdown
+
+        if gdown.download(id=self.file_id, output=dest_path, resume=True) is None:
+            raise RuntimeError(f"Google Drive download failed for {self.url}")
+
+# ─────────────────────────────────────────────────────────────
+# Plain HTTP(S) — resumes a partial download with a Range request
+# ─────────────────────────────────────────────────────────────
+class HttpSource(DataSource):
+    def fetch(self, dest_path: str) -> None:
+        import requests
+
+        part_path = dest_path + ".part"
+        offset    = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers   = {"Range": f"bytes={offset}-"} if offset else {}
+
+        with requests.get(self.url, headers=headers, stream=True, timeout=60) as response:
+            if response.status_code == 416:                     # partial file already holds every byte
+                os.replace(part_path, dest_path)
+                return
+            response.raise_for_status()
+
+            resumed = offset and response.status_code == 206
+            if offset and not resumed:
+                logger.info(f"Server ignored Range for {self.url}, restarting download")
+            elif resumed:
+                logger.info(f"Resuming {self.url} from byte {offset}")
+
+            with open(part_path, "ab" if resumed else "wb") as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    f.write(chunk)
+
+        os.replace(part_path, dest_path)
+
+# ─────────────────────────────────────────────────────────────
+# Local path or file:// URL — copies in place of a network fetch
+# ─────────────────────────────────────────────────────────────
+class LocalFileSource(DataSource):
+    @property
+    def path(self) -> str:
+        parsed = urlparse(self.url)
+        return parsed.path if parsed.scheme == "file" else self.url
+
+    def fetch(self, dest_path: str) -> None:
+        part_path = dest_path + ".part"
+        shutil.copyfile(self.path, part_path)
+        os.replace(part_path, dest_path)
+
+# ─────────────────────────────────────────────────────────────
+# Pick a source from the URL scheme/host
+# ─────────────────────────────────────────────────────────────
+def make_data_source(url: str) -> DataSource:
+    parsed = urlparse(url)
+
+    if parsed.scheme in ("", "file"):
+        return LocalFileSource(url)
+    if parsed.netloc.endswith("drive.google.com"):
+        return GoogleDriveSource(url)
+    if parsed.scheme in ("http", "https"):
+        return HttpSource(url)
+
+    raise ValueError(f"Unsupported data source URL: {url}")
@@ -0,0 +1,170 @@
+# ─────────────────────────────────────────────────────────────
+# Image Cache — Pre-Decoded Training Images in a Shared Memory Map
+# ─────────────────────────────────────────────────────────────
+
+import os
+import json
+import math
+import shutil
+import hashlib
+from concurrent.futures          import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+from sign_lang.logger            import logger
+from sign_lang.utils.data_source import file_sha256
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+IMAGES_FILE = "images.npy"      # uint8 [N, imgsz, imgsz, 3], each image top-left aligned
+SHAPES_FILE = "shapes.npy"      # int32 [N, 4] — original h, w and resized h, w
+FILES_FILE  = "files.json"      # image paths in row order
+READY_FILE  = "meta.json"       # written last — a cache without it is incomplete
+
+# ─────────────────────────────────────────────────────────────
+# Cache key — the validation manifest already hashes every image,
+# so its digest plus imgsz identifies the decoded contents. Without
+# a manifest, fall back to paths, sizes and mtimes.
+# ─────────────────────────────────────────────────────────────
+def image_cache_key(image_paths: list, image_size: int, manifest_path: str = None) -> str:
+    digest = hashlib.sha256(f"imgsz={image_size}\n".encode())
+
+    if manifest_path and os.path.exists(manifest_path):
+        digest.update(file_sha256(manifest_path).encode())
+    else:
+        for path in image_paths:
+            stat = os.stat(path)
+            digest.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+
+    return digest.hexdigest()[:16]
+
+def list_dataset_images(dataset_dir: str, splits: tuple = ("train", "valid")) -> list:
+    paths = []
+    for split in splits:
+        image_dir = os.path.join(dataset_dir, split, "images")
+        if os.path.isdir(image_dir):
+            paths.extend(
+                            os.path.join(image_dir, name) for name in sorted(os.listdir(image_dir))
+                            if name.lower().endswith(IMAGE_EXTENSIONS)
+                        )
+    return paths
+
+# Same long-side resize as Ultralytics BaseDataset.load_image(rect_mode=True)
+def _resize_for_training(image: np.ndarray, image_size: int) -> np.ndarray:
+    h0, w0 = image.shape[:2]
+    r      = image_size / max(h0, w0)
+    if r != 1:
+        w, h  = min(math.ceil(w0 * r), image_size), min(math.ceil(h0 * r), image_size)
+        image = cv2.resize(image, (w, h), interpolation=cv2.INTER_LINEAR)
+    return image
+
+# ─────────────────────────────────────────────────────────────
+# Read side — the memmap is opened lazily and never pickled, so
+# dataloader workers map the same file and share its page cache
+# ─────────────────────────────────────────────────────────────
+class ImageCache:
+    def __init__(self, cache_dir: str):
+        self.cache_dir  = cache_dir
+        with open(os.path.join(cache_dir, READY_FILE)) as f:
+            meta        = json.load(f)
+        self.image_size = meta["image_size"]
+        self.count      = meta["count"]
+        self._images    = None
+        self._shapes    = None
+        self._index     = None
+
+    def __getstate__(self) -> dict:
+        return {**self.__dict__, "_images": None, "_shapes": None, "_index": None}
+
+    def _open(self) -> None:
+        with open(os.path.join(self.cache_dir, FILES_FILE)) as f:
+            self._index = {path: i for i, path in enumerate(json.load(f))}
+        self._shapes = np.load(os.path.join(self.cache_dir, SHAPES_FILE))
+        self._images = np.load(os.path.join(self.cache_dir, IMAGES_FILE), mmap_mode="r")
+
+    # (image copy, (h0, w0), (h, w)) or None when the path is not cached
+    def lookup(self, image_path: str):
+        if self._images is None:
+            self._open()
+
+        i = self._index.get(os.path.realpath(image_path))
+        if i is None:
+            return None
+
+        h0, w0, h, w = (int(v) for v in self._shapes[i])
+        if h == 0:
+            return None                                         # failed to decode at build time
+        # Copy out — augmentations write into the array they are given
+        return np.array(self._images[i, :h, :w]), (h0, w0), (h, w)
+
+# Open a cache recorded by a previous run, None if it is gone or incomplete
+def open_image_cache(cache_dir: str):
+    if cache_dir and os.path.exists(os.path.join(cache_dir, READY_FILE)):
+        return ImageCache(cache_dir)
+    return None
+
+# ─────────────────────────────────────────────────────────────
+# Build side — decode and resize every image once into a new
+# directory, then rename it into place so concurrent builders
+# and readers never see a half-written cache
+# ─────────────────────────────────────────────────────────────
+def build_image_cache(cache_root: str, key: str, image_paths: list, image_size: int, workers: int = 0) -> ImageCache:
+    cache_dir = os.path.join(cache_root, key)
+    if os.path.exists(os.path.join(cache_dir, READY_FILE)):
+        logger.info(f"Using image cache {cache_dir}")
+        return ImageCache(cache_dir)
+
+    needed_mb = len(image_paths) * image_size * image_size * 3 / 2**20
+    os.makedirs(cache_root, exist_ok=True)
+    if shutil.disk_usage(cache_root).free / 2**20 < needed_mb * 1.1:
+        logger.warning(f"Not enough disk for a {needed_mb:.0f} MB image cache under {cache_root}, decoding per epoch")
+        return None
+
+    tmp_dir = f"{cache_dir}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    images  = np.lib.format.open_memmap(
+                                            os.path.join(tmp_dir, IMAGES_FILE),
+                                            mode  = "w+",
+                                            dtype = np.uint8,
+                                            shape = (len(image_paths), image_size, image_size, 3)
+                                       )
+    shapes  = np.zeros((len(image_paths), 4), dtype=np.int32)
+
+    def fill(i: int) -> None:
+        image = cv2.imread(image_paths[i], cv2.IMREAD_COLOR)
+        if image is None:
+            return
+        h0, w0             = image.shape[:2]
+        image              = _resize_for_training(image, image_size)
+        h, w               = image.shape[:2]
+        images[i, :h, :w]  = image
+        shapes[i]          = (h0, w0, h, w)
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:   # cv2 releases the GIL
+        list(pool.map(fill, range(len(image_paths))))
+
+    images.flush()
+    del images
+    np.save(os.path.join(tmp_dir, SHAPES_FILE), shapes)
+    with open(os.path.join(tmp_dir, FILES_FILE), "w") as f:
+        json.dump([os.path.realpath(path) for path in image_paths], f)
+    with open(os.path.join(tmp_dir, READY_FILE), "w") as f:
+        json.dump({"image_size": image_size, "count": len(image_paths), "failed": int((shapes[:, 2] == 0).sum())}, f)
+
+    try:
+        os.rename(tmp_dir, cache_dir)
+    except OSError:
+        shutil.rmtree(tmp_dir, ignore_errors=True)              # another process finished first
+        if not os.path.exists(os.path.join(cache_dir, READY_FILE)):
+            raise
+
+    # Older keys belong to previous dataset versions or image sizes
+    for name in os.listdir(cache_root):
+        if name != key and ".tmp-" not in name:
+            shutil.rmtree(os.path.join(cache_root, name), ignore_errors=True)
+
+    logger.info(f"Built image cache {cache_dir}: {len(image_paths)} images, {needed_mb:.0f} MB at imgsz {image_size}")
+    return ImageCache(cache_dir)
@@ -1,11 +1,15 @@
 # ─────────────────────────────────────────────────────────────
-# Utility Functions — YAML I/O + Base64 Encoding/Decoding
+# Utility Functions — YAML/JSON I/O + Image Encoding/Decoding
 # ─────────────────────────────────────────────────────────────
 
 import os
 import sys
+import cv2
+import json
+import struct
 import yaml
 import base64
+import numpy as np
 
 from sign_lang.exception import AppException
 from sign_lang.logger    import logging
@@ -37,6 +41,30 @@ def write_yaml_file(file_path: str, content: object, replace: bool = False) -> N
     except Exception as e:
         raise AppException(e, sys)
 
+# ─────────────────────────────────────────────────────────────
+# Read JSON file and return as dict
+# ─────────────────────────────────────────────────────────────
+def read_json_file(file_path: str) -> dict:
+    try:
+        with open(file_path, "r") as json_file:
+            return json.load(json_file)
+    except Exception as e:
+        raise AppException(e, sys) from e
+
+# ─────────────────────────────────────────────────────────────
+# Write dict to JSON file atomically (temp file + rename)
+# ─────────────────────────────────────────────────────────────
+def write_json_file(file_path: str, content: object, indent: int = 2) -> None:
+    try:
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(content, file, indent=indent, default=str)
+        os.replace(tmp_path, file_path)
+    except Exception as e:
+        raise AppException(e, sys)
+
 # ─────────────────────────────────────────────────────────────
 # Decode base64 string and save as image
 # ─────────────────────────────────────────────────────────────
@@ -51,4 +79,46 @@ def decodeImage(imgstring: str, fileName: str) -> None:
 # ─────────────────────────────────────────────────────────────
 def encodeImageIntoBase64(croppedImagePath: str) -> bytes:
     with open(croppedImagePath, "rb") as f:
-        return base64.b64encode(f.read())
\ No newline at end of file
+        return base64.b64encode(f.read())
+
+# ─────────────────────────────────────────────────────────────
+# Decode raw image bytes (JPEG/PNG/...) into a BGR ndarray
+# ─────────────────────────────────────────────────────────────
+def decodeBytesToArray(imgdata: bytes) -> np.ndarray:
+    image = cv2.imdecode(np.frombuffer(imgdata, dtype=np.uint8), cv2.IMREAD_COLOR)
+
+    if image is None:
+        raise ValueError("Uploaded data is not a decodable image")
+    return image
+
+# ─────────────────────────────────────────────────────────────
+# JPEG-encode a BGR ndarray into an in-memory buffer
+# ─────────────────────────────────────────────────────────────
+def encodeArrayIntoJpeg(image: np.ndarray, quality: int = 95) -> bytes:
+    ok, buffer = cv2.imencode('.jpg', image, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+
+    if not ok:
+        raise ValueError("JPEG encoding failed")
+    return buffer.tobytes()
+
+# ─────────────────────────────────────────────────────────────
+# Split a binary body of <uint32 big-endian length><image bytes>
+# records into individual image payloads
+# ─────────────────────────────────────────────────────────────
+def splitLengthPrefixedImages(body: bytes) -> list:
+    images, offset = [], 0
+
+    while offset < len(body):
+        if offset + 4 > len(body):
+            raise ValueError("Truncated length prefix in binary body")
+
+        (length,) = struct.unpack_from(">I", body, offset)
+        offset   += 4
+
+        if offset + length > len(body):
+            raise ValueError("Truncated image payload in binary body")
+
+        images.append(body[offset:offset + length])
+        offset   += length
+
+    return images
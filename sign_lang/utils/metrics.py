@@ -0,0 +1,205 @@
+# ─────────────────────────────────────────────────────────────
+# Metrics — Minimal Prometheus Counters, Gauges and Histograms
+#
+# Disabled via SIGN_LANG_METRICS=0: timers become a shared no-op
+# context manager and observe()/inc() return immediately.
+# ─────────────────────────────────────────────────────────────
+
+import os
+import time
+import bisect
+import threading
+
+METRICS_ENABLED  = os.getenv("SIGN_LANG_METRICS", "1") == "1"
+
+# Seconds — spans sub-millisecond codec work up to multi-minute training stages
+LATENCY_BUCKETS  = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 1800.0)
+
+# ─────────────────────────────────────────────────────────────
+# Label helpers
+# ─────────────────────────────────────────────────────────────
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted(labels.items()))
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(key: tuple) -> str:
+    if not key:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in key) + "}"
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+# ─────────────────────────────────────────────────────────────
+# No-op timer handed out when metrics are disabled
+# ─────────────────────────────────────────────────────────────
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_TIMER = _NullTimer()
+
+class _Timer:
+    __slots__ = ("histogram", "labels", "started")
+
+    def __init__(self, histogram, labels: dict):
+        self.histogram = histogram
+        self.labels    = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+        return False
+
+# ─────────────────────────────────────────────────────────────
+# Metric types
+# ─────────────────────────────────────────────────────────────
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, enabled: bool):
+        self.name          = name
+        self.documentation = documentation
+        self.enabled       = enabled
+        self._lock         = threading.Lock()
+        self._values       = {}
+
+    def samples(self) -> list:
+        raise NotImplementedError
+
+class Counter(_Metric):
+    kind = "counter"                # name it with the conventional _total suffix
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> list:
+        with self._lock:
+            return [(self.name, key, value) for key, value in self._values.items()]
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._values[_label_key(labels)] = value
+
+    def samples(self) -> list:
+        with self._lock:
+            return [(self.name, key, value) for key, value in self._values.items()]
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, enabled: bool, buckets: tuple = LATENCY_BUCKETS):
+        super().__init__(name, documentation, enabled)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]   # counts, sum, count
+            state[0][bisect.bisect_left(self.buckets, value)] += 1
+            state[1] += value
+            state[2] += 1
+
+    def time(self, **labels):
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, labels)
+
+    def samples(self) -> list:
+        samples = []
+        with self._lock:
+            for key, (counts, total, count) in self._values.items():
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += bucket_count
+                    samples.append((f"{self.name}_bucket", key + (("le", _format_value(bound)),), cumulative))
+                samples.append((f"{self.name}_sum",   key, total))
+                samples.append((f"{self.name}_count", key, count))
+        return samples
+
+# ─────────────────────────────────────────────────────────────
+# Registry — owns metrics plus scrape-time collectors for values
+# that live elsewhere (e.g. live-stream FPS)
+# ─────────────────────────────────────────────────────────────
+class MetricsRegistry:
+    def __init__(self, enabled: bool = METRICS_ENABLED):
+        self.enabled     = enabled
+        self._lock       = threading.Lock()
+        self._metrics    = {}
+        self._collectors = []
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str) -> Counter:
+        return self._register(Counter(name, documentation, self.enabled))
+
+    def gauge(self, name: str, documentation: str) -> Gauge:
+        return self._register(Gauge(name, documentation, self.enabled))
+
+    def histogram(self, name: str, documentation: str, buckets: tuple = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, self.enabled, buckets))
+
+    # fn() -> [(name, kind, documentation, [(labels_dict, value), ...]), ...]
+    def register_collector(self, fn) -> None:
+        with self._lock:
+            self._collectors.append(fn)
+
+    # ─────────────────────────────────────────────────────────
+    # Prometheus text exposition format 0.0.4
+    # ─────────────────────────────────────────────────────────
+    def render(self) -> str:
+        if not self.enabled:
+            return ""
+
+        with self._lock:
+            metrics    = list(self._metrics.values())
+            collectors = list(self._collectors)
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for sample_name, key, value in metric.samples():
+                lines.append(f"{sample_name}{_format_labels(key)} {_format_value(value)}")
+
+        for collector in collectors:
+            for name, kind, documentation, samples in collector():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(_label_key(labels))} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry scraped by /metrics
+registry = MetricsRegistry()
+
+__all__ = ["registry", "MetricsRegistry", "Counter", "Gauge", "Histogram"]
@@ -0,0 +1,202 @@
+# ─────────────────────────────────────────────────────────────
+# Stage Cache — Fingerprint-Based Reuse of Pipeline Stage Artifacts
+# ─────────────────────────────────────────────────────────────
+
+import os
+import sys
+import json
+import inspect
+import hashlib
+from datetime                    import datetime
+from dataclasses                 import asdict, is_dataclass
+
+from sign_lang.exception         import AppException
+from sign_lang.utils.main_utils  import read_json_file, write_json_file
+from sign_lang.utils.data_source import file_sha256
+
+FORCE_ALL = "all"
+
+def _digest(value) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+
+# Config and artifact modules are already covered by the config and
+# upstream parts — hashing them as code would tie every stage to all configs
+CODE_EXCLUDED_PACKAGES = ("sign_lang.entity", "sign_lang.constant", "sign_lang.pipeline")
+
+DIGESTS_FILE_NAME = "digests.json"
+
+# ─────────────────────────────────────────────────────────────
+# SHA-256 of files, remembered by (path, size, mtime_ns) in a JSON
+# file next to the stage records. Every /train job is a fresh
+# process, so an in-memory memo would re-hash the dataset archive
+# on each run just to decide that a stage can be skipped.
+# ─────────────────────────────────────────────────────────────
+class FileDigests:
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._entries  = None               # abspath -> [size, mtime_ns, sha256], loaded on first use
+        self._dirty    = False
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                self._entries = read_json_file(self.file_path) if os.path.exists(self.file_path) else {}
+            except Exception:
+                self._entries = {}          # unreadable memo — re-hash rather than fail the pipeline
+        return self._entries
+
+    def sha256(self, path: str) -> str:
+        entries = self._load()
+        stat    = os.stat(path)
+        key     = os.path.abspath(path)
+        entry   = entries.get(key)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+
+        entries[key] = [stat.st_size, stat.st_mtime_ns, file_sha256(path)]
+        self._dirty  = True
+        return entries[key][2]
+
+    # Persist new digests, dropping files that no longer exist
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self._entries = {path: entry for path, entry in self._entries.items() if os.path.exists(path)}
+        write_json_file(self.file_path, self._entries, indent=None)
+        self._dirty   = False
+
+# ─────────────────────────────────────────────────────────────
+# Content signature of an output — the SHA-256 of a file, a digest
+# of relative paths and file SHA-256s for a directory, None when
+# missing. Rewriting a file with the same bytes (a re-run that found
+# nothing new) keeps its signature, and an image or label edited
+# to the same size still changes it. Unchanged files cost a stat.
+# ─────────────────────────────────────────────────────────────
+def _path_signature(path: str, digests: FileDigests):
+    if os.path.isfile(path):
+        return digests.sha256(path)
+
+    if os.path.isdir(path):
+        entries = []
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                full = os.path.join(root, name)
+                entries.append([os.path.relpath(full, path), digests.sha256(full)])
+        return _digest(entries)
+
+    return None
+
+# ─────────────────────────────────────────────────────────────
+# Source files behind a stage — the given components and every
+# sign_lang module they import, directly or through helpers
+# (image_cache, training_resources, main_utils, ...)
+# ─────────────────────────────────────────────────────────────
+def _code_files(code: tuple) -> list:
+    seen, stack = {}, [inspect.getmodule(obj) if not inspect.ismodule(obj) else obj for obj in code]
+    while stack:
+        module = stack.pop()
+        name   = getattr(module, "__name__", "")
+        if name in seen or not name.startswith("sign_lang") or name.startswith(CODE_EXCLUDED_PACKAGES):
+            continue
+        seen[name] = getattr(module, "__file__", None)
+
+        for value in vars(module).values():
+            dependency = value if inspect.ismodule(value) else inspect.getmodule(value)
+            if dependency is not None:
+                stack.append(dependency)
+
+    return [(name, path) for name, path in sorted(seen.items()) if path]
+
+# Path-valued fields of an artifact and what is on disk for each
+def _output_signatures(artifact, digests: FileDigests) -> dict:
+    return {
+                name: _path_signature(value, digests)
+                for name, value in asdict(artifact).items()
+                if isinstance(value, str) and value and name.endswith("_path")
+           }
+
+# ─────────────────────────────────────────────────────────────
+# Stores one record per stage under artifacts/.stage_cache. A
+# stage is reused only when its config, upstream artifacts and
+# component source all hash the same as the last successful run
+# and the files the stored artifact points to are unchanged.
+# ─────────────────────────────────────────────────────────────
+class StageCache:
+    def __init__(self, cache_dir: str, force=()):
+        self.cache_dir = cache_dir
+        self.force     = set(force or ())
+        self.digests   = FileDigests(os.path.join(cache_dir, DIGESTS_FILE_NAME))
+
+    def _record_path(self, stage: str) -> str:
+        return os.path.join(self.cache_dir, f"{stage}.json")
+
+    # ─────────────────────────────────────────────────────────
+    # Fingerprint parts — config values, upstream artifacts
+    # (values plus the content of the files they point to) and the
+    # source of the components and the sign_lang helpers they use
+    # ─────────────────────────────────────────────────────────
+    def fingerprint(self, config, upstream: tuple = (), code: tuple = ()) -> dict:
+        try:
+            parts = {
+                        "config"   : _digest(asdict(config) if is_dataclass(config) else config),
+                        "upstream" : _digest([
+                                                [type(artifact).__name__, asdict(artifact), _output_signatures(artifact, self.digests)]
+                                                for artifact in upstream
+                                             ]),
+                        "code"     : _digest([[name, self.digests.sha256(path)] for name, path in _code_files(code)]),
+                    }
+            self.digests.save()
+            return parts
+        except Exception as e:
+            raise AppException(e, sys)
+
+    # ─────────────────────────────────────────────────────────
+    # Returns (artifact, reason) — artifact is None when the stage
+    # has to run, and reason says why either way
+    # ─────────────────────────────────────────────────────────
+    def lookup(self, stage: str, parts: dict, artifact_cls):
+        if FORCE_ALL in self.force or stage in self.force:
+            return None, "forced"
+
+        record_path = self._record_path(stage)
+        if not os.path.exists(record_path):
+            return None, "no previous successful run"
+
+        try:
+            record = read_json_file(record_path)
+        except Exception:
+            return None, "stored record unreadable"
+
+        if record.get("artifact_type") != artifact_cls.__name__:
+            return None, "artifact type changed"
+        for part in ("config", "upstream", "code"):
+            if record.get("parts", {}).get(part) != parts[part]:
+                return None, f"{part} changed"
+
+        try:
+            artifact = artifact_cls(**record["artifact"])
+        except TypeError:
+            return None, "artifact fields changed"
+        outputs = _output_signatures(artifact, self.digests)
+        self.digests.save()
+        if outputs != record.get("outputs"):
+            return None, "stored outputs changed or missing"
+
+        return artifact, f"fingerprint matches run from {record.get('finished_at', 'unknown')}"
+
+    def store(self, stage: str, parts: dict, artifact) -> None:
+        record = {
+                    "stage"         : stage,
+                    "parts"         : parts,
+                    "artifact_type" : type(artifact).__name__,
+                    "artifact"      : asdict(artifact),
+                    "outputs"       : _output_signatures(artifact, self.digests),
+                    "finished_at"   : datetime.now().isoformat(timespec="seconds"),
+                 }
+        write_json_file(self._record_path(stage), record)
+        self.digests.save()
+
+    def invalidate(self, stage: str) -> None:
+        if os.path.exists(self._record_path(stage)):
+            os.remove(self._record_path(stage))
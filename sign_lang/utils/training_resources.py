@@ -0,0 +1,133 @@
+# ─────────────────────────────────────────────────────────────
+# Training Resources — Size Batch, Workers and Cache to the Host
+# ─────────────────────────────────────────────────────────────
+
+import os
+import resource
+
+import psutil
+
+from sign_lang.logger import logger
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+CACHE_RAM  = "ram"
+CACHE_DISK = "disk"
+CACHE_MMAP = "mmap"        # persistent pre-decoded cache, see sign_lang.utils.image_cache
+CACHE_NONE = "none"
+
+# ─────────────────────────────────────────────────────────────
+# What the host can give — RAM, usable cores, disk free
+# ─────────────────────────────────────────────────────────────
+def host_profile(path: str = ".") -> dict:
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+
+    try:
+        import torch
+        cuda = torch.cuda.is_available()
+    except ImportError:
+        cuda = False
+
+    return {
+                "ram_available_mb" : psutil.virtual_memory().available / 2**20,
+                "ram_total_mb"     : psutil.virtual_memory().total / 2**20,
+                "cpus"             : cpus,
+                "disk_free_mb"     : psutil.disk_usage(path).free / 2**20,
+                "cuda"             : cuda,
+           }
+
+# ─────────────────────────────────────────────────────────────
+# Dataset size — image count and bytes on disk per split
+# ─────────────────────────────────────────────────────────────
+def dataset_profile(dataset_dir: str, splits: tuple = ("train", "valid")) -> dict:
+    profile = {"images": 0, "bytes": 0}
+
+    for split in splits:
+        image_dir = os.path.join(dataset_dir, split, "images")
+        if not os.path.isdir(image_dir):
+            continue
+        with os.scandir(image_dir) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                    profile["images"] += 1
+                    profile["bytes"]  += entry.stat().st_size
+
+        if split == "train":
+            profile["train_images"] = profile["images"]
+
+    profile["bytes_mb"] = profile.pop("bytes") / 2**20
+    return profile
+
+# ─────────────────────────────────────────────────────────────
+# Pick cache mode, batch size and dataloader workers.
+#
+# Ultralytics caches images resized to imgsz as uint8 arrays, so
+# the cache needs about imgsz² × 3 bytes per image (in RAM, or as
+# .npy files next to the images). Whatever RAM the cache leaves is
+# split into per-sample training memory for the batch size.
+# ─────────────────────────────────────────────────────────────
+def choose_training_resources(
+                                host            : dict,
+                                dataset         : dict,
+                                image_size      : int,
+                                ram_fraction    : float,
+                                bytes_per_pixel : float,
+                                max_batch       : int,
+                                max_workers     : int,
+                                mmap            : bool = False,
+                             ) -> dict:
+    reasons      = []
+    budget_mb    = host["ram_available_mb"] * ram_fraction
+    cache_mb     = dataset["images"] * image_size * image_size * 3 / 2**20
+    sample_mb    = image_size * image_size * bytes_per_pixel / 2**20
+
+    # Cache — the mmap cache survives across runs and its pages are
+    # shared by every process; RAM only if it leaves room for a batch of 8
+    if mmap and cache_mb * 1.1 <= host["disk_free_mb"]:
+        cache = CACHE_MMAP
+        reasons.append(f"cache=mmap: {cache_mb:.0f} MB persistent decoded cache, {host['disk_free_mb']:.0f} MB disk free")
+    elif cache_mb + 8 * sample_mb <= budget_mb:
+        cache = CACHE_RAM
+        reasons.append(f"cache=ram: {cache_mb:.0f} MB cache fits in {budget_mb:.0f} MB budget")
+    elif cache_mb * 1.2 <= host["disk_free_mb"]:
+        cache = CACHE_DISK
+        reasons.append(f"cache=disk: {cache_mb:.0f} MB cache exceeds RAM budget, {host['disk_free_mb']:.0f} MB disk free")
+    else:
+        cache = CACHE_NONE
+        reasons.append(f"cache=none: {cache_mb:.0f} MB cache fits neither RAM nor disk")
+
+    # Batch — AutoBatch on GPU, largest power of two that fits on CPU
+    if host["cuda"]:
+        batch = -1
+        reasons.append("batch=-1: CUDA available, Ultralytics AutoBatch sizes to GPU memory")
+    else:
+        free_mb = budget_mb - (cache_mb if cache == CACHE_RAM else 0.0)
+        fits    = int(free_mb // sample_mb)
+        limit   = max(1, min(fits, max_batch, dataset.get("train_images", dataset["images"])))
+        batch   = 1
+        while batch * 2 <= limit:                           # never above the estimate, even if that means 1
+            batch *= 2
+        reasons.append(f"batch={batch}: {free_mb:.0f} MB for ~{sample_mb:.0f} MB per sample at imgsz {image_size}")
+
+    # Workers — one core stays with the training loop
+    workers = max(0, min(host["cpus"] - 1, max_workers, batch if batch > 0 else max_workers))
+    reasons.append(f"workers={workers}: {host['cpus']} usable core(s)")
+
+    return {"batch": batch, "workers": workers, "cache": cache, "reasons": reasons}
+
+# ─────────────────────────────────────────────────────────────
+# Peak resident memory of this process and its reaped children
+# (dataloader workers) in MB — ru_maxrss is KiB on Linux
+# ─────────────────────────────────────────────────────────────
+def peak_memory_mb() -> float:
+    own      = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return (own + children) / 1024.0
+
+# Ultralytics `cache` argument for a cache mode
+def ultralytics_cache_arg(cache: str):
+    return {CACHE_RAM: "ram", CACHE_DISK: "disk"}.get(cache, False)
+
+def log_choice(choice: dict) -> None:
+    for reason in choice["reasons"]:
+        logger.info(f"Auto-tune {reason}")